@@ -1,14 +1,26 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, Menu
-from wikibot import generate_wikipedia_summary
+from wikibot import fetch_article, stream_summary, summary_input, set_article_cache, set_title_index
+from article_cache import ArticleCache
+from summarizer import warm_up, DEFAULT_PROFILE, GENERATION_PROFILES
+from cancellation import CancellationToken
+from speculation import SpeculativeSummarizer
+from title_index import TitleIndex
+import os
 import threading
 import queue
 import logging
 
 logging.basicConfig(filename="wikibot.log", level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 
+FETCH_DEADLINE = 30  # seconds before a fetch is abandoned
+SUMMARY_SIZES = (150, 300, 500)  # Small, Medium and Large
+# Title index for autocomplete and offline topic resolution (see title_index.py)
+TITLE_INDEX_PATH = os.environ.get("WIKIBOT_TITLE_INDEX", "titles.idx")
+SUGGEST_DELAY_MS = 150  # Wait for a pause in typing before looking up suggestions
+
 class WikipediaSummarizerGUI:
-    def __init__(self, root):
+    def __init__(self, root, title_index=None):
         self.root = root
         self.root.title("WikiBOT - Wikipedia Content Summarizer")
         self.root.geometry("1000x800")
@@ -17,6 +29,12 @@ class WikipediaSummarizerGUI:
         self.task_queue = queue.Queue()
         self.running = False
         self.current_content = None
+        self.summary_streaming = False
+        self.cancel_token = None
+        # Summarizes fetched articles in the background before a size is picked
+        self.speculator = SpeculativeSummarizer(max_summary_length=max(SUMMARY_SIZES))
+        self.title_index = title_index
+        self._suggest_job = None
         
         self.style = ttk.Style()
         self.style.configure('TButton', font=('Arial', 10), padding=5)
@@ -37,10 +55,32 @@ class WikipediaSummarizerGUI:
         ttk.Label(control_frame, text="Enter Topic:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
         self.topic_entry = ttk.Entry(control_frame, width=40)
         self.topic_entry.grid(row=0, column=1, sticky=tk.W, padx=5)
+        self.topic_entry.bind("<KeyRelease>", self._on_topic_key)
+        self.topic_entry.bind("<Down>", self._focus_suggestions)
+        self.topic_entry.bind("<Escape>", lambda _: self._hide_suggestions())
+
+        # Autocomplete dropdown, shown under the entry while there are suggestions
+        self.suggestion_list = tk.Listbox(self.root, height=8, font=('Arial', 10), activestyle=tk.DOTBOX)
+        self.suggestion_list.bind("<ButtonRelease-1>", self._choose_suggestion)
+        self.suggestion_list.bind("<Return>", self._choose_suggestion)
+        self.suggestion_list.bind("<Escape>", lambda _: self._hide_suggestions())
         
         ttk.Label(control_frame, text="Max Content Size:").grid(row=0, column=2, sticky=tk.W, padx=(10, 5))
         max_size_label = ttk.Label(control_frame, text="15,000 chars (fixed)", foreground="gray")
         max_size_label.grid(row=0, column=3, sticky=tk.W, padx=5)
+
+        # Decoding profile: Fast is greedy, Quality uses wider beams
+        ttk.Label(control_frame, text="Summary Quality:").grid(row=1, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.profile_var = tk.StringVar(value=DEFAULT_PROFILE.capitalize())
+        self.profile_box = ttk.Combobox(control_frame, textvariable=self.profile_var, state="readonly",
+                                        values=[name.capitalize() for name in GENERATION_PROFILES], width=12)
+        self.profile_box.grid(row=1, column=1, sticky=tk.W, padx=5, pady=(5, 0))
+        self.profile_box.bind("<<ComboboxSelected>>", lambda _: self._start_speculation())
+
+        self.speculate_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="Start summarizing after fetch", variable=self.speculate_var,
+                        command=self._start_speculation).grid(row=1, column=2, columnspan=2, sticky=tk.W,
+                                                              padx=(10, 5), pady=(5, 0))
         
         button_frame = ttk.Frame(control_frame)
         button_frame.grid(row=0, column=4, sticky=tk.E, padx=(10, 0))
@@ -127,14 +167,60 @@ class WikipediaSummarizerGUI:
             return
 
         menu = Menu(self.root, tearoff=0)
-        menu.add_command(label="Small (150 words)", command=lambda: self.start_summarize(150))
-        menu.add_command(label="Medium (300 words)", command=lambda: self.start_summarize(300))
-        menu.add_command(label="Large (500 words)", command=lambda: self.start_summarize(500))
+        small, medium, large = SUMMARY_SIZES
+        menu.add_command(label=f"Small ({small} words)", command=lambda: self.start_summarize(small))
+        menu.add_command(label=f"Medium ({medium} words)", command=lambda: self.start_summarize(medium))
+        menu.add_command(label=f"Large ({large} words)", command=lambda: self.start_summarize(large))
+        menu.add_separator()
+        menu.add_command(label="Quick: key sentences only (150 words)",
+                         command=lambda: self.start_summarize(150, mode="extractive"))
         menu.tk_popup(self.summarize_btn.winfo_rootx(), self.summarize_btn.winfo_rooty() + 30)
 
     
+    def _on_topic_key(self, event):
+        if event.keysym in ("Down", "Up", "Escape", "Return", "Tab"):
+            return
+        if self._suggest_job is not None:
+            self.root.after_cancel(self._suggest_job)
+        self._suggest_job = self.root.after(SUGGEST_DELAY_MS, self._show_suggestions)
+
+    def _show_suggestions(self):
+        self._suggest_job = None
+        text = self.topic_entry.get().strip()
+        if self.title_index is None or len(text) < 2:
+            return self._hide_suggestions()
+        suggestions = self.title_index.suggest(text)
+        if not suggestions:
+            return self._hide_suggestions()
+        self.suggestion_list.delete(0, tk.END)
+        for title in suggestions:
+            self.suggestion_list.insert(tk.END, title)
+        self.suggestion_list.config(height=len(suggestions))
+        self.suggestion_list.place(in_=self.topic_entry, x=0, rely=1.0, relwidth=1.0)
+        self.suggestion_list.lift()
+
+    def _hide_suggestions(self):
+        self.suggestion_list.place_forget()
+
+    def _focus_suggestions(self, event=None):
+        if self.suggestion_list.winfo_ismapped():
+            self.suggestion_list.focus_set()
+            self.suggestion_list.selection_clear(0, tk.END)
+            self.suggestion_list.selection_set(0)
+            self.suggestion_list.activate(0)
+
+    def _choose_suggestion(self, event=None):
+        selection = self.suggestion_list.curselection()
+        if selection:
+            self.topic_entry.delete(0, tk.END)
+            self.topic_entry.insert(0, self.suggestion_list.get(selection[0]))
+        self._hide_suggestions()
+        self.topic_entry.focus_set()
+        self.topic_entry.icursor(tk.END)
+
     def start_fetch(self):
         """Fetch Wikipedia content (fixed at 15,000 chars)."""
+        self._hide_suggestions()
         if self.running:
             messagebox.showwarning("Warning", "Operation already in progress")
             return
@@ -144,7 +230,9 @@ class WikipediaSummarizerGUI:
             messagebox.showerror("Error", "Please enter a topic")
             return
             
+        self.speculator.cancel()  # The previous article's chunks are no longer wanted
         self.running = True
+        self.cancel_token = CancellationToken(timeout=FETCH_DEADLINE)
         self.update_status("Fetching content... Please wait")
         self._set_ui_state(fetching=True)
         
@@ -159,34 +247,42 @@ class WikipediaSummarizerGUI:
         
         threading.Thread(
             target=self._fetch_content,
-            args=(topic, 15000),  # Fixed at 15,000 chars
+            args=(topic, 15000, self.cancel_token),  # Fixed at 15,000 chars
             daemon=True
         ).start()
     
-    def _fetch_content(self, topic: str, max_chars: int):
+    def _post(self, cancel_token, task_type, data):
+        """Queue a result unless its operation was cancelled or superseded."""
+        if cancel_token is self.cancel_token:
+            self.task_queue.put((task_type, data))
+    
+    def _fetch_content(self, topic: str, max_chars: int, cancel_token: CancellationToken):
         logging.debug(f"Fetching content for topic: {topic}, max_chars: {max_chars}")
         try:
-            result = generate_wikipedia_summary(topic, max_input_length=max_chars)
+            result = fetch_article(topic, cancel_token=cancel_token)
             if "error" in result:
-                self.task_queue.put(("error", result["error"]))
+                self._post(cancel_token, "error", result["error"])
             else:
-                self.task_queue.put(("content", {
+                self._post(cancel_token, "content", {
                     "original_content": result["original_content"],
-                    "content_for_summary": result["original_content"][:max_chars],
+                    # Substantive sections only, up to max_chars in total
+                    "content_for_summary": summary_input(result["article"], max_chars),
                     "word_count": result["word_count"]
-                }))
+                })
         except Exception as e:
-            self.task_queue.put(("error", f"Fetch error: {str(e)}"))
+            self._post(cancel_token, "error", f"Fetch error: {str(e)}")
         finally:
-            self.task_queue.put(("done", None))
+            self._post(cancel_token, "done", None)
     
-    def start_summarize(self, summary_length: int):
+    def start_summarize(self, summary_length: int, mode: str = "abstractive"):
         """Generate summary with selected length."""
         if not self.current_content or self.running:
             messagebox.showerror("Error", "No content to summarize or operation in progress")
             return
             
         self.running = True
+        self.summary_streaming = False
+        self.cancel_token = CancellationToken()
         self.update_status(f"Generating {summary_length}-word summary... Please wait")
         self._set_ui_state(summarizing=True)
         
@@ -195,27 +291,34 @@ class WikipediaSummarizerGUI:
         self.summary_text.insert(tk.END, f"Generating {summary_length}-word summary... Please wait...")
         self.summary_text.config(state=tk.DISABLED)
         
-        # Pass both max_content_size AND summary_length to wikibot
+        # Summarize the already-fetched content instead of fetching it again
         threading.Thread(
             target=self._generate_summary,
-            args=(self.topic_entry.get().strip(), 15000, summary_length),  # Fixed 15k chars, variable summary length
+            args=(self.current_content["content_for_summary"], 15000, summary_length,
+                  self.cancel_token, mode, self.profile_var.get().lower()),  # Fixed 15k chars, variable summary length
             daemon=True
         ).start()
 
-    def _generate_summary(self, topic: str, max_chars: int, summary_length: int):
-        logging.debug(f"Summarizing {max_chars} chars to {summary_length} words")
+    def _generate_summary(self, content: str, max_chars: int, summary_length: int,
+                          cancel_token: CancellationToken, mode: str = "abstractive",
+                          profile: str = DEFAULT_PROFILE):
+        logging.debug(f"Summarizing {max_chars} chars to {summary_length} words ({mode}, {profile})")
+        if mode != "extractive":
+            # Keep the chunk speculation is generating, then have the model to ourselves
+            self.speculator.finish_chunk()
         try:
-            result = generate_wikipedia_summary(topic, 
-                                            max_input_length=max_chars,
-                                            summary_length=summary_length)
-            if "error" in result:
-                self.task_queue.put(("error", result["error"]))
-            else:
-                self.task_queue.put(("summary", result["summary"]))
+            # Show chunk summaries as they are generated, then the final summary
+            for kind, text in stream_summary(content,
+                                             max_input_length=max_chars,
+                                             summary_length=summary_length,
+                                             cancel_token=cancel_token,
+                                             mode=mode,
+                                             profile=profile):
+                self._post(cancel_token, "summary_chunk" if kind == "chunk" else "summary", text)
         except Exception as e:
-            self.task_queue.put(("error", f"Summary error: {str(e)}"))
+            self._post(cancel_token, "error", f"Summary error: {str(e)}")
         finally:
-            self.task_queue.put(("done", None))
+            self._post(cancel_token, "done", None)
         
     def process_queue(self):
         try:
@@ -226,7 +329,12 @@ class WikipediaSummarizerGUI:
                     self._display_content(data["original_content"])
                     self.update_status(f"Fetched {data['word_count']} words. Ready to summarize.")
                     self.summarize_btn.config(state=tk.NORMAL)
+                    self._start_speculation(fetched=True)
+                elif task_type == "summary_chunk":
+                    self._append_summary(data)
+                    self.update_status("Generating summary... (showing partial results)")
                 elif task_type == "summary":
+                    self.summary_streaming = False
                     self._display_summary(data)
                     self.update_status("Summary complete")
                 elif task_type == "error":
@@ -239,6 +347,17 @@ class WikipediaSummarizerGUI:
             pass
         self.root.after(100, self.process_queue)
     
+    def _start_speculation(self, fetched=False):
+        """
+        Summarize the fetched article's chunks in the background, if enabled.
+        Not while a summary is being generated, unless a fetch just finished.
+        """
+        if not self.speculate_var.get():
+            self.speculator.cancel()
+        elif self.current_content and (fetched or not self.running):
+            self.speculator.start(self.current_content["content_for_summary"],
+                                  profile=self.profile_var.get().lower())
+
     def _display_content(self, content: str):
         self.content_text.config(state=tk.NORMAL)
         self.content_text.delete(1.0, tk.END)
@@ -253,6 +372,18 @@ class WikipediaSummarizerGUI:
         self.summary_text.config(state=tk.DISABLED)
         self.summary_text.see(tk.END)
     
+    def _append_summary(self, text: str):
+        self.summary_text.config(state=tk.NORMAL)
+        if not self.summary_streaming:
+            # Replace the "Please wait" placeholder with the first chunk
+            self.summary_text.delete(1.0, tk.END)
+            self.summary_streaming = True
+        else:
+            self.summary_text.insert(tk.END, " ")
+        self.summary_text.insert(tk.END, text)
+        self.summary_text.config(state=tk.DISABLED)
+        self.summary_text.see(tk.END)
+    
     def update_status(self, message, panel=True, bar=True):
         if panel:
             self.status_panel.config(text=f"Status: {message}")
@@ -275,8 +406,14 @@ class WikipediaSummarizerGUI:
         logging.debug("Clearing all GUI elements")
         if self.running:
             if messagebox.askyesno("Confirm", "Cancel current operation?"):
+                # The worker stops at its next check and its results are dropped
+                if self.cancel_token is not None:
+                    self.cancel_token.cancel()
+                self.cancel_token = None
                 self.running = False
                 self.task_queue.queue.clear()
+        self.speculator.cancel()
+        self._hide_suggestions()
         self.topic_entry.delete(0, tk.END)
         self.current_content = None
         self.content_text.config(state=tk.NORMAL)
@@ -290,5 +427,11 @@ class WikipediaSummarizerGUI:
 
 if __name__ == "__main__":
     root = tk.Tk()
-    app = WikipediaSummarizerGUI(root)
+    warm_up()  # Load the model in the background while the window opens
+    set_article_cache(ArticleCache())  # Reuse articles fetched in earlier sessions
+    title_index = None
+    if os.path.exists(TITLE_INDEX_PATH):
+        title_index = TitleIndex.open(TITLE_INDEX_PATH)  # Memory-mapped: opens instantly
+        set_title_index(title_index)
+    app = WikipediaSummarizerGUI(root, title_index=title_index)
     root.mainloop()
@@ -0,0 +1,199 @@
+import logging
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional
+
+
+class CachedArticle(NamedTuple):
+    title: str
+    content: str
+    revision_id: Optional[int]
+    fetched_at: float
+    sections: Optional[str] = None  # SectionedArticle.sections_json()
+
+
+def normalize_title(title: str) -> str:
+    """Cache key for a topic as typed by a user: collapsed whitespace, case-folded."""
+    return " ".join(title.replace("_", " ").split()).casefold()
+
+
+def title_key(title: str, language: Optional[str] = None) -> str:
+    """
+    Cache key for title: "<language>:<title>" for a canonical page title,
+    which is case-sensitive ("RAM" and "Ram" are different pages), or
+    normalize_title(title) without a language.
+    """
+    if language is None:
+        return normalize_title(title)
+    return f"{language}:{' '.join(title.replace('_', ' ').split())}"
+
+
+class ArticleCache:
+    """
+    Persistent SQLite cache of cleaned Wikipedia articles.
+
+    Entries are keyed by title_key() and store the cleaned text, its
+    section offsets, the page revision id and the fetch time. The canonical
+    titles that typed topics resolved to are kept too (see canonical_title),
+    so a cached article is found again without asking the API. Entries older than ttl seconds are
+    stale and are either revalidated against the live revision id or
+    refetched. The least recently used entries are evicted once the cache
+    holds more than max_entries articles or max_bytes characters of text.
+    """
+
+    def __init__(self, path: str = "wikibot_cache.sqlite3", ttl: float = 24 * 3600,
+                 max_entries: int = 5000, max_bytes: Optional[int] = None,
+                 check_revision: bool = True):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.check_revision = check_revision
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " key TEXT PRIMARY KEY,"
+            " title TEXT NOT NULL,"
+            " content TEXT NOT NULL,"
+            " revision_id INTEGER,"
+            " fetched_at REAL NOT NULL,"
+            " last_access REAL NOT NULL,"
+            " sections TEXT)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        if "sections" not in columns:  # Cache file written before sections were stored
+            self._conn.execute("ALTER TABLE articles ADD COLUMN sections TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS articles_lru ON articles (last_access)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS titles ("
+            " topic TEXT PRIMARY KEY,"
+            " title TEXT NOT NULL,"
+            " article_key TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS titles_article ON titles (article_key)")
+        self._conn.commit()
+
+    def get(self, title: str,
+            current_revision: Optional[Callable[[], Optional[int]]] = None,
+            language: Optional[str] = None) -> Optional[CachedArticle]:
+        """
+        Return the cached article for title, or None on a miss. With a
+        language, title is a canonical page title matched exactly;
+        otherwise it is matched like normalize_title.
+        When an entry is stale and check_revision is enabled, current_revision
+        is called to fetch the live revision id; if it still matches, the
+        entry is refreshed and returned instead of being downloaded again.
+        """
+        key = title_key(title, language)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, content, revision_id, fetched_at, sections FROM articles WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if row is None:
+            self._count("misses")
+            return None
+
+        article = CachedArticle(*row)
+        now = time.time()
+        if now - article.fetched_at > self.ttl:
+            if not (self.check_revision and current_revision and article.revision_id is not None):
+                self._count("misses")
+                return None
+            try:
+                revision_id = current_revision()
+            except Exception as e:
+                logging.warning(f"Revision check failed for {title}: {str(e)}")
+                revision_id = None
+            if revision_id != article.revision_id:
+                self._count("misses")
+                return None
+            article = article._replace(fetched_at=now)
+            self._count("revalidations")
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE articles SET fetched_at = ?, last_access = ? WHERE key = ?",
+                (article.fetched_at, now, key)
+            )
+            self._conn.commit()
+        self._count("hits")
+        return article
+
+    def put(self, title: str, content: str, revision_id: Optional[int] = None,
+            sections: Optional[str] = None, language: Optional[str] = None) -> None:
+        """Store a freshly fetched article and evict old entries if needed."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles "
+                "(key, title, content, revision_id, fetched_at, last_access, sections) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (title_key(title, language), title, content, revision_id, now, now, sections)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def canonical_title(self, topic: str, language: str) -> Optional[str]:
+        """The canonical title topic (exactly as typed, bar spacing) resolved to, if remembered."""
+        with self._lock:
+            row = self._conn.execute("SELECT title FROM titles WHERE topic = ?",
+                                     (title_key(topic, language),)).fetchone()
+        return row[0] if row is not None else None
+
+    def remember_title(self, topic: str, language: str, title: str) -> None:
+        """Record that topic names the cached article title; forgotten when it is evicted."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO titles (topic, title, article_key) VALUES (?, ?, ?)",
+                (title_key(topic, language), title, title_key(title, language))
+            )
+            self._conn.commit()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _evict(self) -> None:
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(content)), 0) FROM articles"
+        ).fetchone()
+        while count > self.max_entries or (self.max_bytes is not None and size > self.max_bytes and count > 1):
+            key, length = self._conn.execute(
+                "SELECT key, LENGTH(content) FROM articles ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            self._conn.execute("DELETE FROM articles WHERE key = ?", (key,))
+            self._conn.execute("DELETE FROM titles WHERE article_key = ?", (key,))
+            count -= 1
+            size -= length
+            self.evictions += 1
+            logging.debug(f"Evicted cached article: {key}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM articles")
+            self._conn.execute("DELETE FROM titles")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "revalidations": self.revalidations,
+            "entries": len(self),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,201 @@
+"""
+Batch summarization of many topics for offline/nightly jobs.
+
+    python batch.py topics.txt -o results.jsonl --concurrency 8 --length 300
+    cat topics.txt | python batch.py - -o results.jsonl
+
+Topics are resolved to page titles in bulk, then fetched concurrently by
+a thread pool that borrows keep-alive, rate-limited API clients from one
+shared wiki_pool.ClientPool. A single model worker summarizes whatever
+articles are ready, packing their chunks into shared generate() batches.
+Results are appended to the output file as JSON lines, so an interrupted
+run can be resumed by running the same command again.
+"""
+import argparse
+import json
+import logging
+import os
+import queue
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, IO, Iterable, List, Optional, Set
+
+from summarizer import (BACKENDS, DEFAULT_BATCH_SIZE, DEFAULT_PROFILE, GENERATION_PROFILES, set_backend,
+                        summarize_articles)
+from wiki_pool import DEFAULT_API_URL, ClientPool
+from wikibot import clean_text, fetch_wikipedia_sections, get_client_pool, summary_input
+
+
+def read_topics(source: IO[str]) -> List[str]:
+    """Read one topic per line, skipping blanks, comments and duplicates."""
+    topics = []
+    seen = set()
+    for line in source:
+        topic = line.strip()
+        if topic and not topic.startswith("#") and topic not in seen:
+            seen.add(topic)
+            topics.append(topic)
+    return topics
+
+
+def completed_topics(output_path: str) -> Set[str]:
+    """Topics that already have a successful summary in the output file."""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Partially written last line of an interrupted run
+            if "summary" in record:
+                done.add(record["topic"])
+    return done
+
+
+def _ends_with_newline(path: str) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def run_batch(topics: Iterable[str], output: IO[str], summary_length: int = 300,
+              max_input_length: int = 15000, concurrency: int = 8,
+              batch_size: int = DEFAULT_BATCH_SIZE, max_articles: int = 8,
+              client=None, profile: str = DEFAULT_PROFILE, pool: Optional[ClientPool] = None,
+              language: str = "en") -> Dict[str, float]:
+    """
+    Fetch and summarize topics, writing one JSON line per topic to output.
+    Without an explicit client, pages are fetched with keep-alive clients
+    from pool (the default client pool if None), and all topics are
+    resolved to page titles up front, many per API request.
+    Returns overall counts and throughput.
+    """
+    topics = list(topics)
+    if client is None:
+        pool = pool if pool is not None else get_client_pool()
+        try:
+            pool.resolve_titles(topics, language)  # Remembered for the fetches below
+        except Exception as e:
+            logging.warning(f"Bulk title resolution failed, resolving per topic: {str(e)}")
+
+    ready: "queue.Queue" = queue.Queue(maxsize=max(concurrency, max_articles) * 2)
+    start = time.perf_counter()
+
+    def fetch(topic: str) -> None:
+        fetch_start = time.perf_counter()
+        try:
+            content = fetch_wikipedia_sections(topic, client=client, language=language, pool=pool)
+        except Exception as e:
+            content = f"Error fetching content: {str(e)}"
+        ready.put((topic, content, fetch_start, time.perf_counter() - fetch_start))
+
+    def write(record: Dict) -> None:
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+
+    stats = {"topics": len(topics), "succeeded": 0, "failed": 0}
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="fetch") as executor:
+        for topic in topics:
+            executor.submit(fetch, topic)
+
+        remaining = len(topics)
+        while remaining:
+            # Block for one article, then take whatever else is already fetched
+            items = [ready.get()]
+            while len(items) < min(max_articles, remaining):
+                try:
+                    items.append(ready.get_nowait())
+                except queue.Empty:
+                    break
+            remaining -= len(items)
+
+            articles = []
+            for topic, content, fetch_start, fetch_seconds in items:
+                if isinstance(content, str) and content.startswith("Error"):
+                    stats["failed"] += 1
+                    write({"topic": topic, "error": content,
+                           "fetch_seconds": round(fetch_seconds, 3)})
+                else:
+                    articles.append((topic, content, fetch_start, fetch_seconds))
+            if not articles:
+                continue
+
+            summarize_start = time.perf_counter()
+            results = summarize_articles(
+                [summary_input(content, max_input_length) for _, content, _, _ in articles],
+                max_summary_length=summary_length,
+                batch_size=batch_size,
+                profile=profile
+            )
+            summarize_seconds = time.perf_counter() - summarize_start
+            for (topic, _, fetch_start, fetch_seconds), result in zip(articles, results):
+                record = {"topic": topic, "fetch_seconds": round(fetch_seconds, 3),
+                          "summarize_seconds": round(summarize_seconds, 3),
+                          "total_seconds": round(time.perf_counter() - fetch_start, 3),
+                          "articles_in_batch": len(articles)}
+                if isinstance(result, Exception):
+                    stats["failed"] += 1
+                    record["error"] = f"Error generating summary: {str(result)}"
+                else:
+                    stats["succeeded"] += 1
+                    record["summary"] = clean_text(result)
+                write(record)
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["topics_per_second"] = len(topics) / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Summarize a list of Wikipedia topics into JSON lines.")
+    parser.add_argument("topics", help="file with one topic per line, or - for stdin")
+    parser.add_argument("-o", "--output", required=True, help="JSONL output file (appended to)")
+    parser.add_argument("--length", type=int, default=300, help="summary length in words")
+    parser.add_argument("--max-input", type=int, default=15000, help="max content size for summarization (characters)")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent page fetches")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="chunks per generate() call")
+    parser.add_argument("--max-articles", type=int, default=8, help="articles summarized together")
+    parser.add_argument("--generation-profile", choices=sorted(GENERATION_PROFILES), default=DEFAULT_PROFILE,
+                        help="decoding settings: fast (greedy), balanced or quality (wider beams)")
+    parser.add_argument("--language", default="en", help="Wikipedia language edition")
+    parser.add_argument("--api-url", default=DEFAULT_API_URL,
+                        help="MediaWiki API endpoint; {language} is replaced by --language")
+    parser.add_argument("--rate", type=float, default=10.0, help="max API requests per second")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), help="inference backend (default: $WIKIBOT_BACKEND or torch)")
+    args = parser.parse_args(argv)
+    if args.backend:
+        set_backend(args.backend)
+
+    if args.topics == "-":
+        topics = read_topics(sys.stdin)
+    else:
+        with open(args.topics, encoding="utf-8") as f:
+            topics = read_topics(f)
+
+    done = completed_topics(args.output)
+    pending = [topic for topic in topics if topic not in done]
+    if done:
+        print(f"Resuming: {len(topics) - len(pending)} of {len(topics)} topics already done", file=sys.stderr)
+
+    with open(args.output, "a", encoding="utf-8") as output:
+        if output.tell() and not _ends_with_newline(args.output):
+            output.write("\n")  # Terminate a line cut short by an interrupted run
+        stats = run_batch(pending, output, summary_length=args.length,
+                          max_input_length=args.max_input, concurrency=args.concurrency,
+                          batch_size=args.batch_size, max_articles=args.max_articles,
+                          profile=args.generation_profile, language=args.language,
+                          pool=ClientPool(api_url=args.api_url, rate=args.rate,
+                                          clients_per_language=args.concurrency))
+
+    logging.info(f"Batch finished: {stats}")
+    print(f"{stats['topics']} topics in {stats['seconds']:.1f}s "
+          f"({stats['topics_per_second']:.2f} topics/sec): "
+          f"{stats['succeeded']} succeeded, {stats['failed']} failed", file=sys.stderr)
+    return 0 if stats["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+"""Offline benchmarks for WikiBot. Run from the repository root, e.g.
+``python -m benchmarks.bench_batching``."""
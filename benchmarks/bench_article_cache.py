@@ -0,0 +1,53 @@
+"""
+Replay a repetitive topic stream through fetch_wikipedia_content with and
+without the article cache, against a fake client with network latency.
+
+    python -m benchmarks.bench_article_cache [--requests 200] [--latency 0.05]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from article_cache import ArticleCache
+from benchmarks.fakes import FakeWikipedia
+from wikibot import fetch_wikipedia_content
+
+
+def replay(topics, client, cache):
+    start = time.perf_counter()
+    for topic in topics:
+        content = fetch_wikipedia_content(topic, client=client, cache=cache)
+        assert not content.startswith("Error"), content
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated seconds per API call")
+    parser.add_argument("--max-entries", type=int, default=16)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    titles = list(FakeWikipedia().articles)
+    topics = [rng.choice(titles) for _ in range(args.requests)]
+
+    client = FakeWikipedia(latency=args.latency)
+    uncached = replay(topics, client, cache=None)
+    print(f"no cache:   {uncached:7.2f}s  api calls={client.requests}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ArticleCache(os.path.join(tmp, "articles.sqlite3"), max_entries=args.max_entries)
+        client = FakeWikipedia(latency=args.latency)
+        cached = replay(topics, client, cache)
+        print(f"with cache: {cached:7.2f}s  api calls={client.requests}  {cache.stats()}")
+
+        # Expire everything: unchanged pages only cost a revision check
+        cache.ttl = 0
+        client.edit(titles[0], client.articles[titles[0]] + " Updated.")
+        client.requests = {"extracts": 0, "info": 0}
+        revalidated = replay(titles, client, cache)
+        print(f"revalidate: {revalidated:7.2f}s  api calls={client.requests}  {cache.stats()}")
+        cache.close()
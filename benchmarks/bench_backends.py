@@ -0,0 +1,74 @@
+"""
+Compare inference backends on the offline corpus: generated tokens/sec,
+peak RSS, and ROUGE agreement with the fp32 PyTorch backend (and with the
+source articles). Each backend runs in its own process so peak RSS is
+measured in isolation.
+
+    python -m benchmarks.bench_backends [--backends torch torch-int8 onnx]
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.corpus import build_article, PARAGRAPHS
+from benchmarks.rouge import mean_rouge
+
+
+def articles():
+    return [build_article(topic, 4000) for topic in sorted(PARAGRAPHS)]
+
+
+def run_backend(backend: str) -> dict:
+    import summarizer
+    summarizer.set_summary_cache(None)
+    summarizer.set_backend(backend)
+    tokenizer, _ = summarizer.get_model()
+
+    chunks = [chunk for text in articles() for chunk in summarizer.split_text(text, max_tokens=300)]
+    start = time.perf_counter()
+    summaries = summarizer.summarize_batch(chunks, max_length=100, min_length=50)
+    elapsed = time.perf_counter() - start
+    generated = sum(len(ids) for ids in tokenizer(summaries)["input_ids"])
+    return {
+        "backend": backend,
+        "seconds": elapsed,
+        "tokens_per_second": generated / elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "chunks": chunks,
+        "summaries": summaries,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backends", nargs="+", default=["torch", "torch-int8", "onnx"])
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_backend(args.worker)))
+        sys.exit(0)
+
+    results = {}
+    for backend in args.backends:
+        proc = subprocess.run([sys.executable, "-m", "benchmarks.bench_backends", "--worker", backend],
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"{backend:<11} failed: {proc.stderr.strip().splitlines()[-1]}")
+            continue
+        results[backend] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    reference = results.get("torch")
+    for backend, result in results.items():
+        line = (f"{backend:<11} {result['seconds']:7.2f}s  {result['tokens_per_second']:7.1f} tokens/s  "
+                f"peak RSS={result['peak_rss_mb']:7.0f}MB")
+        source = mean_rouge(result["summaries"], result["chunks"])
+        line += f"  ROUGE-L vs source={source['rougeL']:.3f}"
+        if reference is not None:
+            agreement = mean_rouge(result["summaries"], reference["summaries"])
+            line += (f"  vs torch: R1={agreement['rouge1']:.3f} "
+                     f"R2={agreement['rouge2']:.3f} RL={agreement['rougeL']:.3f}")
+        print(line)
@@ -0,0 +1,45 @@
+"""
+Compare chunk throughput and end-to-end latency of summarize_wikipedia
+for different generate() batch sizes on the offline corpus.
+
+    python -m benchmarks.bench_batching [--batch-sizes 1 4 8] [--length 300]
+"""
+import argparse
+import time
+
+from benchmarks.corpus import build_article
+import summarizer
+
+
+def run(batch_sizes, summary_length, article_chars):
+    summarizer.set_summary_cache(None)  # measure the model, not the cache
+    article = build_article("astronomy", article_chars)
+    for batch_size in batch_sizes:
+        chunks_done = 0
+        original = summarizer.summarize_batch
+
+        def counting_batch(texts, *args, **kwargs):
+            nonlocal chunks_done
+            chunks_done += len(texts)
+            return original(texts, *args, **kwargs)
+
+        summarizer.summarize_batch = counting_batch
+        try:
+            start = time.perf_counter()
+            summarizer.summarize_wikipedia(article, max_summary_length=summary_length,
+                                           batch_size=batch_size)
+            elapsed = time.perf_counter() - start
+        finally:
+            summarizer.summarize_batch = original
+
+        print(f"batch_size={batch_size:<3} chunks={chunks_done:<3} "
+              f"latency={elapsed:7.2f}s chunks/sec={chunks_done / elapsed:6.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--length", type=int, default=300, help="summary length in words")
+    parser.add_argument("--chars", type=int, default=15000, help="article size in characters")
+    args = parser.parse_args()
+    run(args.batch_sizes, args.length, args.chars)
@@ -0,0 +1,50 @@
+"""
+Start a long summarization, cancel it part-way, and measure how quickly
+the worker stops and how much CPU it burns after the cancel.
+
+    python -m benchmarks.bench_cancellation [--after 2.0] [--timeout 5.0]
+"""
+import argparse
+import threading
+import time
+
+from benchmarks.corpus import build_article
+from cancellation import CancellationToken, OperationCancelled
+import summarizer
+
+
+def run(token, article, outcome):
+    try:
+        summarizer.summarize_wikipedia(article, max_summary_length=500, cancel_token=token)
+        outcome.append("finished")
+    except OperationCancelled as e:
+        outcome.append(str(e))
+
+
+def trial(label, token, cancel_after, article):
+    outcome = []
+    worker = threading.Thread(target=run, args=(token, article, outcome))
+    worker.start()
+    time.sleep(cancel_after)
+    cpu_before = time.process_time()
+    cancelled_at = time.perf_counter()
+    if token.deadline is None:
+        token.cancel()
+    worker.join()
+    stop_latency = time.perf_counter() - cancelled_at
+    cpu_after = time.process_time() - cpu_before
+    print(f"{label:<9} outcome={outcome[0]!r:<24} stopped {stop_latency * 1000:7.1f}ms after cancel, "
+          f"CPU after cancel={cpu_after * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--after", type=float, default=2.0, help="seconds before cancelling")
+    parser.add_argument("--timeout", type=float, default=5.0, help="deadline for the timeout trial")
+    args = parser.parse_args()
+
+    summarizer.set_summary_cache(None)
+    summarizer.get_model()  # keep model loading out of the timings
+    article = build_article("astronomy", 40000)
+    trial("cancel", CancellationToken(), args.after, article)
+    trial("deadline", CancellationToken(timeout=args.timeout), args.timeout, article)
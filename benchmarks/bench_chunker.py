@@ -0,0 +1,57 @@
+"""
+Compare the per-sentence chunker (tokenize each sentence separately, then
+re-encode every chunk for generation), run with the original sentencepiece
+T5Tokenizer, with the single-pass split_text_ids. tests/test_chunker.py
+checks that both pick the same chunk boundaries.
+
+    python -m benchmarks.bench_chunker [--repeat 5] [--max-tokens 300]
+"""
+import argparse
+import time
+
+from nltk import sent_tokenize
+
+from benchmarks.corpus import build_article
+from summarizer import DEFAULT_MODEL, split_text_ids
+
+
+def per_sentence_chunks(text, max_tokens, tokenizer):
+    """The original split_text loop, followed by the encode() done in summarize()."""
+    chunks, current_chunk, current_length = [], [], 0
+    for sentence in sent_tokenize(text):
+        sentence_length = len(tokenizer.tokenize(sentence))
+        if current_length + sentence_length > max_tokens and current_chunk:
+            chunks.append(" ".join(current_chunk))
+            current_chunk, current_length = [], 0
+        current_chunk.append(sentence)
+        current_length += sentence_length
+    if current_chunk:
+        chunks.append(" ".join(current_chunk))
+    for chunk in chunks:
+        tokenizer.encode("summarize: " + chunk, max_length=512, truncation=True)
+    return chunks
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-tokens", type=int, default=300)
+    args = parser.parse_args()
+
+    from transformers import T5Tokenizer
+    tokenizer = T5Tokenizer.from_pretrained(DEFAULT_MODEL, legacy=False)  # What the original chunker used
+    for chars in (15000, 40000, 100000, 250000):
+        article = build_article("history", chars)
+        old_time, old_chunks = best_of(lambda: per_sentence_chunks(article, args.max_tokens, tokenizer), args.repeat)
+        new_time, new_chunks = best_of(lambda: split_text_ids(article, args.max_tokens), args.repeat)
+        print(f"{chars:>7} chars  chunks={len(old_chunks):<4} per-sentence={old_time * 1000:8.1f}ms "
+              f"single-pass={new_time * 1000:8.1f}ms  speedup={old_time / new_time:5.2f}x")
@@ -0,0 +1,63 @@
+"""
+Compare the throughput of the table-driven clean_text and the streaming
+TextCleaner with the original three-regex clean_text.
+
+    python -m benchmarks.bench_clean_text [--chars 100000 1000000]
+
+tests/test_clean_text.py checks that all three produce the same text.
+"""
+import argparse
+import re
+import time
+
+from benchmarks.corpus import build_article
+from wikibot import TextCleaner, clean_text
+
+
+def clean_text_regex(text):
+    """The original implementation of wikibot.clean_text."""
+    if not text:
+        return ""
+    text = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    text = re.sub(r'[^a-zA-Z0-9\s.,;:!?\'"()-]', '', text)
+    return text
+
+
+def throughput(fn, text, repeat):
+    best = min(timed(fn, text) for _ in range(repeat))
+    return len(text) / best / 1e6
+
+
+def timed(fn, text):
+    start = time.perf_counter()
+    fn(text)
+    return time.perf_counter() - start
+
+
+def stream(text, piece=4000):
+    cleaner = TextCleaner()
+    return "".join(cleaner.feed(text[i:i + piece]) for i in range(0, len(text), piece))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chars", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    noise = "\n\n== Section ==\n\t| } A J k  \xa0[1] café – “quoted” "
+    for chars in args.chars:
+        article = build_article("history", chars)
+        # Raw page text has newlines and markup leftovers, often non-ASCII characters
+        variants = {
+            "ascii": article.replace(". ", ".\n"),
+            "unicode": noise.join(article[i:i + 500] for i in range(0, len(article), 500)),
+        }
+        for name, text in variants.items():
+            assert clean_text(text) == clean_text_regex(text) == stream(text)
+            old = throughput(clean_text_regex, text, args.repeat)
+            new = throughput(clean_text, text, args.repeat)
+            streamed = throughput(stream, text, args.repeat)
+            print(f"{len(text):>8} chars {name:<8} regex={old:7.1f} MB/s  table={new:7.1f} MB/s "
+                  f"({new / old:4.1f}x)  streaming={streamed:7.1f} MB/s")
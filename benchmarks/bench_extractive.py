@@ -0,0 +1,50 @@
+"""
+Compare latency and ROUGE of extractive-only, hybrid (extractive pre-filter
+then T5) and full abstractive summarization on the offline corpus.
+
+    python -m benchmarks.bench_extractive [--lengths 150 300] [--method textrank]
+
+ROUGE is measured against the full abstractive summary, since the corpus
+has no reference summaries, and against the source article.
+"""
+import argparse
+import time
+
+from benchmarks.corpus import build_article, PARAGRAPHS
+from benchmarks.rouge import mean_rouge
+import summarizer
+
+
+def timed(fn, articles):
+    start = time.perf_counter()
+    summaries = [fn(article) for article in articles]
+    return (time.perf_counter() - start) / len(articles), summaries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[150, 300])
+    parser.add_argument("--chars", type=int, default=15000, help="article size (the GUI summarizes up to 15k)")
+    parser.add_argument("--method", choices=["textrank", "tfidf"], default="textrank")
+    args = parser.parse_args()
+
+    summarizer.set_summary_cache(None)
+    summarizer.get_model()  # keep model loading out of the timings
+    articles = [build_article(topic, args.chars) for topic in sorted(PARAGRAPHS)]
+    for length in args.lengths:
+        modes = {
+            "abstractive": lambda text: summarizer.summarize_wikipedia(text, max_summary_length=length),
+            "hybrid": lambda text: summarizer.summarize_hybrid(text, max_summary_length=length,
+                                                               method=args.method),
+            "extractive": lambda text: summarizer.summarize_extractive(text, max_summary_length=length,
+                                                                       method=args.method),
+        }
+        results = {name: timed(fn, articles) for name, fn in modes.items()}
+        reference = results["abstractive"][1]
+        print(f"{length} words, {len(articles)} articles of {args.chars} chars:")
+        for name, (seconds, summaries) in results.items():
+            vs_abstractive = mean_rouge(summaries, reference)
+            vs_source = mean_rouge(summaries, articles)
+            print(f"  {name:<12} {seconds * 1000:9.1f}ms/article  "
+                  f"ROUGE-L vs abstractive={vs_abstractive['rougeL']:.3f}  "
+                  f"ROUGE-1 vs source={vs_source['rouge1']:.3f}")
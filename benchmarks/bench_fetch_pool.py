@@ -0,0 +1,57 @@
+"""
+Connections, API requests and time to fetch a topic list through a fresh
+client per topic versus one shared ClientPool, against a local MediaWiki
+stand-in with simulated connection setup and request latency.
+
+    python -m benchmarks.bench_fetch_pool [--topics 40] [--connect-latency 0.05] [--latency 0.01]
+
+Topics are typed the way users type them (lower case, underscores, a
+redirect), so every fetch also has to resolve its title.
+"""
+import argparse
+import random
+import time
+
+from benchmarks.fakes import FakeMediaWikiServer
+from wiki_pool import ClientPool
+from wikibot import fetch_wikipedia_sections
+
+REDIRECT = "Stellar Evolution"
+
+
+def typed_topics(titles, count, seed=0):
+    rng = random.Random(seed)
+    variants = [lambda t: t, str.lower, lambda t: t.replace(" ", "_"), lambda t: REDIRECT]
+    return [rng.choice(variants)(rng.choice(titles)) for _ in range(count)]
+
+
+def run(server, topics, shared, bulk, rate):
+    server.reset_counts()
+    pool = ClientPool(api_url=server.api_url, rate=rate) if shared else None
+    start = time.perf_counter()
+    if bulk:
+        pool.resolve_titles(topics)
+    for topic in topics:
+        # A pool of its own per topic stands in for a fresh client per call
+        article = fetch_wikipedia_sections(topic, cache=None, pool=pool or ClientPool(api_url=server.api_url, rate=rate))
+        assert not isinstance(article, str), article
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--topics", type=int, default=40)
+    parser.add_argument("--connect-latency", type=float, default=0.05, help="simulated TCP/TLS setup per connection")
+    parser.add_argument("--latency", type=float, default=0.01, help="simulated seconds per API request")
+    parser.add_argument("--rate", type=float, default=0, help="requests per second (0: unlimited)")
+    args = parser.parse_args()
+
+    with FakeMediaWikiServer(latency=args.latency, connect_latency=args.connect_latency) as server:
+        titles = sorted(server.articles)
+        server.redirects[REDIRECT] = titles[0]
+        topics = typed_topics(titles, args.topics)
+        for label, shared, bulk in (("fresh client per topic", False, False),
+                                    ("shared pool", True, False),
+                                    ("shared pool, bulk titles", True, True)):
+            seconds = run(server, topics, shared, bulk, args.rate or None)
+            print(f"{label:<25} {seconds:6.2f}s  connections={server.connections:<4} requests={server.requests}")
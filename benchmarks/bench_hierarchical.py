@@ -0,0 +1,64 @@
+"""
+Latency/coverage tradeoff of flat (truncated) versus hierarchical (map-reduce)
+summarization on long mixed-topic offline articles.
+
+    python -m benchmarks.bench_hierarchical [--length 300] [--top-k 8]
+
+Coverage is the share of the article that reaches the model, and how many of
+the article's topics are still mentioned in the summary.
+"""
+import argparse
+import time
+
+from benchmarks.corpus import build_article
+import summarizer
+
+# One word per corpus topic that any faithful summary of it should mention
+TOPIC_KEYWORDS = {"astronomy": "star", "history": "printing",
+                  "biology": "photosynthesis", "computing": "compiler"}
+
+
+def mixed_article(chars_per_topic):
+    """Topics one after another, like the sections of a long page."""
+    return " ".join(build_article(topic, chars_per_topic) for topic in TOPIC_KEYWORDS)
+
+
+def topics_covered(summary):
+    words = summary.lower()
+    return sum(keyword in words for keyword in TOPIC_KEYWORDS.values())
+
+
+def kept_chars(article, limit):
+    """Characters of the article left after salience pruning to limit chunks."""
+    chunks = summarizer.split_text_ids(article, max_tokens=300)
+    return sum(len(chunk) for chunk, _ in summarizer._keep_salient(chunks, limit))
+
+
+def run(name, fn, article, input_chars):
+    start = time.perf_counter()
+    summary = fn()
+    seconds = time.perf_counter() - start
+    print(f"  {name:<22} {seconds:7.2f}s  input={input_chars / len(article):6.1%}  "
+          f"topics={topics_covered(summary)}/{len(TOPIC_KEYWORDS)}  words={len(summary.split())}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--length", type=int, default=300)
+    parser.add_argument("--max-input", type=int, default=15000, help="truncation used by the flat mode")
+    parser.add_argument("--top-k", type=int, default=8, help="salient chunks kept by the pruned mode")
+    args = parser.parse_args()
+
+    summarizer.set_summary_cache(None)
+    summarizer.get_model()  # keep model loading out of the timings
+    for chars_per_topic in (10000, 25000, 60000):
+        article = mixed_article(chars_per_topic)
+        print(f"{len(article)} chars:")
+        truncated = article[:args.max_input]
+        run("flat (truncated)", lambda: summarizer.summarize_wikipedia(
+            truncated, max_summary_length=args.length), article, len(truncated))
+        run("hierarchical", lambda: summarizer.summarize_hierarchical(
+            article, max_summary_length=args.length), article, len(article))
+        run(f"hierarchical top-{args.top_k}", lambda: summarizer.summarize_hierarchical(
+            article, max_summary_length=args.length, top_k=args.top_k),
+            article, kept_chars(article, args.top_k))
@@ -0,0 +1,57 @@
+"""
+Latency/quality tradeoff of the generation profiles at the summary lengths
+the GUI offers, on the offline corpus.
+
+    python -m benchmarks.bench_profiles [--profiles fast balanced quality] [--lengths 150 300 500]
+
+Quality is ROUGE agreement with the "quality" profile's summary of the same
+article at the same length (so quality itself scores 1.0), plus ROUGE-L
+against the source article.
+"""
+import argparse
+import time
+
+from benchmarks.corpus import build_article, PARAGRAPHS
+from benchmarks.rouge import mean_rouge
+import summarizer
+
+SUMMARY_LENGTHS = (150, 300, 500)  # Small, Medium and Large in the GUI
+
+
+def articles(chars):
+    return [build_article(topic, chars) for topic in sorted(PARAGRAPHS)]
+
+
+def run_profile(texts, length, profile):
+    start = time.perf_counter()
+    summaries = [summarizer.summarize_wikipedia(text, max_summary_length=length, profile=profile)
+                 for text in texts]
+    return time.perf_counter() - start, summaries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", nargs="+", default=list(summarizer.GENERATION_PROFILES),
+                        choices=sorted(summarizer.GENERATION_PROFILES))
+    parser.add_argument("--lengths", type=int, nargs="+", default=list(SUMMARY_LENGTHS))
+    parser.add_argument("--chars", type=int, default=15000, help="article size (the GUI's max input)")
+    args = parser.parse_args()
+
+    summarizer.set_summary_cache(None)  # every profile must do the full work
+    summarizer.get_model()  # keep model loading out of the timings
+    texts = articles(args.chars)
+
+    for length in args.lengths:
+        results = {profile: run_profile(texts, length, profile) for profile in args.profiles}
+        reference = results.get("quality")
+        print(f"{length} words ({len(texts)} articles):")
+        for profile, (seconds, summaries) in results.items():
+            words = sum(len(summary.split()) for summary in summaries) / len(summaries)
+            source = mean_rouge(summaries, texts)
+            line = (f"  {profile:<9} {seconds:7.2f}s  {seconds / len(texts):6.2f}s/article  "
+                    f"{words:6.1f} words  ROUGE-L vs source={source['rougeL']:.3f}")
+            if reference is not None:
+                agreement = mean_rouge(summaries, reference[1])
+                line += (f"  vs quality: R1={agreement['rouge1']:.3f} "
+                         f"R2={agreement['rouge2']:.3f} RL={agreement['rougeL']:.3f}")
+            print(line)
@@ -0,0 +1,44 @@
+"""
+Measure the cost of the profiling hooks per call, disabled and enabled.
+
+    python -m benchmarks.bench_profiling [--calls 1000000]
+"""
+import argparse
+import time
+
+import profiling
+
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def with_span():
+    with profiling.span("stage"):
+        pass
+
+
+def with_count():
+    profiling.count("tokens", 10)
+
+
+def bare():
+    pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1000000)
+    args = parser.parse_args()
+
+    baseline = per_call(bare, args.calls)
+    profiling.disable()
+    print(f"disabled: span={per_call(with_span, args.calls) - baseline:6.0f}ns  "
+          f"count={per_call(with_count, args.calls) - baseline:6.0f}ns per call")
+    profiling.enable()  # no sinks: measures the in-process bookkeeping only
+    print(f"enabled:  span={per_call(with_span, args.calls) - baseline:6.0f}ns  "
+          f"count={per_call(with_count, args.calls) - baseline:6.0f}ns per call")
+    profiling.disable()
@@ -0,0 +1,63 @@
+"""
+Compare flat fetching (page text truncated to the input budget) with
+section-aware fetching (boilerplate sections skipped, chunks kept inside
+sections) on offline pages with References/See also/External links.
+
+    python -m benchmarks.bench_sections [--lengths 150 500] [--latency 0.05]
+
+Reports characters and tokens prepared for the model, tokens actually fed
+to generate(), how many model inputs contained citation boilerplate, and
+end-to-end latency (fetch + summarize).
+"""
+import argparse
+import time
+
+from benchmarks.corpus import build_sectioned_article, PARAGRAPHS
+from benchmarks.fakes import FakeWikipedia
+import summarizer
+from wikibot import fetch_wikipedia_content, fetch_wikipedia_sections, summary_input
+
+fed = {"tokens": 0, "boilerplate_chunks": 0}
+_generate_batch = summarizer._generate_batch
+
+
+def counting_generate_batch(texts, max_length, min_length, model_name, input_ids=None, *args, **kwargs):
+    fed["tokens"] += sum(len(ids) for ids in input_ids) if input_ids else 0
+    fed["boilerplate_chunks"] += sum("doi:" in text or "ISBN" in text for text in texts)
+    return _generate_batch(texts, max_length, min_length, model_name, input_ids, *args, **kwargs)
+
+
+def run(fetch, client, titles, length, max_input):
+    fed.update(tokens=0, boilerplate_chunks=0)
+    chars = tokens = 0
+    start = time.perf_counter()
+    for title in titles:
+        content = summary_input(fetch(title, client=client), max_input)
+        chars += len(content) if isinstance(content, str) else sum(map(len, content))
+        chunk_size = summarizer._tier_settings(length)[0]
+        tokens += sum(len(ids) for _, ids in summarizer._split_article(content, chunk_size,
+                                                                       summarizer.DEFAULT_MODEL, None))
+        summarizer.summarize_wikipedia(content, max_summary_length=length)
+    seconds = (time.perf_counter() - start) / len(titles)
+    return chars / len(titles), tokens / len(titles), fed["tokens"] / len(titles), fed["boilerplate_chunks"], seconds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[150, 500])
+    parser.add_argument("--chars", type=int, default=12000, help="prose characters per page")
+    parser.add_argument("--max-input", type=int, default=15000, help="input budget, as in the GUI")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated seconds per API call")
+    args = parser.parse_args()
+
+    summarizer.set_summary_cache(None)
+    summarizer.get_model()  # keep model loading out of the timings
+    summarizer._generate_batch = counting_generate_batch
+    pages = {topic.title(): build_sectioned_article(topic, args.chars) for topic in sorted(PARAGRAPHS)}
+    client = FakeWikipedia(pages, latency=args.latency)
+    for length in args.lengths:
+        print(f"{length} words, {len(pages)} pages of {args.chars} prose chars + boilerplate:")
+        for name, fetch in (("flat", fetch_wikipedia_content), ("sections", fetch_wikipedia_sections)):
+            chars, tokens, fed_tokens, boilerplate, seconds = run(fetch, client, list(pages), length, args.max_input)
+            print(f"  {name:<9} input={chars:8.0f} chars  tokenized={tokens:6.0f}  fed to model={fed_tokens:6.0f} tokens  "
+                  f"boilerplate chunks={boilerplate:<3} {seconds:6.2f}s/page")
@@ -0,0 +1,60 @@
+"""
+Click-to-summary latency in the GUI flow with and without speculative
+summarization: fetch an article, wait while the "user" picks a size, then
+summarize at that size.
+
+    python -m benchmarks.bench_speculation [--think 2 5] [--lengths 150 300 500]
+
+The think time is how long the user takes between the end of the fetch and
+clicking a size; speculation runs during it.
+"""
+import argparse
+import time
+
+from benchmarks.fakes import FakeWikipedia
+from speculation import SpeculativeSummarizer
+from summary_cache import SummaryCache
+import summarizer
+import wikibot
+
+SUMMARY_LENGTHS = (150, 300, 500)  # Small, Medium and Large in the GUI
+MAX_INPUT = 15000
+
+
+def click_to_summary(content, length, think, speculate):
+    """Seconds from the size click to the final summary, and chunks done speculatively."""
+    summarizer.set_summary_cache(SummaryCache())  # nothing left over from earlier runs
+    speculator = SpeculativeSummarizer(max_summary_length=max(SUMMARY_LENGTHS))
+    if speculate:
+        speculator.start(content)
+    time.sleep(think)
+
+    start = time.perf_counter()
+    speculator.finish_chunk()  # What the GUI's summary worker does first
+    for _ in wikibot.stream_summary(content, max_input_length=MAX_INPUT, summary_length=length):
+        pass
+    return time.perf_counter() - start, speculator.chunks_done
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--think", type=float, nargs="+", default=[2.0, 5.0], help="seconds before the click")
+    parser.add_argument("--lengths", type=int, nargs="+", default=list(SUMMARY_LENGTHS))
+    parser.add_argument("--articles", type=int, default=3)
+    args = parser.parse_args()
+
+    client = FakeWikipedia()
+    titles = sorted(client.articles)[:args.articles]
+    contents = [wikibot.summary_input(wikibot.fetch_wikipedia_sections(title, client=client), MAX_INPUT)
+                for title in titles]
+    summarizer.get_model()  # keep model loading out of the timings
+
+    for think in args.think:
+        for length in args.lengths:
+            baseline = [click_to_summary(content, length, think, False)[0] for content in contents]
+            speculative = [click_to_summary(content, length, think, True) for content in contents]
+            before = sum(baseline) / len(baseline)
+            after = sum(seconds for seconds, _ in speculative) / len(speculative)
+            chunks = sum(done for _, done in speculative) / len(speculative)
+            print(f"think={think:4.1f}s {length:>4} words: click-to-summary {before:6.2f}s -> {after:6.2f}s "
+                  f"({after / before - 1 if before else 0.0:+6.1%}), {chunks:4.1f} chunks ready at the click")
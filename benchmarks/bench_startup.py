@@ -0,0 +1,34 @@
+"""
+Measure how long `import wikibot` takes in a fresh interpreter, and how
+long it takes when the model is loaded eagerly as it used to be at import.
+
+    python -m benchmarks.bench_startup [--runs 5]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+LAZY = "import wikibot"
+EAGER = "import wikibot, summarizer; summarizer.get_model()"
+
+
+def time_snippet(snippet: str, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", snippet], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, snippet in (("lazy import (now)", LAZY), ("eager model load (before)", EAGER)):
+        timings = time_snippet(snippet, args.runs)
+        print(f"{label:<28} median={statistics.median(timings):6.2f}s "
+              f"min={min(timings):6.2f}s max={max(timings):6.2f}s")
@@ -0,0 +1,60 @@
+"""
+Measure time-to-first-text of the streaming summarizer against the time
+for the full summary, per batch size, and optionally with a token streamer.
+
+    python -m benchmarks.bench_streaming [--batch-sizes 1 4] [--tokens]
+"""
+import argparse
+import threading
+import time
+
+from benchmarks.corpus import build_article
+import summarizer
+
+
+def measure(article, length, batch_size, streamer=None):
+    start = time.perf_counter()
+    first = None
+    stream = summarizer.iter_summarize_wikipedia(article, max_summary_length=length,
+                                                 batch_size=batch_size, streamer=streamer)
+    for _ in stream:
+        if first is None:
+            first = time.perf_counter() - start
+    return first, time.perf_counter() - start
+
+
+def measure_tokens(article, length):
+    from transformers import TextIteratorStreamer
+    streamer = TextIteratorStreamer(summarizer.get_tokenizer(), skip_prompt=True, skip_special_tokens=True)
+    first_token = []
+    start = time.perf_counter()
+
+    def consume():
+        for text in streamer:
+            if text and not first_token:
+                first_token.append(time.perf_counter() - start)
+
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    _, total = measure(article, length, 1, streamer=streamer)
+    streamer.end()
+    consumer.join(timeout=5)
+    return (first_token or [total])[0], total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--length", type=int, default=300)
+    parser.add_argument("--tokens", action="store_true", help="also measure a token-level streamer (greedy)")
+    args = parser.parse_args()
+
+    summarizer.set_summary_cache(None)
+    article = build_article("computing", 15000)
+    summarizer.get_model()  # keep model loading out of the timings
+    for batch_size in args.batch_sizes:
+        first, total = measure(article, args.length, batch_size)
+        print(f"chunks, batch_size={batch_size:<3} time-to-first-text={first:6.2f}s  full summary={total:6.2f}s")
+    if args.tokens:
+        first, total = measure_tokens(article, args.length)
+        print(f"tokens (greedy)         time-to-first-text={first:6.2f}s  full summary={total:6.2f}s")
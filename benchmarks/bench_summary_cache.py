@@ -0,0 +1,53 @@
+"""
+Show what the summary cache saves: a cold summary, the same request again,
+another summary length of the same article, and an article in which only
+one paragraph was edited.
+
+    python -m benchmarks.bench_summary_cache [--length 300]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.corpus import build_article
+from summary_cache import SummaryCache
+import summarizer
+
+
+def timed(label, text, length, cache, calls):
+    calls.clear()
+    start = time.perf_counter()
+    summarizer.summarize_wikipedia(text, max_summary_length=length)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:7.2f}s  chunks sent to model={sum(calls):<3} {cache.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--length", type=int, default=300, help="summary length in words")
+    args = parser.parse_args()
+
+    calls = []
+    original = summarizer._generate_batch
+
+    def counting_generate(texts, *rest):
+        calls.append(len(texts))
+        return original(texts, *rest)
+
+    summarizer._generate_batch = counting_generate
+    article = build_article("biology", 15000)
+    first_paragraph = article.split(". ")[0]
+    edited = article.replace(first_paragraph, first_paragraph + " in nature", 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SummaryCache(path=os.path.join(tmp, "summaries.sqlite3"))
+        summarizer.set_summary_cache(cache)
+        timed("cold", article, args.length, cache, calls)
+        timed("same request", article, args.length, cache, calls)
+        timed("other length", article, args.length + 200, cache, calls)
+        timed("one paragraph edited", edited, args.length, cache, calls)
+
+        # A fresh process only has the disk tier
+        summarizer.set_summary_cache(SummaryCache(path=cache.path))
+        timed("restart (disk tier)", article, args.length, summarizer._summary_cache, calls)
@@ -0,0 +1,117 @@
+"""
+Build time, size and lookup latency of the local title index on a
+synthetic multi-million title dump.
+
+    python -m benchmarks.bench_title_index [--titles 2000000] [--queries 2000]
+
+Queries are indexed titles typed in lower case (exact), their first few
+characters (prefix, suggest) and with one typo (fuzzy, did_you_mean).
+Typo accuracy is the share of typo queries whose first "did you mean"
+suggestion is the original title.
+"""
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+
+from benchmarks.corpus import PARAGRAPHS
+from benchmarks.suite import describe
+import profiling
+from title_index import TitleIndex, read_titles
+
+QUALIFIERS = ["(film)", "(album)", "(band)", "(novel)", "(song)", "(river)", "(disambiguation)"]
+
+
+def synthetic_titles(count, seed=0):
+    """Dump-style titles (underscores) from corpus words and invented names."""
+    rng = random.Random(seed)
+    words = sorted({word.strip(".,;'()").capitalize() for paragraphs in PARAGRAPHS.values()
+                    for paragraph in paragraphs for word in paragraph.split() if word.isalpha()})
+    syllables = ["ka", "lo", "mi", "ren", "tor", "va", "sel", "dun", "bri", "ost", "pha", "quin", "zer", "gal"]
+    names = ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).capitalize() for _ in range(20000)]
+    titles = set()
+    while len(titles) < count:
+        kind = rng.random()
+        if kind < 0.05:
+            title = "".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(2, 4)))
+        elif kind < 0.1:
+            title = f"{rng.randint(1800, 2024)} in {rng.choice(words).lower()}"
+        else:
+            parts = [rng.choice(names if rng.random() < 0.6 else words) for _ in range(rng.randint(1, 4))]
+            title = " ".join(parts)
+            if rng.random() < 0.1:
+                title = title[0].lower() + title[1:]  # like iPhone or eBay
+            if rng.random() < 0.15:
+                title += " " + rng.choice(QUALIFIERS)
+        titles.add(title.replace(" ", "_"))
+    return sorted(titles)
+
+
+def typo(text, rng):
+    position = rng.randrange(len(text))
+    letter = rng.choice(string.ascii_lowercase)
+    edit = rng.randrange(3)
+    if edit == 0:
+        return text[:position] + letter + text[position + 1:]  # Substitution
+    if edit == 1:
+        return text[:position] + letter + text[position:]  # Insertion
+    return text[:position] + text[position + 1:] if len(text) > 1 else text  # Deletion
+
+
+def timed(function, queries):
+    latencies, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(function(query))
+        latencies.append(time.perf_counter() - start)
+    return describe(latencies), results
+
+
+def show(label, stats):
+    print(f"{label:<10} p50={stats['p50'] * 1e6:9.1f}us  p90={stats['p90'] * 1e6:9.1f}us  "
+          f"p99={stats['p99'] * 1e6:9.1f}us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--titles", type=int, default=2_000_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    titles = synthetic_titles(args.titles)
+    print(f"generated {len(titles)} titles in {time.perf_counter() - start:.1f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dump, path = os.path.join(tmp, "titles.txt"), os.path.join(tmp, "titles.idx")
+        with open(dump, "w", encoding="utf-8") as f:
+            f.write("page_title\n" + "\n".join(titles) + "\n")
+
+        start = time.perf_counter()
+        TitleIndex.build(read_titles(dump)).save(path)
+        print(f"build    {time.perf_counter() - start:7.1f}s  index {os.path.getsize(path) / 2 ** 20:.0f}MB "
+              f"(dump {os.path.getsize(dump) / 2 ** 20:.0f}MB)  peak RSS {profiling.peak_rss_bytes() / 2 ** 20:.0f}MB")
+
+        start = time.perf_counter()
+        index = TitleIndex.open(path)
+        print(f"open     {(time.perf_counter() - start) * 1e3:7.2f}ms")
+
+        rng = random.Random(1)
+        sample = [title.replace("_", " ") for title in rng.sample(titles, args.queries)]
+        stats, _ = timed(index.exact, [title.lower() for title in sample])
+        show("exact", stats)
+        stats, _ = timed(index.prefix, [title[:rng.randint(3, 6)] for title in sample])
+        show("prefix", stats)
+        stats, _ = timed(index.suggest, [title[:rng.randint(3, 6)] for title in sample])
+        show("suggest", stats)
+        typos = [typo(title, rng) for title in sample]
+        stats, _ = timed(index.fuzzy, typos)
+        show("fuzzy", stats)
+        stats, suggested = timed(index.did_you_mean, typos)
+        show("didyoumean", stats)
+        correct = sum(bool(result) and result[0].casefold() == title.casefold()
+                      for result, title in zip(suggested, sample))
+        print(f"typo accuracy {correct / len(sample):.1%} ({correct}/{len(sample)})")
+        del index
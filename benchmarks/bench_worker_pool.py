@@ -0,0 +1,53 @@
+"""
+Scaling benchmark for the multi-process worker pool: chunk throughput for
+1..N workers and resident/proportional memory per worker.
+
+    python -m benchmarks.bench_worker_pool [--workers 1 2 4] [--no-share]
+"""
+import argparse
+import os
+import time
+
+from benchmarks.corpus import load_corpus
+import summarizer
+from worker_pool import SummarizerPool
+
+
+def memory_mb(pid):
+    """(RSS, PSS) of a process in MB; PSS splits shared pages between sharers."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            if name in ("Rss", "Pss"):
+                values[name] = int(rest.split()[0]) / 1024
+    return values.get("Rss", 0.0), values.get("Pss", 0.0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[n for n in (1, 2, 4, 8, 16) if n <= (os.cpu_count() or 1)])
+    parser.add_argument("--per-worker-batch", type=int, default=2, help="chunks per worker per round")
+    parser.add_argument("--no-share", action="store_true", help="load a model copy in every worker")
+    args = parser.parse_args()
+
+    summarizer.set_summary_cache(None)
+    corpus = load_corpus()
+    articles = [corpus[name] for name in sorted(corpus) if name.endswith("-long")]
+    chunks = sum(len(summarizer.split_text(text, max_tokens=300)) for text in articles)
+
+    for workers in args.workers:
+        with SummarizerPool(workers=workers, share_weights=not args.no_share) as pool:
+            summarizer.set_worker_pool(pool)
+            start = time.perf_counter()
+            # Large target so every chunk is summarized
+            summarizer.summarize_articles(articles, max_summary_length=1500,
+                                          batch_size=workers * args.per_worker_batch)
+            elapsed = time.perf_counter() - start
+            usage = [memory_mb(pid) for pid in pool.pids()]
+            summarizer.set_worker_pool(None)
+        rss = sum(r for r, _ in usage) / len(usage)
+        pss = sum(p for _, p in usage) / len(usage)
+        print(f"workers={workers:<3} threads/worker={pool.threads_per_worker:<3} "
+              f"{chunks / elapsed:6.2f} chunks/sec  per worker: RSS={rss:7.0f}MB PSS={pss:7.0f}MB")
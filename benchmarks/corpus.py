@@ -0,0 +1,145 @@
+"""
+Fixed, offline article corpus used by the benchmarks.
+
+The articles are built deterministically from a small pool of
+encyclopedic paragraphs so every run summarizes exactly the same text,
+without touching the network.
+"""
+import random
+from typing import Dict, List, Tuple
+
+PARAGRAPHS: Dict[str, List[str]] = {
+    "astronomy": [
+        "A star is a luminous spheroid of plasma held together by its own gravity. "
+        "The nearest star to Earth is the Sun, which provides most of the energy on the planet. "
+        "Many other stars are visible to the naked eye at night, appearing as fixed points of light.",
+        "For most of its active life, a star shines because of thermonuclear fusion of hydrogen into helium in its core. "
+        "This process releases energy that traverses the interior of the star and radiates into outer space. "
+        "Almost all naturally occurring elements heavier than helium are created by stellar nucleosynthesis.",
+        "Astronomers determine the mass, age, metallicity and many other properties of a star by observing its motion through space, "
+        "its luminosity and its spectrum. The total mass of a star is the main factor that determines its evolution and eventual fate.",
+        "A star begins as a collapsing cloud of material composed primarily of hydrogen, along with helium and trace amounts of heavier elements. "
+        "Once the stellar core is sufficiently dense, hydrogen becomes steadily converted into helium through nuclear fusion.",
+        "Near the end of its life, a star can also contain degenerate matter. "
+        "Stars with less than about eight solar masses shed their outer layers and leave behind a white dwarf. "
+        "More massive stars end their lives in a supernova explosion that can leave a neutron star or a black hole.",
+        "Binary and multi-star systems consist of two or more stars that are gravitationally bound and generally move around each other in stable orbits. "
+        "When two such stars have a relatively close orbit, their gravitational interaction can have a significant impact on their evolution.",
+    ],
+    "history": [
+        "The printing press is a mechanical device for applying pressure to an inked surface resting upon a print medium. "
+        "It was a significant invention that allowed the rapid spread of written material across Europe in the fifteenth century.",
+        "Before its introduction, books were copied by hand in monasteries and workshops, a slow and expensive process. "
+        "As a result, literacy was largely limited to the clergy and to a small number of wealthy families.",
+        "The new technique used movable metal type, oil-based inks and a wooden press adapted from those used to make wine. "
+        "A single workshop could produce thousands of pages a day, far more than any team of scribes.",
+        "Within a few decades, printing workshops had been established in more than two hundred cities. "
+        "Pamphlets, calendars and religious texts circulated widely, and prices of books fell sharply.",
+        "Historians argue that the press contributed to the Renaissance, the Reformation and the Scientific Revolution. "
+        "Scholars could compare identical copies of texts, correct errors and build on each other's work more quickly.",
+        "The spread of printed material also encouraged the standardization of spelling and grammar in many European languages. "
+        "Governments soon introduced licensing systems in an attempt to control what could be published.",
+    ],
+    "biology": [
+        "Photosynthesis is a process used by plants and other organisms to convert light energy into chemical energy. "
+        "The chemical energy is stored in carbohydrate molecules, such as sugars, which are synthesized from carbon dioxide and water.",
+        "Most plants, algae and cyanobacteria perform photosynthesis, and such organisms are called photoautotrophs. "
+        "Photosynthesis is largely responsible for producing and maintaining the oxygen content of the atmosphere.",
+        "In plants, the process takes place mainly in the leaves, inside organelles called chloroplasts. "
+        "Chloroplasts contain the pigment chlorophyll, which absorbs blue and red light and reflects green light.",
+        "The light-dependent reactions capture energy from sunlight and use it to split water molecules, releasing oxygen. "
+        "The energy is temporarily stored in carrier molecules that power the second stage of the process.",
+        "In the light-independent reactions, an enzyme fixes carbon dioxide from the air into organic compounds. "
+        "This cycle of reactions regenerates its starting molecule so that the process can continue.",
+        "The rate of photosynthesis depends on light intensity, carbon dioxide concentration and temperature. "
+        "Farmers and researchers study these factors closely in order to improve crop yields.",
+    ],
+    "computing": [
+        "A compiler is a computer program that translates code written in one programming language into another language. "
+        "The name is primarily used for programs that translate source code from a high-level language to a lower level language.",
+        "A compiler typically performs lexical analysis, parsing, semantic analysis and code generation. "
+        "Many compilers also include an optimization phase that improves the speed or size of the resulting program.",
+        "Early computers were programmed directly in machine code or assembly language, which was tedious and error prone. "
+        "The first compilers demonstrated that programs written in more abstract notations could run efficiently.",
+        "Modern compilers are usually organized into a front end, a middle end and a back end. "
+        "The front end checks the program for errors, while the back end produces instructions for a specific processor.",
+        "Just-in-time compilers translate code while the program is running, using information that is only available at run time. "
+        "This approach is common in virtual machines for languages such as Java and JavaScript.",
+        "Compiler correctness is an important area of research, because a faulty compiler can silently introduce bugs. "
+        "Some projects have produced compilers whose translations are formally proven to preserve program meaning.",
+    ],
+}
+
+# Approximate article sizes in characters, from a short stub to a long page
+ARTICLE_SIZES: Dict[str, int] = {
+    "short": 2000,
+    "medium": 8000,
+    "long": 15000,
+    "very_long": 40000,
+}
+
+
+def build_article(topic: str, target_chars: int, seed: int = 0) -> str:
+    """Build a deterministic article of roughly target_chars characters."""
+    rng = random.Random(f"{topic}-{target_chars}-{seed}")
+    paragraphs = PARAGRAPHS[topic]
+    parts: List[str] = []
+    length = 0
+    while length < target_chars:
+        order = list(paragraphs)
+        rng.shuffle(order)
+        for paragraph in order:
+            parts.append(paragraph)
+            length += len(paragraph) + 1
+            if length >= target_chars:
+                break
+    return " ".join(parts)
+
+
+SECTION_TITLES = ["Background", "Development", "Impact", "Legacy", "Research", "Modern use"]
+BOILERPLATE_TITLES = ["See also", "Notes", "References", "Further reading", "External links"]
+
+
+def _boilerplate(title: str, topic: str, target_chars: int, rng: random.Random) -> str:
+    if title == "See also":
+        return " ".join(f"List of {topic} topics {i}" for i in range(8))
+    if title == "External links":
+        return " ".join(f"Official {topic} website {i} Archived copy at archive.org" for i in range(6))
+    entries, length = [], 0
+    while length < target_chars:
+        year = rng.randint(1950, 2020)
+        entry = (f"^ Smith, J.; Doe, A. ({year}). \"Studies in {topic}, vol. {rng.randint(1, 40)}\". "
+                 f"Journal of {topic.title()} {rng.randint(1, 90)} (3): {rng.randint(1, 400)}-{rng.randint(401, 900)}. "
+                 f"doi:10.{rng.randint(1000, 9999)}/{rng.randint(100000, 999999)}. ISBN 978-0-{rng.randint(10, 99)}-{rng.randint(100000, 999999)}-1. "
+                 f"Retrieved {rng.randint(1, 28)} May {year + 1}.")
+        entries.append(entry)
+        length += len(entry) + 1
+    return " ".join(entries)
+
+
+def build_sectioned_article(topic: str, target_chars: int, seed: int = 0,
+                            boilerplate_share: float = 0.4) -> List[Tuple[str, str]]:
+    """
+    Build a deterministic page as (title, text) sections: a lead, prose
+    sections of roughly target_chars characters in total, then See also,
+    Notes, References, Further reading and External links sections whose
+    citation lists add boilerplate_share * target_chars characters.
+    """
+    rng = random.Random(f"{topic}-{target_chars}-{seed}-sections")
+    sentences = build_article(topic, target_chars, seed).replace(". ", ".\n").split("\n")
+    parts = len(SECTION_TITLES) + 1
+    size = -(-len(sentences) // parts)  # ceil
+    texts = [" ".join(sentences[i:i + size]) for i in range(0, len(sentences), size)]
+    sections = list(zip([""] + SECTION_TITLES, texts))
+    reference_chars = int(target_chars * boilerplate_share / 3)
+    sections += [(title, _boilerplate(title, topic, reference_chars, rng)) for title in BOILERPLATE_TITLES]
+    return sections
+
+
+def load_corpus() -> Dict[str, str]:
+    """Return the full benchmark corpus as {"<topic>-<size>": text}."""
+    return {
+        f"{topic}-{size}": build_article(topic, chars)
+        for topic in sorted(PARAGRAPHS)
+        for size, chars in ARTICLE_SIZES.items()
+    }
@@ -0,0 +1,231 @@
+"""
+Offline stand-ins for the wikipediaapi client and the MediaWiki API,
+replaying the benchmark corpus with configurable latency.
+"""
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from benchmarks.corpus import load_corpus
+
+
+class FakeSection:
+    def __init__(self, title: str, text: str, sections: Sequence["FakeSection"] = ()):
+        self.title = title
+        self.text = text
+        self.sections = list(sections)
+
+
+class FakePage:
+    """
+    An article is either plain text (a page with only a lead section) or a
+    list of (title, text) sections, the first of which is the lead.
+    """
+
+    def __init__(self, wiki: "FakeWikipedia", title: str):
+        self.wiki = wiki
+        self.title = title
+        self._extracts: Optional[Tuple[str, List[FakeSection]]] = None
+
+    def exists(self) -> bool:
+        return self.title in self.wiki.articles
+
+    def _fetch_extracts(self) -> Tuple[str, List[FakeSection]]:
+        # Like wikipediaapi, one "extracts" request fetches the text of every section
+        if self._extracts is None:
+            self.wiki._request("extracts")
+            article = self.wiki.articles[self.title]
+            if isinstance(article, str):
+                self._extracts = (article, [])
+            else:
+                (_, lead), *sections = article
+                self._extracts = (lead, [FakeSection(title, text) for title, text in sections])
+        return self._extracts
+
+    @property
+    def summary(self) -> str:
+        return self._fetch_extracts()[0]
+
+    @property
+    def sections(self) -> List[FakeSection]:
+        return self._fetch_extracts()[1]
+
+    @property
+    def text(self) -> str:
+        text = self.summary + ("\n\n" if self.summary else "")
+        for section in self.sections:
+            text += section.title + "\n" + section.text + ("\n\n" if section.text else "")
+        return text.strip()
+
+    @property
+    def lastrevid(self) -> Optional[int]:
+        self.wiki._request("info")
+        return self.wiki.revisions.get(self.title)
+
+
+class FakeWikipedia:
+    """
+    Mimics wikipediaapi.Wikipedia.page() for a fixed set of articles.
+    Every text or revision lookup sleeps for `latency` seconds and is
+    counted in `requests`, keyed by API module.
+    """
+
+    def __init__(self, articles: Optional[Dict[str, Union[str, List[Tuple[str, str]]]]] = None,
+                 latency: float = 0.0):
+        self.articles = dict(articles) if articles is not None else {
+            name.replace("-", " ").replace("_", " ").title(): text for name, text in load_corpus().items()
+        }
+        self.revisions = {title: 1 for title in self.articles}
+        self.latency = latency
+        self.requests: Dict[str, int] = {"extracts": 0, "info": 0}
+        self._lock = threading.Lock()
+
+    def page(self, title: str) -> FakePage:
+        return FakePage(self, title)
+
+    def edit(self, title: str, text: Union[str, List[Tuple[str, str]]]) -> None:
+        """Replace an article's text and bump its revision id."""
+        self.articles[title] = text
+        self.revisions[title] = self.revisions.get(title, 0) + 1
+
+    def _request(self, module: str) -> None:
+        with self._lock:
+            self.requests[module] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+
+class FakeMediaWikiServer:
+    """
+    Local HTTP stand-in for the MediaWiki API (action=query with title
+    resolution, prop=info and prop=extracts in wiki format), serving the
+    same articles as FakeWikipedia. Counts accepted connections and requests
+    (keyed by "resolve", "info" and "extracts"); each new connection sleeps
+    connect_latency (think TCP and TLS setup) and each request latency.
+
+        with FakeMediaWikiServer() as server:
+            pool = ClientPool(api_url=server.api_url)
+    """
+
+    def __init__(self, articles: Optional[Dict[str, Union[str, List[Tuple[str, str]]]]] = None,
+                 redirects: Optional[Dict[str, str]] = None, latency: float = 0.0,
+                 connect_latency: float = 0.0):
+        self.articles = FakeWikipedia(articles).articles
+        self.redirects = dict(redirects or {})
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.connections = 0
+        self.requests: Dict[str, int] = {"resolve": 0, "info": 0, "extracts": 0}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/{{language}}/w/api.php"
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.requests = dict.fromkeys(self.requests, 0)
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeMediaWikiServer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _normalize(title: str) -> str:
+        title = " ".join(title.replace("_", " ").split())
+        return title[:1].upper() + title[1:]
+
+    def _extract(self, title: str) -> str:
+        article = self.articles[title]
+        if isinstance(article, str):
+            return article
+        (_, lead), *sections = article
+        return lead + "".join(f"\n\n== {name} ==\n{text}" for name, text in sections)
+
+    def _query(self, params: Dict[str, str]) -> Dict:
+        titles = params.get("titles", "").split("|")
+        normalized, redirected, resolved = [], [], []
+        for title in titles:
+            canonical = self._normalize(title)
+            if canonical != title:
+                normalized.append({"from": title, "to": canonical})
+            if canonical in self.redirects:
+                redirected.append({"from": canonical, "to": self.redirects[canonical]})
+                canonical = self.redirects[canonical]
+            resolved.append(canonical)
+        query: Dict = {}
+        if normalized:
+            query["normalized"] = normalized
+        if redirected:
+            query["redirects"] = redirected
+
+        names = sorted(self.articles)
+        if params.get("formatversion") == "2":
+            module = "resolve"
+            query["pages"] = [{"title": title, "pageid": names.index(title) + 1, "ns": 0}
+                              if title in self.articles else {"title": title, "ns": 0, "missing": True}
+                              for title in resolved]
+        else:
+            module = params.get("prop", "info")
+            pages = {}
+            for title in resolved:
+                if title not in self.articles:
+                    pages["-1"] = {"title": title, "ns": 0, "missing": ""}
+                    continue
+                page = {"pageid": names.index(title) + 1, "ns": 0, "title": title}
+                if module == "extracts":
+                    page["extract"] = self._extract(title)
+                else:
+                    page["lastrevid"] = 1
+                pages[str(page["pageid"])] = page
+            query["pages"] = pages
+        with self._lock:
+            self.requests[module] += 1
+        return {"batchcomplete": "", "query": query}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep connections alive
+
+            def setup(self):
+                super().setup()
+                # Headers and body are separate writes; don't let Nagle delay the body
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with server._lock:
+                    server.connections += 1
+                if server.connect_latency:
+                    time.sleep(server.connect_latency)
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                params = dict(parse_qsl(urlparse(self.path).query))
+                payload = json.dumps(server._query(params)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,72 @@
+"""
+Load-test the HTTP summarization service at rising concurrency and report
+p50/p99 latency. By default an in-process service is started against the
+offline fake Wikipedia client; pass --url to target a running service.
+
+    python -m benchmarks.load_test [--levels 1 2 4 8 16] [--requests 32]
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from benchmarks.fakes import FakeWikipedia
+from service import SummaryService, create_server
+from wikibot import fetch_wikipedia_content
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def request(base_url, topic, length):
+    start = time.perf_counter()
+    query = urlencode({"topic": topic, "length": length})
+    try:
+        with urllib.request.urlopen(f"{base_url}/summarize?{query}", timeout=600) as response:
+            response.read()
+    except urllib.error.HTTPError as e:
+        e.read()  # An error response still measures a full round trip
+    return time.perf_counter() - start
+
+
+def run_level(base_url, topics, concurrency, total, length, rng):
+    picks = [rng.choice(topics) for _ in range(total)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(lambda topic: request(base_url, topic, length), picks))
+    elapsed = time.perf_counter() - start
+    print(f"concurrency={concurrency:<3} p50={percentile(latencies, 50):7.2f}s "
+          f"p99={percentile(latencies, 99):7.2f}s throughput={total / elapsed:6.2f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="base URL of a running service (default: start one in-process)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--requests", type=int, default=32, help="requests per concurrency level")
+    parser.add_argument("--length", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated Wikipedia latency (in-process only)")
+    args = parser.parse_args()
+
+    fake = FakeWikipedia(latency=args.latency)
+    topics = [title for title in fake.articles if "Short" not in title]
+    base_url = args.url
+    if base_url is None:
+        service = SummaryService(fetcher=lambda topic: fetch_wikipedia_content(topic, client=fake))
+        server = create_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+    rng = random.Random(0)
+    for level in args.levels:
+        run_level(base_url, topics, level, args.requests, args.length, rng)
+
+    with urllib.request.urlopen(f"{base_url}/metrics") as response:
+        print(json.dumps(json.load(response), indent=2))
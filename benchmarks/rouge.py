@@ -0,0 +1,48 @@
+"""Minimal ROUGE-1/2/L F1 scores, enough to compare summaries offline."""
+import re
+from collections import Counter
+from typing import Dict, List
+
+
+def _tokens(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def _f1(overlap: int, candidate_total: int, reference_total: int) -> float:
+    if not overlap:
+        return 0.0
+    precision = overlap / candidate_total
+    recall = overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+
+def _ngrams(tokens: List[str], n: int) -> Counter:
+    return Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+
+def _lcs_length(a: List[str], b: List[str]) -> int:
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def rouge(candidate: str, reference: str) -> Dict[str, float]:
+    """ROUGE-1, ROUGE-2 and ROUGE-L F1 of candidate against reference."""
+    cand, ref = _tokens(candidate), _tokens(reference)
+    scores = {}
+    for n in (1, 2):
+        c, r = _ngrams(cand, n), _ngrams(ref, n)
+        scores[f"rouge{n}"] = _f1(sum((c & r).values()), sum(c.values()), sum(r.values()))
+    scores["rougeL"] = _f1(_lcs_length(cand, ref), len(cand), len(ref))
+    return scores
+
+
+def mean_rouge(candidates: List[str], references: List[str]) -> Dict[str, float]:
+    totals = Counter()
+    for candidate, reference in zip(candidates, references):
+        totals.update(rouge(candidate, reference))
+    return {name: value / len(candidates) for name, value in totals.items()}
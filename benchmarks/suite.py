@@ -0,0 +1,202 @@
+"""
+Reproducible end-to-end benchmark of generate_wikipedia_summary.
+
+    python -m benchmarks.suite -o results.json [--repeat 3] [--latency 0.05]
+    python -m benchmarks.suite -o new.json --baseline results.json [--threshold 0.1]
+    python -m benchmarks.suite --compare results.json new.json
+
+Every article of the frozen offline corpus is fetched through the shared
+client pool from a local MediaWiki stand-in (with simulated network latency)
+and summarized at the three lengths the GUI offers. Per-stage timings come from the profiling spans. Results hold
+p50/p90/p99 latency per stage and end to end, throughput and peak RSS, and
+are written as JSON. With --baseline (or --compare) any p50 that is slower
+than the baseline by more than the threshold (and --min-delta) fails the run.
+"""
+import argparse
+import hashlib
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.corpus import load_corpus
+from benchmarks.fakes import FakeMediaWikiServer
+import profiling
+import summarizer
+from wiki_pool import ClientPool
+from wikibot import generate_wikipedia_summary, set_client_pool
+
+SUMMARY_LENGTHS = (150, 300, 500)  # Small, Medium and Large in the GUI
+MAX_INPUT = 15000  # What the GUI passes to the summarizer
+
+
+class _Recorder:
+    """Profiling sink that keeps every span duration, by stage."""
+
+    def __init__(self):
+        self.spans: Dict[str, List[float]] = {}
+
+    def emit(self, event):
+        self.spans.setdefault(event["name"], []).append(event["seconds"])
+
+    def export(self, snapshot):
+        pass
+
+    def close(self):
+        pass
+
+
+def percentile(values, pct):
+    """Linearly interpolated percentile of a non-empty list."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def describe(values):
+    return {"count": len(values), "mean": sum(values) / len(values),
+            "p50": percentile(values, 50), "p90": percentile(values, 90), "p99": percentile(values, 99)}
+
+
+def corpus_digest(corpus):
+    digest = hashlib.sha256()
+    for name in sorted(corpus):
+        digest.update(name.encode("utf-8") + b"\0" + corpus[name].encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(repeat=1, latency=0.05, lengths=SUMMARY_LENGTHS):
+    corpus = load_corpus()
+    summarizer.set_summary_cache(None)  # every run must do the full work
+    summarizer.get_model()  # keep model loading out of the timings
+
+    with FakeMediaWikiServer(latency=latency) as server:
+        # Unthrottled, so the timings do not depend on the rate limit
+        set_client_pool(ClientPool(api_url=server.api_url, rate=None))
+        try:
+            results = run_lengths(sorted(server.articles), repeat, lengths)
+        finally:
+            set_client_pool(None)
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": summarizer.current_backend(),
+            "model": summarizer.DEFAULT_MODEL,
+            "corpus_sha256": corpus_digest(corpus),
+            "articles": len(corpus),
+            "repeat": repeat,
+            "latency": latency,
+        },
+        "results": results,
+        "peak_rss_bytes": profiling.peak_rss_bytes(),
+    }
+
+
+def run_lengths(titles, repeat, lengths):
+    """Summarize every title at each length through the default client pool."""
+    results = {}
+    for length in lengths:
+        recorder = _Recorder()
+        profiler = profiling.enable([recorder])
+        end_to_end, failures = [], 0
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for title in titles:
+                article_start = time.perf_counter()
+                result = generate_wikipedia_summary(title, max_input_length=MAX_INPUT,
+                                                    summary_length=length)
+                end_to_end.append(time.perf_counter() - article_start)
+                failures += "error" in result or result["summary"].startswith("Error")
+        elapsed = time.perf_counter() - start
+        profiling.disable()
+        counters = profiler.snapshot()["counters"]
+        results[str(length)] = {
+            "end_to_end": describe(end_to_end),
+            "stages": {name: describe(values) for name, values in sorted(recorder.spans.items())},
+            "articles_per_second": len(end_to_end) / elapsed,
+            "counters": counters,
+            "failures": failures,
+        }
+        print(f"{length:>4} words: p50={results[str(length)]['end_to_end']['p50']:7.3f}s "
+              f"p99={results[str(length)]['end_to_end']['p99']:7.3f}s "
+              f"throughput={results[str(length)]['articles_per_second']:6.2f} articles/s "
+              f"failures={failures}", file=sys.stderr)
+    return results
+
+
+def compare(baseline, current, threshold, min_delta=0.001):
+    """
+    Return a list of regressions: p50 slower than the baseline by more than
+    threshold (relative) and min_delta seconds, so microsecond stages do not
+    fail the check on timer noise.
+    """
+    if baseline["meta"]["corpus_sha256"] != current["meta"]["corpus_sha256"]:
+        raise SystemExit("Baseline was measured on a different corpus; re-run it first")
+    regressions = []
+    for length, result in current["results"].items():
+        old = baseline["results"].get(length)
+        if old is None:
+            continue
+        pairs = [("end_to_end", old["end_to_end"], result["end_to_end"])]
+        pairs += [(f"stage {name}", old["stages"][name], stats)
+                  for name, stats in result["stages"].items() if name in old["stages"]]
+        for label, before, after in pairs:
+            change = after["p50"] / before["p50"] - 1 if before["p50"] else 0.0
+            line = f"{length:>4} words {label:<24} p50 {before['p50']:8.4f}s -> {after['p50']:8.4f}s ({change:+6.1%})"
+            print(line, file=sys.stderr)
+            if change > threshold and after["p50"] - before["p50"] > min_delta:
+                regressions.append(line)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-o", "--output", help="write results JSON here")
+    parser.add_argument("--repeat", type=int, default=1, help="passes over the corpus per summary length")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated seconds per API call")
+    parser.add_argument("--lengths", type=int, nargs="+", default=list(SUMMARY_LENGTHS))
+    parser.add_argument("--baseline", help="results JSON to compare this run against")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="only compare two saved results")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed p50 slowdown (0.10 = 10%%)")
+    parser.add_argument("--min-delta", type=float, default=0.001, help="ignore slowdowns below this many seconds")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+    else:
+        current = run_suite(repeat=args.repeat, latency=args.latency, lengths=args.lengths)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(current, f, indent=2)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+
+    if baseline is not None:
+        regressions = compare(baseline, current, args.threshold, args.min_delta)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}:", file=sys.stderr)
+            print("\n".join(regressions), file=sys.stderr)
+            sys.exit(1)
+        print("No regressions", file=sys.stderr)
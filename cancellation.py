@@ -0,0 +1,48 @@
+import threading
+import time
+from typing import Optional
+
+
+class OperationCancelled(Exception):
+    """Raised when work is abandoned because its token was cancelled or timed out."""
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag with an optional deadline.
+
+    The caller keeps the token and calls cancel(); the worker passes it
+    down and calls raise_if_cancelled() between units of work (a page
+    fetch, a batch of chunks, a generation step).
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self._event = threading.Event()
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None if there is no deadline."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise OperationCancelled("Operation cancelled")
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise OperationCancelled("Operation timed out")
+
+
+def check(token: Optional[CancellationToken]) -> None:
+    """raise_if_cancelled() for an optional token."""
+    if token is not None:
+        token.raise_if_cancelled()
@@ -0,0 +1,108 @@
+"""
+Vectorized sentence/passage scoring with NumPy, used to pick the most
+salient parts of an article before (or instead of) running T5.
+"""
+import re
+from typing import List
+
+import numpy as np
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a about above after again against all also an and any are as at be because been
+before being below between both but by can could did do does doing down during
+each few for from further had has have having he her here hers him his how i if
+in into is it its itself just may me more most my no nor not of off on once only
+or other our out over own same she should so some such than that the their them
+then there these they this those through to too under until up very was we were
+what when where which while who whom why will with would you your
+""".split())
+
+
+def _terms(text: str) -> List[str]:
+    return [word for word in _WORD_RE.findall(text.lower()) if word not in STOPWORDS]
+
+
+def tfidf_matrix(passages: List[str]) -> np.ndarray:
+    """L2-normalized TF-IDF rows, one per passage."""
+    vocabulary = {}
+    rows, cols, counts = [], [], []
+    for row, passage in enumerate(passages):
+        for term in _terms(passage):
+            rows.append(row)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+            counts.append(1.0)
+    matrix = np.zeros((len(passages), max(len(vocabulary), 1)))
+    np.add.at(matrix, (rows, cols), counts)
+
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    idf = np.log((1 + len(passages)) / (1 + document_frequency)) + 1.0
+    matrix = np.log1p(matrix) * idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def salience_scores(passages: List[str]) -> np.ndarray:
+    """Cosine similarity of each passage to the article centroid."""
+    if not passages:
+        return np.zeros(0)
+    matrix = tfidf_matrix(passages)
+    centroid = matrix.mean(axis=0)
+    norm = np.linalg.norm(centroid)
+    return matrix @ (centroid / norm) if norm else np.zeros(len(passages))
+
+
+def top_passages(passages: List[str], k: int) -> List[int]:
+    """Indices of the k most salient passages, in their original order."""
+    if k >= len(passages):
+        return list(range(len(passages)))
+    scores = salience_scores(passages)
+    return sorted(np.argsort(-scores, kind="stable")[:k].tolist())
+
+
+def textrank_scores(sentences: List[str], damping: float = 0.85,
+                    iterations: int = 50, tolerance: float = 1e-6) -> np.ndarray:
+    """
+    TextRank over the TF-IDF cosine-similarity graph of the sentences,
+    solved by power iteration on the row-normalized similarity matrix.
+    """
+    n = len(sentences)
+    if n == 0:
+        return np.zeros(0)
+    matrix = tfidf_matrix(sentences)
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, 0.0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    # Sentences with no similar sentence link to every sentence equally
+    transition = np.where(out_weight > 0, similarity / np.where(out_weight == 0, 1.0, out_weight), 1.0 / n)
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(iterations):
+        updated = (1 - damping) / n + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tolerance:
+            return updated
+        scores = updated
+    return scores
+
+
+SCORERS = {
+    "textrank": textrank_scores,
+    "tfidf": salience_scores,
+}
+
+
+def select_within_budget(scores: np.ndarray, lengths: List[int], budget: int) -> List[int]:
+    """
+    Indices of the best-scoring items whose lengths fit in budget, in their
+    original order. Items too long for the remaining budget are skipped, and
+    the best item is always kept so the result is never empty.
+    """
+    chosen, used = [], 0
+    for index in np.argsort(-scores, kind="stable").tolist():
+        if used + lengths[index] <= budget or not chosen:
+            chosen.append(index)
+            used += lengths[index]
+        if used >= budget:
+            break
+    return sorted(chosen)
@@ -0,0 +1,263 @@
+"""
+Lightweight in-process instrumentation for the fetch/summarize pipeline.
+
+Code marks pipeline stages with span(), token counts with count(), and
+other distributions with observe(). Nothing is recorded until enable()
+installs a Profiler; until then these calls return immediately.
+
+    import profiling
+    profiler = profiling.enable([profiling.JsonLinesSink("profile.jsonl")])
+    ...
+    profiler.close()  # writes the final counters and histograms
+
+Spans are streamed to the sinks as they finish; counters, histograms and
+peak memory are exported by flush() and close().
+"""
+import bisect
+import json
+import sys
+import threading
+import time
+from typing import Any, Dict, IO, Iterable, List, Optional, Sequence, Union
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+class Histogram:
+    """Cumulative-bucket histogram, in the style of Prometheus."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.total += value
+            self.count += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            cumulative, running = {}, 0
+            for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+                running += count
+                cumulative[str(bound)] = running
+            return {"buckets": cumulative, "sum": self.total, "count": self.count}
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, where the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+class JsonLinesSink:
+    """Writes every span, and each metrics snapshot, as one JSON line."""
+
+    def __init__(self, target: Union[str, IO[str]]):
+        self._owned = isinstance(target, str)
+        self._file = open(target, "a", encoding="utf-8") if self._owned else target
+        self._lock = threading.Lock()
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def export(self, snapshot: Dict[str, Any]) -> None:
+        self.emit(dict(snapshot, type="metrics"))
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._owned:
+            self._file.close()
+
+
+class PrometheusSink:
+    """Writes counters and histograms in the Prometheus text format on export."""
+
+    def __init__(self, path: str, prefix: str = "wikibot_"):
+        self.path = path
+        self.prefix = prefix
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        pass  # Prometheus only sees aggregates
+
+    def export(self, snapshot: Dict[str, Any]) -> None:
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):
+            lines += [f"# TYPE {self.prefix}{name}_total counter", f"{self.prefix}{name}_total {value}"]
+        for name, histogram in sorted(snapshot["histograms"].items()):
+            metric = self.prefix + name
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, count in histogram["buckets"].items():
+                le = "+Inf" if bound == "inf" else bound
+                lines.append(f'{metric}_bucket{{le="{le}"}} {count}')
+            lines += [f"{metric}_sum {histogram['sum']}", f"{metric}_count {histogram['count']}"]
+        if snapshot.get("peak_rss_bytes") is not None:
+            lines += [f"# TYPE {self.prefix}peak_rss_bytes gauge",
+                      f"{self.prefix}peak_rss_bytes {snapshot['peak_rss_bytes']}"]
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def close(self) -> None:
+        pass
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "fields", "start")
+
+    def __init__(self, profiler: "Profiler", name: str, fields: Dict[str, Any]):
+        self.profiler = profiler
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.profiler._finish_span(self, time.perf_counter() - self.start, exc_type)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """
+    Collects spans, counters and histograms in process and forwards them to
+    sinks. Span durations are also kept as "<name>_seconds" histograms.
+    """
+
+    def __init__(self, sinks: Iterable = ()):
+        self.sinks: List = list(sinks)
+        self.counters: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def span(self, name: str, **fields: Any) -> _Span:
+        return _Span(self, name, fields)
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, Histogram(buckets))
+        histogram.observe(value)
+
+    def _finish_span(self, span: _Span, seconds: float, exc_type) -> None:
+        self.observe(f"{span.name}_seconds", seconds)
+        event = {"type": "span", "name": span.name, "seconds": seconds,
+                 "thread": threading.current_thread().name, **span.fields}
+        if exc_type is not None:
+            event["error"] = exc_type.__name__
+        for sink in self.sinks:
+            sink.emit(event)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = dict(self.histograms)
+        return {
+            "counters": counters,
+            "histograms": {name: histogram.snapshot() for name, histogram in histograms.items()},
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+
+    def report(self) -> str:
+        """Human-readable table of time spent per stage and the counters."""
+        snapshot = self.snapshot()
+        lines = [f"{'stage':<18}{'calls':>7}{'total s':>10}{'mean ms':>10}"]
+        for name, histogram in sorted(snapshot["histograms"].items()):
+            if name.endswith("_seconds") and histogram["count"]:
+                lines.append(f"{name[:-len('_seconds')]:<18}{histogram['count']:>7}"
+                             f"{histogram['sum']:>10.3f}{histogram['sum'] / histogram['count'] * 1000:>10.1f}")
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"{name:<18}{value:>17g}")
+        if snapshot["peak_rss_bytes"] is not None:
+            lines.append(f"{'peak RSS MB':<18}{snapshot['peak_rss_bytes'] / 2 ** 20:>17.1f}")
+        return "\n".join(lines)
+
+    def flush(self) -> None:
+        snapshot = self.snapshot()
+        for sink in self.sinks:
+            sink.export(snapshot)
+
+    def close(self) -> None:
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+
+# The active profiler; None means instrumentation is disabled
+_profiler: Optional[Profiler] = None
+
+
+def enable(sinks: Iterable = ()) -> Profiler:
+    """Start recording with a new Profiler writing to sinks, and return it."""
+    global _profiler
+    _profiler = Profiler(sinks)
+    return _profiler
+
+
+def disable() -> None:
+    global _profiler
+    _profiler = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _profiler
+
+
+def enabled() -> bool:
+    """For guarding measurements that cost something to compute."""
+    return _profiler is not None
+
+
+def span(name: str, **fields: Any):
+    """Context manager timing one pipeline stage (a no-op when disabled)."""
+    profiler = _profiler
+    if profiler is None:
+        return _NULL_SPAN
+    return _Span(profiler, name, fields)
+
+
+def count(name: str, value: float = 1) -> None:
+    profiler = _profiler
+    if profiler is not None:
+        profiler.count(name, value)
+
+
+def observe(name: str, value: float, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+    profiler = _profiler
+    if profiler is not None:
+        profiler.observe(name, value, buckets)
+
+
+def sink_for_path(path: str):
+    """PrometheusSink for *.prom files, JsonLinesSink otherwise."""
+    return PrometheusSink(path) if path.endswith(".prom") else JsonLinesSink(path)
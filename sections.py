@@ -0,0 +1,121 @@
+"""
+Section structure of fetched articles.
+
+A SectionedArticle keeps the cleaned article text exactly as
+fetch_wikipedia_content returns it, plus the offsets of each section's
+body in that text, so sections can be filtered by title and summarized
+along their boundaries without storing the text twice.
+"""
+import json
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Sections that are lists of links or citations rather than prose
+SKIPPED_SECTIONS = frozenset({
+    "references", "see also", "external links", "further reading", "notes",
+    "bibliography", "sources", "citations", "footnotes", "notes and references",
+    "works cited", "explanatory notes", "general and cited sources",
+})
+
+
+class Section(NamedTuple):
+    title: str  # "" for the lead section
+    level: int  # 0 for the lead, 1 for top-level sections, 2 for subsections...
+    start: int  # Offsets of the section body in SectionedArticle.content
+    end: int
+
+
+class SectionedArticle:
+    """Cleaned article text with the offsets of its sections."""
+
+    def __init__(self, content: str, sections: Optional[List[Section]] = None):
+        self.content = content
+        self.sections = sections if sections is not None else [Section("", 0, 0, len(content))]
+
+    def text(self, section: Section) -> str:
+        """Cleaned body text of one section (sliced from content on demand)."""
+        return self.content[section.start:section.end].strip()
+
+    def kept_sections(self, skip: Iterable[str] = SKIPPED_SECTIONS) -> List[Section]:
+        """Sections whose titles are not in skip, nor nested under one that is."""
+        skip = {title.casefold() for title in skip}
+        kept = []
+        skipped_level = None
+        for section in self.sections:
+            if skipped_level is not None and section.level > skipped_level:
+                continue
+            skipped_level = None
+            if section.title.casefold() in skip:
+                skipped_level = section.level
+            else:
+                kept.append(section)
+        return kept
+
+    def section_texts(self, max_length: Optional[int] = None,
+                      skip: Iterable[str] = SKIPPED_SECTIONS) -> List[str]:
+        """
+        Non-empty text of the kept sections in page order, stopping once
+        max_length characters have been collected. The last section is cut
+        at a sentence boundary, like wikibot.truncate_content.
+        """
+        texts = []
+        remaining = max_length
+        for section in self.kept_sections(skip):
+            text = self.text(section)
+            if not text:
+                continue
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                if len(text) > remaining:
+                    cut = text.rfind(".", 0, remaining)
+                    text = text[:cut + 1] if cut > 0 else text[:remaining]
+                remaining -= len(text) + 1
+            texts.append(text)
+        return texts
+
+    def sections_json(self) -> str:
+        return json.dumps([list(section) for section in self.sections])
+
+    @classmethod
+    def from_json(cls, content: str, sections: Optional[str]) -> "SectionedArticle":
+        """Rebuild an article stored with sections_json(); None means one lead section."""
+        if sections is None:
+            return cls(content)
+        return cls(content, [Section(*section) for section in json.loads(sections)])
+
+
+def _page_pieces(page) -> Iterator[Tuple[Optional[Section], str]]:
+    # The pieces page.text is concatenated from, in order, each tagged with the
+    # section whose body it is (None for titles and separators)
+    lead = Section("", 0, 0, 0)
+    yield lead, page.summary
+    if page.summary:
+        yield None, "\n\n"
+
+    def walk(sections, level):
+        for section in sections:
+            yield None, section.title
+            yield None, "\n"
+            yield Section(section.title, level, 0, 0), section.text
+            if section.text:
+                yield None, "\n\n"
+            yield from walk(section.sections, level + 1)
+
+    yield from walk(page.sections, 1)
+
+
+def from_page(page, cleaner) -> SectionedArticle:
+    """
+    Build a SectionedArticle from a wikipediaapi page, cleaning it piece by
+    piece with cleaner (a wikibot.TextCleaner). The content is exactly
+    clean_text(page.text).
+    """
+    parts, sections = [], []
+    length = 0
+    for section, piece in _page_pieces(page):
+        cleaned = cleaner.feed(piece)
+        if section is not None:
+            sections.append(section._replace(start=length, end=length + len(cleaned)))
+        parts.append(cleaned)
+        length += len(cleaned)
+    return SectionedArticle("".join(parts), sections)
@@ -0,0 +1,223 @@
+"""
+Long-lived local HTTP summarization service.
+
+    python service.py --port 8000
+    curl 'http://127.0.0.1:8000/summarize?topic=Quantum+Computing&length=300'
+    curl 'http://127.0.0.1:8000/summarize?topic=Quantum+Computing&length=300&profile=fast'
+    curl 'http://127.0.0.1:8000/metrics'
+
+One warm model serves every request. Identical in-flight requests (same
+topic, length and generation profile) share a single computation, and requests arriving within
+a short window are summarized together in one micro-batch.
+"""
+import argparse
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+from profiling import Histogram
+from summarizer import (BACKENDS, DEFAULT_BATCH_SIZE, DEFAULT_PROFILE, GENERATION_PROFILES, set_backend,
+                        summarize_articles, warm_up)
+from wikibot import clean_text, fetch_wikipedia_sections, summary_input
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32)
+
+
+class SummaryService:
+    """
+    Coalesces and micro-batches summary requests in front of one model.
+
+    fetcher(topic) returns cleaned content (text or a SectionedArticle) or an
+    "Error..." string, like wikibot.fetch_wikipedia_sections, so tests can run
+    against a stub.
+    """
+
+    def __init__(self, fetcher: Callable[[str], Any] = fetch_wikipedia_sections,
+                 summarize_fn: Callable[..., List[Union[str, Exception]]] = summarize_articles,
+                 max_input_length: int = 15000, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_batch_articles: int = 8, batch_wait: float = 0.05):
+        self.fetcher = fetcher
+        self.summarize_fn = summarize_fn
+        self.max_input_length = max_input_length
+        self.batch_size = batch_size
+        self.max_batch_articles = max_batch_articles
+        self.batch_wait = batch_wait
+
+        self.requests = 0
+        self.coalesced = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.batch_articles = Histogram(BATCH_SIZE_BUCKETS)
+
+        self._inflight: Dict[Tuple[str, int, str], Future] = {}
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Tuple[Union[str, List[str]], Tuple[int, str], Future]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run_batches, name="summary-batcher", daemon=True)
+        self._worker.start()
+
+    def summarize(self, topic: str, length: int = 300,
+                  profile: str = DEFAULT_PROFILE) -> Dict[str, Union[str, int]]:
+        """Return {"summary", "word_count", ...} or {"error"} for a topic."""
+        start = time.perf_counter()
+        # Titles are case-sensitive ("RAM" and "Ram" are different pages), so
+        # only spacing is normalized
+        key = (" ".join(topic.replace("_", " ").split()), length, profile)
+        with self._lock:
+            self.requests += 1
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self.coalesced += 1
+
+        if owner:
+            try:
+                content = self.fetcher(topic)
+                if isinstance(content, str) and content.startswith("Error"):
+                    future.set_result({"error": content})
+                else:
+                    self._queue.put((summary_input(content, self.max_input_length), (length, profile), future))
+            except Exception as e:
+                future.set_result({"error": f"Error fetching content: {str(e)}"})
+            future.add_done_callback(lambda _: self._forget(key))
+
+        result = future.result()
+        self.latency.observe(time.perf_counter() - start)
+        return result
+
+    def _forget(self, key: Tuple[str, int, str]) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def _run_batches(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_wait
+            while len(items) < self.max_batch_articles:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.batch_articles.observe(len(items))
+
+            # Articles are batched together only if they share length and profile
+            by_settings: Dict[Tuple[int, str], List[Tuple[Union[str, List[str]], Future]]] = {}
+            for content, settings, future in items:
+                by_settings.setdefault(settings, []).append((content, future))
+            for (length, profile), group in by_settings.items():
+                try:
+                    results = self.summarize_fn([content for content, _ in group],
+                                                max_summary_length=length,
+                                                batch_size=self.batch_size,
+                                                profile=profile)
+                except Exception as e:
+                    results = [e] * len(group)
+                for (content, future), result in zip(group, results):
+                    if isinstance(result, Exception):
+                        future.set_result({"error": f"Error generating summary: {str(result)}"})
+                    else:
+                        summary = clean_text(result)
+                        content_length = len(content) if isinstance(content, str) else sum(map(len, content))
+                        future.set_result({"summary": summary,
+                                           "word_count": len(summary.split()),
+                                           "content_length": content_length})
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            inflight = len(self._inflight)
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "inflight": inflight,
+            "queue_depth": self._queue.qsize(),
+            "batch_articles": self.batch_articles.snapshot(),
+            "latency_seconds": self.latency.snapshot(),
+        }
+
+
+def make_handler(service: SummaryService):
+    class SummaryHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = parse_qs(url.query)
+            if url.path == "/summarize":
+                topic = params.get("topic", [""])[0].strip()
+                try:
+                    length = int(params.get("length", ["300"])[0])
+                except ValueError:
+                    return self._send(400, {"error": "length must be an integer"})
+                profile = params.get("profile", [DEFAULT_PROFILE])[0]
+                if profile not in GENERATION_PROFILES:
+                    return self._send(400, {"error": f"profile must be one of {', '.join(sorted(GENERATION_PROFILES))}"})
+                if not topic:
+                    return self._send(400, {"error": "Please enter a topic"})
+                result = service.summarize(topic, length, profile)
+                if "summary" in result:
+                    status = 200
+                else:
+                    status = 404 if "not found" in result["error"] else 502
+                self._send(status, dict(result, topic=topic))
+            elif url.path == "/metrics":
+                self._send(200, service.metrics())
+            elif url.path == "/health":
+                self._send(200, {"status": "ok"})
+            else:
+                self._send(404, {"error": "Not found"})
+
+        def _send(self, status: int, body: Dict) -> None:
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            logging.debug("service: " + format % args)
+
+    return SummaryHandler
+
+
+def create_server(service: SummaryService, host: str = "127.0.0.1", port: int = 8000) -> ThreadingHTTPServer:
+    """Build (but do not start) an HTTP server for service; port 0 picks a free port."""
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve Wikipedia summaries over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--batch-wait", type=float, default=0.05, help="seconds to gather a micro-batch")
+    parser.add_argument("--max-batch-articles", type=int, default=8)
+    parser.add_argument("--backend", choices=sorted(BACKENDS), help="inference backend (default: $WIKIBOT_BACKEND or torch)")
+    args = parser.parse_args(argv)
+    if args.backend:
+        set_backend(args.backend)
+
+    warm_up(background=False)
+    service = SummaryService(batch_wait=args.batch_wait, max_batch_articles=args.max_batch_articles)
+    server = create_server(service, args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
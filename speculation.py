@@ -0,0 +1,78 @@
+"""
+Speculative chunk summarization for the GUI.
+
+After an article is fetched, a SpeculativeSummarizer summarizes its chunks
+in a background thread, one chunk at a time, while the user is still
+choosing a summary size. Each finished chunk lands in the per-chunk summary
+cache, so the real summarization reuses it whichever size is picked: the
+GUI sizes (150/300/500 words) share one size tier, hence the same chunks and
+chunk settings, and the largest size needs a superset of the chunks of the
+smaller ones.
+"""
+import logging
+import threading
+from typing import Optional
+
+import summarizer
+from cancellation import CancellationToken, OperationCancelled
+
+
+class SpeculativeSummarizer:
+    """Background warmer of the chunk summary cache for one article at a time."""
+
+    def __init__(self, max_summary_length: int = 500):
+        self.max_summary_length = max_summary_length
+        self.chunks_done = 0
+        self._thread: Optional[threading.Thread] = None
+        self._cancel_token: Optional[CancellationToken] = None
+        self._stop = threading.Event()
+
+    def start(self, content: summarizer.Article, profile: str = summarizer.DEFAULT_PROFILE) -> None:
+        """Drop any running speculation and start on content."""
+        self.cancel()
+        self.chunks_done = 0
+        self._cancel_token = CancellationToken()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(content, profile, self._cancel_token, self._stop),
+                                        name="speculative-summary", daemon=True)
+        self._thread.start()
+
+    def _run(self, content, profile, cancel_token, stop) -> None:
+        # batch_size=1 so each chunk is cached as soon as it is generated and
+        # a request to stop waits for at most one chunk
+        stream = summarizer.iter_summarize_wikipedia(content, max_summary_length=self.max_summary_length,
+                                                     batch_size=1, cancel_token=cancel_token, profile=profile)
+        try:
+            for _ in stream:
+                self.chunks_done += 1
+                if stop.is_set():
+                    break
+        except OperationCancelled:
+            pass
+        except Exception as e:
+            # The real summarization will report the same failure if it matters
+            logging.debug(f"Speculative summarization stopped: {str(e)}")
+        finally:
+            stream.close()
+        logging.debug(f"Speculative summarization finished {self.chunks_done} chunks")
+
+    def finish_chunk(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop after the chunk being generated now, and wait for it (up to
+        timeout seconds), so it is not thrown away and the caller has the
+        model to itself. Call from a worker thread, not the UI thread.
+        """
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def cancel(self) -> None:
+        """Abandon the speculation immediately (e.g. a new topic is fetched)."""
+        if self._cancel_token is not None:
+            self._cancel_token.cancel()
+        self._stop.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
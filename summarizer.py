@@ -1,16 +1,186 @@
 
-from transformers import T5Tokenizer, T5ForConditionalGeneration
-from nltk import sent_tokenize
 import logging
-from typing import List
+import os
+import threading
+from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Union
 import re
+from summary_cache import SummaryCache, make_key
+from cancellation import CancellationToken, OperationCancelled, check
+import profiling
 
-logging.basicConfig(filename="wikibot.log", level=logging.DEBUG, 
-                    format="%(asctime)s - %(levelname)s - %(message)s")
+DEFAULT_MODEL = "t5-base"
 
-# Load model once at startup
-tokenizer = T5Tokenizer.from_pretrained("t5-base", legacy=False)
-model = T5ForConditionalGeneration.from_pretrained("t5-base")
+# Chunks summarized per generate() call in summarize_wikipedia
+DEFAULT_BATCH_SIZE = 4
+
+# Named decoding profiles passed to model.generate (also part of summary
+# cache keys). "balanced" is the original beam search; beam-search profiles
+# use at least the beam count of the summary size tier (see _tier_settings).
+GENERATION_PROFILES: Dict[str, Dict[str, Any]] = {
+    "fast": {"num_beams": 1, "no_repeat_ngram_size": 3, "use_cache": True},
+    "balanced": {"num_beams": 4, "length_penalty": 2.0, "early_stopping": True},
+    "quality": {"num_beams": 8, "length_penalty": 2.0, "early_stopping": True,
+                "no_repeat_ngram_size": 3},
+}
+DEFAULT_PROFILE = "balanced"
+GENERATION_SETTINGS = GENERATION_PROFILES[DEFAULT_PROFILE]
+
+# Chunk summary lengths are scaled by this for the profile (greedy decoding
+# is cheapest when it stops early)
+PROFILE_LENGTH_SCALE = {"fast": 0.75}
+
+# Cache of whole-article and per-chunk summaries (memory only by default)
+_summary_cache: Optional[SummaryCache] = SummaryCache()
+
+def set_summary_cache(cache: Optional[SummaryCache]) -> None:
+    """Install (or disable, with None) the summary cache."""
+    global _summary_cache
+    _summary_cache = cache
+
+# Optional worker_pool.SummarizerPool that runs model calls in other processes
+_worker_pool = None
+
+def set_worker_pool(pool) -> None:
+    """Route model calls through a SummarizerPool (or back in-process, with None)."""
+    global _worker_pool
+    _worker_pool = pool
+
+# Model registry: checkpoints are loaded on first use and shared by all threads
+_tokenizers: Dict[str, Any] = {}
+_models: Dict[str, Any] = {}
+_load_locks: Dict[str, threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+def _load_lock(key: str) -> threading.Lock:
+    with _registry_lock:
+        return _load_locks.setdefault(key, threading.Lock())
+
+def get_tokenizer(model_name: str = DEFAULT_MODEL):
+    """
+    Return the tokenizer for model_name, loading it on first use
+    """
+    tokenizer = _tokenizers.get(model_name)
+    if tokenizer is None:
+        with _load_lock("tokenizer:" + model_name):
+            tokenizer = _tokenizers.get(model_name)
+            if tokenizer is None:
+                # The Rust tokenizer encodes a batch of sentences in one call
+                # (the sentencepiece one loops over them in Python)
+                from transformers import T5TokenizerFast
+                logging.info(f"Loading tokenizer: {model_name}")
+                tokenizer = T5TokenizerFast.from_pretrained(model_name)
+                _tokenizers[model_name] = tokenizer
+    return tokenizer
+
+def _load_torch(model_name: str):
+    from transformers import T5ForConditionalGeneration
+    model = T5ForConditionalGeneration.from_pretrained(model_name)
+    model.eval()
+    return model
+
+def _load_torch_int8(model_name: str):
+    # Dynamic int8 quantization of the Linear layers (weights int8, activations fp32)
+    import torch
+    return torch.ao.quantization.quantize_dynamic(
+        _load_torch(model_name), {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+# Where the onnx backend keeps exported models, one directory per checkpoint
+ONNX_MODEL_DIR = os.environ.get("WIKIBOT_ONNX_DIR", "onnx_models")
+
+def _load_onnx(model_name: str):
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError:
+        raise RuntimeError("The onnx backend needs optimum and onnxruntime: "
+                           "pip install optimum[onnxruntime]")
+    path = os.path.join(ONNX_MODEL_DIR, model_name.replace("/", "--"))
+    if not os.path.isdir(path):
+        # Exporting takes far longer than loading, so it is done once. The
+        # export is saved under a temporary name and renamed into place, so
+        # a concurrent or interrupted export never leaves a partial model
+        import shutil
+        import tempfile
+        logging.info(f"Exporting {model_name} to ONNX in {path}")
+        os.makedirs(ONNX_MODEL_DIR, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".export-", dir=ONNX_MODEL_DIR)
+        try:
+            ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True).save_pretrained(staging)
+            try:
+                os.rename(staging, path)
+            except OSError:
+                if not os.path.isdir(path):
+                    raise  # Not another process finishing first
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    return ORTModelForSeq2SeqLM.from_pretrained(path)
+
+# Inference backends: name -> loader returning an object with .generate()
+BACKENDS = {
+    "torch": _load_torch,
+    "torch-int8": _load_torch_int8,
+    "onnx": _load_onnx,
+}
+
+_backend = os.environ.get("WIKIBOT_BACKEND", "torch")
+
+def set_backend(name: str) -> None:
+    """Select the inference backend used for new summaries"""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}' (choose from {', '.join(BACKENDS)})")
+    _backend = name
+
+def current_backend() -> str:
+    return _backend
+
+def get_model(model_name: str = DEFAULT_MODEL, backend: Optional[str] = None) -> Tuple[Any, Any]:
+    """
+    Return (tokenizer, model) for model_name on the given (or configured)
+    backend, loading them on first use. Concurrent callers wait for a
+    single load instead of loading twice.
+    """
+    backend = backend or _backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}' (choose from {', '.join(BACKENDS)})")
+    key = f"{backend}:{model_name}"
+    model = _models.get(key)
+    if model is None:
+        with _load_lock("model:" + key):
+            model = _models.get(key)
+            if model is None:
+                logging.info(f"Loading model: {model_name} ({backend} backend)")
+                model = BACKENDS[backend](model_name)
+                _models[key] = model
+    return get_tokenizer(model_name), model
+
+def loaded_models() -> List[str]:
+    """Checkpoints currently held in the registry, as "backend:model" """
+    return list(_models)
+
+def warm_up(model_names: Iterable[str] = (DEFAULT_MODEL,),
+            background: bool = True) -> Optional[threading.Thread]:
+    """
+    Load the given checkpoints ahead of the first request.
+    Args:
+        model_names: Checkpoints to load
+        background: Load in a daemon thread and return it instead of blocking
+    Returns:
+        The loader thread when background is True, otherwise None
+    """
+    def _load():
+        for name in model_names:
+            try:
+                get_model(name)
+            except Exception as e:
+                logging.error(f"Warm-up failed for {name}: {str(e)}")
+
+    if not background:
+        _load()
+        return None
+    thread = threading.Thread(target=_load, name="summarizer-warm-up", daemon=True)
+    thread.start()
+    return thread
 
 def clean_summary(summary: str) -> str:
     """
@@ -22,140 +192,701 @@ def clean_summary(summary: str) -> str:
     else:
         return summary.strip()
 
-def summarize(text: str, max_length: int = 150, min_length: int = 50) -> str:
+def summarize(text: str, max_length: int = 150, min_length: int = 50,
+              model_name: str = DEFAULT_MODEL, profile: str = DEFAULT_PROFILE) -> str:
     """
     Summarize a single chunk of text using T5 model
     Args:
         text: Input text to summarize
         max_length: Maximum length of summary (in tokens)
         min_length: Minimum length of summary (in tokens)
+        model_name: Checkpoint to use from the model registry
+        profile: Name of the decoding profile in GENERATION_PROFILES
     Returns:
         Generated summary text
     """
-    try:
-        input_text = "summarize: " + text
-        inputs = tokenizer.encode(
-            input_text,
+    return summarize_batch([text], max_length=max_length, min_length=min_length,
+                           model_name=model_name, settings=generation_settings(profile))[0]
+
+def summarize_batch(texts: List[str], max_length: int = 150, min_length: int = 50,
+                    model_name: str = DEFAULT_MODEL,
+                    input_ids: Optional[List[List[int]]] = None,
+                    cancel_token: Optional[CancellationToken] = None,
+                    settings: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    Summarize several chunks of text with a single padded generate() call.
+    Chunks already in the summary cache are not sent to the model.
+    Args:
+        texts: Input chunks to summarize
+        max_length: Maximum length of each summary (in tokens)
+        min_length: Minimum length of each summary (in tokens)
+        model_name: Checkpoint to use from the model registry
+        input_ids: Token ids of each chunk (from split_text_ids), so the
+            chunks are not tokenized a second time
+        cancel_token: Stops generation at the next decoding step once cancelled
+        settings: model.generate decoding settings (see generation_settings);
+            GENERATION_SETTINGS by default
+    Returns:
+        Generated summaries, in the same order as texts
+    """
+    settings = settings if settings is not None else GENERATION_SETTINGS
+    cache = _summary_cache
+    generate = _worker_pool.generate_batch if _worker_pool is not None else _generate_batch
+    if cache is None:
+        return generate(texts, max_length, min_length, model_name, input_ids,
+                        cancel_token=cancel_token, settings=settings)
+
+    keys = [
+        make_key("chunk", text, model=model_name, backend=_backend, max_length=max_length,
+                 min_length=min_length, **settings)
+        for text in texts
+    ]
+    summaries = [cache.get(key) for key in keys]
+    missing = [i for i, summary in enumerate(summaries) if summary is None]
+    if missing:
+        generated = generate(
+            [texts[i] for i in missing], max_length, min_length, model_name,
+            [input_ids[i] for i in missing] if input_ids is not None else None,
+            cancel_token=cancel_token, settings=settings
+        )
+        for i, summary in zip(missing, generated):
+            summaries[i] = summary
+            cache.put(keys[i], summary)
+    return summaries
+
+def _encode_batch(tokenizer, texts: List[str], input_ids: Optional[List[List[int]]]):
+    """Padded model inputs for "summarize: <chunk>", truncated to 512 tokens"""
+    if input_ids is None:
+        return tokenizer(
+            ["summarize: " + text for text in texts],
             return_tensors="pt",
             max_length=512,
-            truncation=True
+            truncation=True,
+            padding=True
         )
+    prefix = tokenizer.encode("summarize:", add_special_tokens=False)
+    budget = 512 - len(prefix) - 1
+    features = [prefix + ids[:budget] + [tokenizer.eos_token_id] for ids in input_ids]
+    return tokenizer.pad({"input_ids": features}, padding=True, return_tensors="pt")
+
+def _cancel_criteria(cancel_token: CancellationToken):
+    """Stopping criteria that ends model.generate at the step after a cancel"""
+    import torch
+    from transformers import StoppingCriteria, StoppingCriteriaList
+
+    class _Cancelled(StoppingCriteria):
+        def __call__(self, input_ids, scores, **kwargs):
+            return torch.full((input_ids.shape[0],), cancel_token.cancelled,
+                              dtype=torch.bool, device=input_ids.device)
+
+    return StoppingCriteriaList([_Cancelled()])
+
+def _generate_batch(texts: List[str], max_length: int, min_length: int,
+                    model_name: str, input_ids: Optional[List[List[int]]] = None,
+                    streamer: Any = None,
+                    cancel_token: Optional[CancellationToken] = None,
+                    settings: Optional[Dict[str, Any]] = None) -> List[str]:
+    check(cancel_token)
+    try:
+        tokenizer, model = get_model(model_name)
+        with profiling.span("encode", chunks=len(texts)):
+            inputs = _encode_batch(tokenizer, texts, input_ids)
         
-        summary_ids = model.generate(
-            inputs,
-            max_length=max_length,
-            min_length=min_length,
-            num_beams=4,
-            length_penalty=2.0,
-            early_stopping=True
-        )
-        summary = tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-        return clean_summary(summary)
+        settings = dict(settings if settings is not None else GENERATION_SETTINGS)
+        if streamer is not None:
+            # Token streamers only support greedy decoding of a single sequence
+            settings.update(num_beams=1, early_stopping=False, streamer=streamer)
+        if cancel_token is not None:
+            settings["stopping_criteria"] = _cancel_criteria(cancel_token)
+        with profiling.span("generate", chunks=len(texts), max_length=max_length):
+            summary_ids = model.generate(
+                inputs["input_ids"],
+                attention_mask=inputs["attention_mask"],
+                max_length=max_length,
+                min_length=min_length,
+                **settings
+            )
+        if profiling.enabled():
+            profiling.count("generate_calls")
+            profiling.count("input_tokens", int(inputs["attention_mask"].sum()))
+            profiling.count("generated_tokens", int((summary_ids != tokenizer.pad_token_id).sum()))
+            profiling.observe("generate_batch_chunks", len(texts), buckets=(1, 2, 4, 8, 16, 32))
+        # Output cut short by a cancel must not be returned (or cached)
+        check(cancel_token)
+        with profiling.span("decode", chunks=len(texts)):
+            summaries = tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+        return [clean_summary(summary) for summary in summaries]
+    except OperationCancelled:
+        raise
     except Exception as e:
         logging.error(f"Error summarizing chunk: {str(e)}")
         raise RuntimeError(f"Summarization failed: {str(e)}")
 
-def split_text(text: str, max_tokens: int = 500) -> List[str]:
+def split_text(text: str, max_tokens: int = 500, model_name: str = DEFAULT_MODEL,
+               cancel_token: Optional[CancellationToken] = None) -> List[str]:
     """
     Split text into chunks of approximately max_tokens length
     respecting sentence boundaries
     """
+    return [chunk for chunk, _ in split_text_ids(text, max_tokens, model_name, cancel_token)]
+
+def split_text_ids(text: str, max_tokens: int = 500,
+                   model_name: str = DEFAULT_MODEL,
+                   cancel_token: Optional[CancellationToken] = None) -> List[Tuple[str, List[int]]]:
+    """
+    Split text like split_text, returning each chunk with its token ids.
+    All sentences are tokenized in one batched call and the ids are kept,
+    so generation does not need to encode the chunks again.
+    """
+    return split_sections_ids([text], max_tokens=max_tokens, model_name=model_name,
+                              cancel_token=cancel_token)
+
+def split_sections_ids(sections: Sequence[str], max_tokens: int = 500,
+                       model_name: str = DEFAULT_MODEL,
+                       cancel_token: Optional[CancellationToken] = None) -> List[Tuple[str, List[int]]]:
+    """
+    Split article sections into chunks with their token ids, like
+    split_text_ids, without letting a chunk straddle two sections:
+    consecutive sections share a chunk only when they fit in it whole.
+    """
     try:
-        sentences = sent_tokenize(text)
+        from nltk import sent_tokenize
+        check(cancel_token)
+        tokenizer = get_tokenizer(model_name)
+        with profiling.span("sentence_split", sections=len(sections)):
+            section_sentences = [sent_tokenize(section) for section in sections]
+        sentences = [sentence for group in section_sentences for sentence in group]
+        if not sentences:
+            return []
+        check(cancel_token)
+        with profiling.span("tokenize", sentences=len(sentences)):
+            all_ids = tokenizer(sentences, add_special_tokens=False)["input_ids"]
+        if profiling.enabled():
+            profiling.count("tokenized_tokens", sum(map(len, all_ids)))
+        sentence_ids = iter(all_ids)
+        check(cancel_token)
         chunks = []
         current_chunk = []
-        current_length = 0
+        current_ids = []
         
-        for sentence in sentences:
-            sentence_length = len(tokenizer.tokenize(sentence))
-            
-            if current_length + sentence_length > max_tokens and current_chunk:
-                chunks.append(" ".join(current_chunk))
+        for group in section_sentences:
+            group_ids = [next(sentence_ids) for _ in group]
+            if current_chunk and len(current_ids) + sum(map(len, group_ids)) > max_tokens:
+                chunks.append((" ".join(current_chunk), current_ids))
                 current_chunk = []
-                current_length = 0
-                
-            current_chunk.append(sentence)
-            current_length += sentence_length
+                current_ids = []
+
+            for sentence, ids in zip(group, group_ids):
+                if len(current_ids) + len(ids) > max_tokens and current_chunk:
+                    chunks.append((" ".join(current_chunk), current_ids))
+                    current_chunk = []
+                    current_ids = []
+                    
+                current_chunk.append(sentence)
+                current_ids.extend(ids)
             
         if current_chunk:
-            chunks.append(" ".join(current_chunk))
+            chunks.append((" ".join(current_chunk), current_ids))
             
         return chunks
         
+    except OperationCancelled:
+        raise
     except Exception as e:
         logging.error(f"Error splitting text: {str(e)}")
         raise RuntimeError(f"Text splitting failed: {str(e)}")
 
-def summarize_wikipedia(text: str, max_summary_length: int = 500) -> str:
+def _tier_settings(max_summary_length: int) -> Tuple[int, int, int, int]:
+    """(chunk_size, chunk_max_length, chunk_min_length, num_beams) for a summary size"""
+    if max_summary_length <= 1500:  # Small summary
+        return 300, 100, 50, 4  # Smaller chunks for more focused summaries
+    elif max_summary_length <= 3000:  # Medium summary
+        return 500, 150, 75, 4
+    else:  # Large summary (up to 6000 words)
+        return 800, 200, 100, 6
+
+def generation_settings(profile: str = DEFAULT_PROFILE, num_beams: Optional[int] = None) -> Dict[str, Any]:
+    """
+    model.generate settings for a named profile. Beam-search profiles use
+    at least num_beams beams (the size tier's beam count).
+    """
+    if profile not in GENERATION_PROFILES:
+        raise ValueError(f"Unknown generation profile {profile!r}; choose from {sorted(GENERATION_PROFILES)}")
+    settings = dict(GENERATION_PROFILES[profile])
+    if num_beams is not None and settings["num_beams"] > 1:
+        settings["num_beams"] = max(settings["num_beams"], num_beams)
+    return settings
+
+def _generation_plan(max_summary_length: int, profile: str) -> Tuple[int, int, int, Dict[str, Any]]:
+    """(chunk_size, chunk_max_length, chunk_min_length, settings) for a summary size and profile"""
+    chunk_size, chunk_max_length, chunk_min_length, num_beams = _tier_settings(max_summary_length)
+    scale = PROFILE_LENGTH_SCALE.get(profile, 1.0)
+    return (chunk_size, int(chunk_max_length * scale), int(chunk_min_length * scale),
+            generation_settings(profile, num_beams))
+
+def _combine_summaries(summaries: List[str], max_summary_length: int) -> str:
+    """Join chunk summaries, trim to max_summary_length words and check the result"""
+    combined = " ".join(summaries)
+    words = combined.split()
+    
+    if len(words) > max_summary_length:
+        combined = " ".join(words[:max_summary_length])
+        
+    # Final quality check
+    if len(combined.split()) < max_summary_length * 0.8:
+        raise ValueError(f"Failed to generate sufficient summary content "
+                       f"(requested: {max_summary_length}, got: {len(combined.split())})")
+
+    logging.info(f"Generated summary: {len(combined.split())} words "
+                f"(requested: {max_summary_length})")
+    
+    # Clean the final summary
+    return clean_summary(combined)
+
+def _summary_failure(error: Exception) -> RuntimeError:
+    logging.error(f"Error in summarize_wikipedia: {str(error)}")
+    return RuntimeError(f"Wikipedia summarization failed: {str(error)}")
+
+# An article is either its text, or the texts of its sections (see sections.py),
+# which are chunked along section boundaries
+Article = Union[str, Sequence[str]]
+
+def _summary_key(article: Article, **params) -> str:
+    if isinstance(article, str):
+        return make_key("summary", article, **params)
+    return make_key("summary", "\x1e".join(article), sections=len(article), **params)
+
+def _split_article(article: Article, max_tokens: int, model_name: str,
+                   cancel_token: Optional[CancellationToken]) -> List[Tuple[str, List[int]]]:
+    text = article if isinstance(article, str) else " ".join(article)
+    if not text or len(text.strip()) < 10:
+        raise ValueError("Input text is too short or empty")
+    if isinstance(article, str):
+        return split_text_ids(article, max_tokens=max_tokens, model_name=model_name,
+                              cancel_token=cancel_token)
+    return split_sections_ids(article, max_tokens=max_tokens, model_name=model_name,
+                              cancel_token=cancel_token)
+
+def summarize_wikipedia(text: Article, max_summary_length: int = 500,
+                        batch_size: int = DEFAULT_BATCH_SIZE,
+                        model_name: str = DEFAULT_MODEL,
+                        cancel_token: Optional[CancellationToken] = None,
+                        profile: str = DEFAULT_PROFILE) -> str:
     """
     Generate a summary of specified length from Wikipedia text
     Args:
-        text: Full Wikipedia article text
+        text: Full Wikipedia article text, or the texts of its sections
         max_summary_length: Desired approximate word count for summary
+        batch_size: Number of chunks summarized per generate() call
+        model_name: Checkpoint to use from the model registry
+        cancel_token: Abandons the work (OperationCancelled) within one
+            generation step of being cancelled or timing out
+        profile: Name of the decoding profile in GENERATION_PROFILES
     Returns:
         Generated summary text
     """
+    result = summarize_articles([text], max_summary_length=max_summary_length,
+                                batch_size=batch_size, model_name=model_name,
+                                cancel_token=cancel_token, profile=profile)[0]
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+def iter_summarize_wikipedia(text: Article, max_summary_length: int = 500,
+                             batch_size: int = DEFAULT_BATCH_SIZE,
+                             model_name: str = DEFAULT_MODEL,
+                             streamer: Any = None,
+                             cancel_token: Optional[CancellationToken] = None,
+                             profile: str = DEFAULT_PROFILE) -> Generator[str, None, str]:
+    """
+    Streaming version of summarize_wikipedia: yields each chunk summary as
+    soon as its batch is generated, and returns the final summary (the
+    StopIteration value) once enough material has been produced.
+    Args:
+        text: Full Wikipedia article text
+        max_summary_length: Desired approximate word count for summary
+        batch_size: Number of chunks summarized per generate() call
+        model_name: Checkpoint to use from the model registry
+        streamer: Optional transformers streamer (e.g. TextIteratorStreamer)
+            that also receives tokens as they are generated. Chunks are then
+            generated one at a time with greedy decoding and are not cached.
+        cancel_token: Abandons the work (OperationCancelled) within one
+            generation step of being cancelled or timing out
+        profile: Name of the decoding profile in GENERATION_PROFILES
+    """
     try:
-        if not text or len(text.strip()) < 10:
+        if not text or (isinstance(text, str) and len(text.strip()) < 10):
             raise ValueError("Input text is too short or empty")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        chunk_size, chunk_max_length, chunk_min_length, settings = _generation_plan(max_summary_length, profile)
+        cache = _summary_cache
+        summary_key = _summary_key(text, model=model_name, backend=_backend,
+                                   max_summary_length=max_summary_length, **settings)
+        if cache is not None and streamer is None:
+            cached = cache.get(summary_key)
+            if cached is not None:
+                return cached
 
-        # Adjust parameters based on requested summary size
-        if max_summary_length <= 1500:  # Small summary
-            chunk_size = 300  # Smaller chunks for more focused summaries
-            chunk_max_length = 100
-            chunk_min_length = 50
-            num_beams = 4
-        elif max_summary_length <= 3000:  # Medium summary
-            chunk_size = 500
-            chunk_max_length = 150
-            chunk_min_length = 75
-            num_beams = 4
-        else:  # Large summary (up to 6000 words)
-            chunk_size = 800
-            chunk_max_length = 200
-            chunk_min_length = 100
-            num_beams = 6
-
-        # Split into appropriate chunks
-        chunks = split_text(text, max_tokens=chunk_size)
+        chunks = _split_article(text, max_tokens=chunk_size, model_name=model_name,
+                                cancel_token=cancel_token)
         if not chunks:
             raise ValueError("Failed to split text into chunks")
 
-        # Summarize each chunk
+        step = 1 if streamer is not None else batch_size
         summaries = []
         total_words = 0
-        for chunk in chunks:
-            summary = summarize(
-                chunk,
-                max_length=chunk_max_length,
-                min_length=chunk_min_length
-            )
-            summaries.append(summary)
-            total_words += len(summary.split())
-            
+        for start in range(0, len(chunks), step):
+            check(cancel_token)
+            batch = chunks[start:start + step]
+            texts = [chunk for chunk, _ in batch]
+            ids = [chunk_ids for _, chunk_ids in batch]
+            if streamer is None:
+                batch_summaries = summarize_batch(texts, max_length=chunk_max_length,
+                                                  min_length=chunk_min_length,
+                                                  model_name=model_name, input_ids=ids,
+                                                  cancel_token=cancel_token, settings=settings)
+            else:
+                batch_summaries = _generate_batch(texts, chunk_max_length, chunk_min_length,
+                                                  model_name, ids, streamer=streamer,
+                                                  cancel_token=cancel_token, settings=settings)
+            for summary in batch_summaries:
+                summaries.append(summary)
+                total_words += len(summary.split())
+                yield summary
+
             # Early stopping if we have enough material
             if total_words >= max_summary_length * 1.2:
                 break
 
-        # Combine and trim to exact length
-        combined = " ".join(summaries)
-        words = combined.split()
-        
-        if len(words) > max_summary_length:
-            combined = " ".join(words[:max_summary_length])
-            
-        # Final quality check
-        if len(combined.split()) < max_summary_length * 0.8:
-            raise ValueError(f"Failed to generate sufficient summary content "
-                           f"(requested: {max_summary_length}, got: {len(combined.split())})")
+        combined = _combine_summaries(summaries, max_summary_length)
+        if cache is not None and streamer is None:
+            cache.put(summary_key, combined)
+        return combined
 
-        logging.info(f"Generated summary: {len(combined.split())} words "
-                    f"(requested: {max_summary_length})")
-        
-        # Clean the final summary
-        return clean_summary(combined)
+    except OperationCancelled:
+        raise
+    except Exception as e:
+        raise _summary_failure(e)
+
+def summarize_articles(texts: List[Article], max_summary_length: int = 500,
+                       batch_size: int = DEFAULT_BATCH_SIZE,
+                       model_name: str = DEFAULT_MODEL,
+                       cancel_token: Optional[CancellationToken] = None,
+                       profile: str = DEFAULT_PROFILE) -> List[Union[str, Exception]]:
+    """
+    Summarize several articles, packing chunks from different articles into
+    the same generate() batches. Each article stops taking chunks once it
+    has enough material, exactly as in summarize_wikipedia.
+    Args:
+        texts: Full Wikipedia article texts, or lists of their section texts
+        max_summary_length: Desired approximate word count for each summary
+        batch_size: Number of chunks summarized per generate() call
+        model_name: Checkpoint to use from the model registry
+        cancel_token: Abandons all remaining work (OperationCancelled)
+        profile: Name of the decoding profile in GENERATION_PROFILES
+    Returns:
+        One entry per article: the summary, or the RuntimeError that
+        summarize_wikipedia would have raised for it
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    # Adjust parameters based on requested summary size and decoding profile
+    chunk_size, chunk_max_length, chunk_min_length, settings = _generation_plan(max_summary_length, profile)
+    cache = _summary_cache
+    results: List[Union[str, Exception, None]] = [None] * len(texts)
+    summary_keys: Dict[int, str] = {}
+    chunk_lists: Dict[int, List[Tuple[str, List[int]]]] = {}
+
+    for i, text in enumerate(texts):
+        try:
+            if not text or (isinstance(text, str) and len(text.strip()) < 10):
+                raise ValueError("Input text is too short or empty")
+
+            # Chunk boundaries, and so the output, do not depend on batch_size
+            summary_keys[i] = _summary_key(text, model=model_name, backend=_backend,
+                                           max_summary_length=max_summary_length, **settings)
+            if cache is not None:
+                cached = cache.get(summary_keys[i])
+                if cached is not None:
+                    results[i] = cached
+                    continue
+
+            # Split into appropriate chunks
+            chunks = _split_article(text, max_tokens=chunk_size, model_name=model_name,
+                                    cancel_token=cancel_token)
+            if not chunks:
+                raise ValueError("Failed to split text into chunks")
+            chunk_lists[i] = chunks
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            results[i] = _summary_failure(e)
+
+    # Summarize chunks in micro-batches shared by all unfinished articles
+    next_chunk = {i: 0 for i in chunk_lists}
+    summaries: Dict[int, List[str]] = {i: [] for i in chunk_lists}
+    total_words = {i: 0 for i in chunk_lists}
+    while next_chunk:
+        check(cancel_token)
+        batch, batch_ids, owners = [], [], []
+        for i in list(next_chunk):
+            chunks = chunk_lists[i]
+            while next_chunk[i] < len(chunks) and len(batch) < batch_size:
+                chunk, ids = chunks[next_chunk[i]]
+                batch.append(chunk)
+                batch_ids.append(ids)
+                owners.append(i)
+                next_chunk[i] += 1
+            if len(batch) == batch_size:
+                break
 
+        try:
+            batch_summaries = summarize_batch(
+                batch,
+                max_length=chunk_max_length,
+                min_length=chunk_min_length,
+                model_name=model_name,
+                input_ids=batch_ids,
+                cancel_token=cancel_token,
+                settings=settings
+            )
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            for i in set(owners):
+                results[i] = _summary_failure(e)
+                del next_chunk[i]
+            continue
+
+        for i, summary in zip(owners, batch_summaries):
+            summaries[i].append(summary)
+            total_words[i] += len(summary.split())
+
+        for i in dict.fromkeys(owners):
+            # Early stopping if we have enough material
+            done = next_chunk[i] == len(chunk_lists[i])
+            if not done and total_words[i] < max_summary_length * 1.2:
+                continue
+            del next_chunk[i]
+            try:
+                results[i] = _combine_summaries(summaries[i], max_summary_length)
+                if cache is not None:
+                    cache.put(summary_keys[i], results[i])
+            except Exception as e:
+                results[i] = _summary_failure(e)
+
+    return results
+
+def _summarize_level(chunks: List[Tuple[str, List[int]]], max_length: int, min_length: int,
+                     batch_size: int, model_name: str,
+                     cancel_token: Optional[CancellationToken],
+                     settings: Dict[str, Any]) -> List[str]:
+    summaries = []
+    for start in range(0, len(chunks), batch_size):
+        batch = chunks[start:start + batch_size]
+        summaries.extend(summarize_batch(
+            [chunk for chunk, _ in batch], max_length=max_length, min_length=min_length,
+            model_name=model_name, input_ids=[ids for _, ids in batch],
+            cancel_token=cancel_token, settings=settings
+        ))
+    return summaries
+
+def _keep_salient(chunks: List[Tuple[str, List[int]]], limit: Optional[int]) -> List[Tuple[str, List[int]]]:
+    if limit is None or len(chunks) <= limit:
+        return chunks
+    from extractive import top_passages
+    return [chunks[i] for i in top_passages([chunk for chunk, _ in chunks], limit)]
+
+def _share_lengths(max_summary_length: int, n_chunks: int, chunk_size: int) -> Tuple[int, int]:
+    # Generation lengths (tokens) that give each of n_chunks summaries an equal
+    # share of the target word count, at about 1.3 tokens per word
+    share = max_summary_length * 1.1 / n_chunks
+    max_length = max(20, min(int(share * 1.6), chunk_size))
+    min_length = max(10, min(int(share * 1.3), max_length - 5))
+    return max_length, min_length
+
+def summarize_hierarchical(text: str, max_summary_length: int = 500,
+                           batch_size: int = DEFAULT_BATCH_SIZE,
+                           model_name: str = DEFAULT_MODEL,
+                           top_k: Optional[int] = None,
+                           group_size: int = 32,
+                           max_levels: int = 3,
+                           cancel_token: Optional[CancellationToken] = None,
+                           profile: str = DEFAULT_PROFILE) -> str:
+    """
+    Map-reduce summary of a whole article, without truncating it first.
+    Every chunk is summarized (map), then the joined chunk summaries are
+    re-chunked and summarized again (reduce) until they fit the target
+    length. Each level sizes its chunk summaries so that every group_size
+    of them add up to about max_summary_length: a level with more chunks
+    than that yields one target-length summary per group for the next
+    level to reduce, so no chunk is dropped and each level's output stays
+    bounded.
+    Args:
+        text: Full Wikipedia article text
+        max_summary_length: Desired approximate word count for summary
+        batch_size: Number of chunks summarized per generate() call
+        model_name: Checkpoint to use from the model registry
+        top_k: Only summarize the k most salient chunks of the article
+        group_size: Chunk summaries reduced toward one target-length summary
+        max_levels: Maximum number of summarization passes
+        cancel_token: Abandons the work (OperationCancelled) when cancelled
+        profile: Name of the decoding profile in GENERATION_PROFILES
+    Returns:
+        Generated summary text
+    """
+    try:
+        if not text or len(text.strip()) < 10:
+            raise ValueError("Input text is too short or empty")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if group_size < 1:
+            raise ValueError("group_size must be at least 1")
+
+        chunk_size, chunk_max_length, chunk_min_length, settings = _generation_plan(max_summary_length, profile)
+        cache = _summary_cache
+        summary_key = make_key("hierarchical", text, model=model_name, backend=_backend,
+                               max_summary_length=max_summary_length, top_k=top_k,
+                               group_size=group_size,
+                               max_levels=max_levels, **settings)
+        if cache is not None:
+            cached = cache.get(summary_key)
+            if cached is not None:
+                return cached
+
+        chunks = split_text_ids(text, max_tokens=chunk_size, model_name=model_name,
+                                cancel_token=cancel_token)
+        if not chunks:
+            raise ValueError("Failed to split text into chunks")
+        chunks = _keep_salient(chunks, top_k)
+
+        # Map: summarize every (kept) chunk of the article; when only a few
+        # chunks are kept, lengthen their summaries so together they reach the target
+        share_max, share_min = _share_lengths(max_summary_length, min(len(chunks), group_size), chunk_size)
+        summaries = _summarize_level(chunks, max(chunk_max_length, share_max),
+                                     max(chunk_min_length, share_min),
+                                     batch_size, model_name, cancel_token, settings)
+        level = 1
+        while (sum(len(summary.split()) for summary in summaries) > max_summary_length * 1.2
+               and level < max_levels):
+            # Reduce: re-chunk the joined summaries and aim each new summary at
+            # an equal share of the target length, per group of group_size
+            chunks = split_text_ids(" ".join(summaries), max_tokens=chunk_size,
+                                    model_name=model_name, cancel_token=cancel_token)
+            max_length, min_length = _share_lengths(max_summary_length, min(len(chunks), group_size),
+                                                    chunk_size)
+            summaries = _summarize_level(chunks, max_length, min_length,
+                                         batch_size, model_name, cancel_token, settings)
+            level += 1
+
+        logging.info(f"Hierarchical summary used {level} level(s)")
+        combined = _combine_summaries(summaries, max_summary_length)
+        if cache is not None:
+            cache.put(summary_key, combined)
+        return combined
+
+    except OperationCancelled:
+        raise
     except Exception as e:
-        logging.error(f"Error in summarize_wikipedia: {str(e)}")
-        raise RuntimeError(f"Wikipedia summarization failed: {str(e)}")
+        raise _summary_failure(e)
 
+def hybrid_token_budget(max_summary_length: int, profile: str = DEFAULT_PROFILE) -> int:
+    """
+    Default pre-filter budget of summarize_hybrid: enough full chunks that
+    even their shortest summaries (chunk_min_length tokens, at about 1.3
+    tokens per word) reach the 0.8 * max_summary_length words that
+    _combine_summaries requires.
+    """
+    chunk_size, _, chunk_min_length, _ = _generation_plan(max_summary_length, profile)
+    min_words = max(1, int(chunk_min_length / 1.3))
+    n_chunks = -(-int(max_summary_length * 0.8) // min_words)  # ceil
+    return n_chunks * chunk_size
+
+def _scored_sentences(text: str, method: str) -> Tuple[List[str], Any]:
+    from nltk import sent_tokenize
+    from extractive import SCORERS
+    if method not in SCORERS:
+        raise ValueError(f"Unknown extractive method {method!r}; choose from {sorted(SCORERS)}")
+    sentences = sent_tokenize(text)
+    if not sentences:
+        raise ValueError("Input text is too short or empty")
+    return sentences, SCORERS[method](sentences)
+
+def summarize_extractive(text: str, max_summary_length: int = 500,
+                         method: str = "textrank") -> str:
+    """
+    Purely extractive summary: the highest-ranked sentences of the article,
+    in article order, up to max_summary_length words. No model is loaded.
+    Args:
+        text: Full Wikipedia article text
+        max_summary_length: Maximum word count for summary
+        method: Sentence scorer, "textrank" or "tfidf"
+    Returns:
+        Summary made of sentences copied from the article
+    """
+    try:
+        if not text or len(text.strip()) < 10:
+            raise ValueError("Input text is too short or empty")
+        from extractive import select_within_budget
+        sentences, scores = _scored_sentences(text, method)
+        lengths = [len(sentence.split()) for sentence in sentences]
+        chosen = select_within_budget(scores, lengths, max_summary_length)
+        return " ".join(sentences[i] for i in chosen)
+    except Exception as e:
+        raise _summary_failure(e)
+
+def extract_salient_text(text: str, max_tokens: int, model_name: str = DEFAULT_MODEL,
+                         method: str = "textrank",
+                         cancel_token: Optional[CancellationToken] = None) -> str:
+    """
+    Keep the highest-ranked sentences of text, in article order, up to
+    max_tokens model tokens. Text already within the budget is returned as is.
+    """
+    from extractive import select_within_budget
+    sentences, scores = _scored_sentences(text, method)
+    check(cancel_token)
+    lengths = [len(ids) for ids in get_tokenizer(model_name)(sentences, add_special_tokens=False)["input_ids"]]
+    if sum(lengths) <= max_tokens:
+        return text
+    chosen = select_within_budget(scores, lengths, max_tokens)
+    logging.info(f"Extractive pre-filter kept {len(chosen)} of {len(sentences)} sentences")
+    return " ".join(sentences[i] for i in chosen)
+
+def summarize_hybrid(text: str, max_summary_length: int = 500,
+                     token_budget: Optional[int] = None,
+                     batch_size: int = DEFAULT_BATCH_SIZE,
+                     model_name: str = DEFAULT_MODEL,
+                     method: str = "textrank",
+                     cancel_token: Optional[CancellationToken] = None,
+                     profile: str = DEFAULT_PROFILE) -> str:
+    """
+    Extractive pre-filter followed by abstractive summarization: only the
+    top-ranked sentences, up to token_budget tokens, are summarized by T5.
+    Args:
+        text: Full Wikipedia article text
+        max_summary_length: Desired approximate word count for summary
+        token_budget: Model tokens kept by the pre-filter; defaults to
+            hybrid_token_budget(max_summary_length, profile)
+        batch_size: Number of chunks summarized per generate() call
+        model_name: Checkpoint to use from the model registry
+        method: Sentence scorer, "textrank" or "tfidf"
+        cancel_token: Abandons the work (OperationCancelled) when cancelled
+        profile: Name of the decoding profile in GENERATION_PROFILES
+    Returns:
+        Generated summary text
+    """
+    try:
+        if not text or len(text.strip()) < 10:
+            raise ValueError("Input text is too short or empty")
+        budget = token_budget or hybrid_token_budget(max_summary_length, profile)
+        text = extract_salient_text(text, budget, model_name=model_name, method=method,
+                                    cancel_token=cancel_token)
+    except OperationCancelled:
+        raise
+    except Exception as e:
+        raise _summary_failure(e)
+    return summarize_wikipedia(text, max_summary_length=max_summary_length, batch_size=batch_size,
+                               model_name=model_name, cancel_token=cancel_token, profile=profile)
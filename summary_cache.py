@@ -0,0 +1,97 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def make_key(kind: str, text: str, **params: Any) -> str:
+    """
+    Build a cache key from a text and the parameters that shape its summary
+    (model name, lengths, generation settings).
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    settings = json.dumps(params, sort_keys=True, default=str)
+    return f"{kind}:{digest}:{hashlib.sha256(settings.encode('utf-8')).hexdigest()[:16]}"
+
+
+class SummaryCache:
+    """
+    Two-tier cache of generated summaries.
+
+    The first tier is an in-memory LRU of max_entries items. If path is
+    given, a SQLite file holds every entry as a second tier that survives
+    restarts; disk hits are promoted back into memory.
+    """
+
+    def __init__(self, max_entries: int = 512, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path is not None:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries (key TEXT PRIMARY KEY, summary TEXT NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            summary = self._memory.get(key)
+            if summary is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return summary
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT summary FROM summaries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, summary: str) -> None:
+        with self._lock:
+            self._remember(key, summary)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO summaries (key, summary) VALUES (?, ?)", (key, summary)
+                )
+                self._conn.commit()
+
+    def _remember(self, key: str, summary: str) -> None:
+        self._memory[key] = summary
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM summaries")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
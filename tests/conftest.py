@@ -0,0 +1,28 @@
+"""
+Shared fixtures. The tests run offline and without torch: model calls are
+replaced with stubs and Wikipedia with the fakes in benchmarks/fakes.py.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import summarizer  # noqa: E402
+import wikibot  # noqa: E402
+from summary_cache import SummaryCache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_state():
+    """Fresh summary cache and no article cache, client pool or title index."""
+    summarizer.set_summary_cache(SummaryCache())
+    wikibot.set_article_cache(None)
+    wikibot.set_client_pool(None)
+    yield
+    wikibot.set_client_pool(None)
+    for language in list(wikibot._title_indexes):
+        wikibot.set_title_index(None, language)
@@ -0,0 +1,50 @@
+import os
+
+from article_cache import ArticleCache
+from benchmarks.fakes import FakeMediaWikiServer, FakeWikipedia
+from wiki_pool import ClientPool
+from wikibot import fetch_wikipedia_sections
+
+ARTICLES = {
+    "RAM": "Random-access memory is a form of electronic computer memory that can be read and changed in any order.",
+    "Ram": "A ram is an uncastrated male sheep, and the word is also used for several other animals and machines.",
+}
+
+
+def test_canonical_titles_are_cached_case_sensitively_and_per_language(tmp_path):
+    cache = ArticleCache(os.path.join(tmp_path, "articles.sqlite3"))
+    with FakeMediaWikiServer(ARTICLES) as server:
+        pool = ClientPool(api_url=server.api_url, rate=None)
+        ram = fetch_wikipedia_sections("RAM", cache=cache, pool=pool)
+        sheep = fetch_wikipedia_sections("Ram", cache=cache, pool=pool)
+        assert "memory" in ram.content and "sheep" in sheep.content
+
+        french = fetch_wikipedia_sections("RAM", cache=cache, pool=pool, language="fr")
+        assert "memory" in french.content
+        assert server.requests["extracts"] == 3  # Not served from the English entry
+        pool.close()
+    cache.close()
+
+
+def test_cache_hits_need_no_request(tmp_path):
+    path = os.path.join(tmp_path, "articles.sqlite3")
+    with FakeMediaWikiServer(ARTICLES) as server:
+        pool = ClientPool(api_url=server.api_url, rate=None)
+        assert not isinstance(fetch_wikipedia_sections("ram", cache=ArticleCache(path), pool=pool), str)
+        api_url = server.api_url
+        pool.close()
+
+    # The server is gone: a new process resolves "ram" from the cache file alone
+    offline = ClientPool(api_url=api_url, rate=None, timeout=1)
+    article = fetch_wikipedia_sections("ram", cache=ArticleCache(path), pool=offline)
+    assert not isinstance(article, str), article
+    assert "sheep" in article.content
+
+
+def test_explicit_client_keeps_case_folded_keys(tmp_path):
+    cache = ArticleCache(os.path.join(tmp_path, "articles.sqlite3"))
+    client = FakeWikipedia({"Quantum Computing": ARTICLES["RAM"]})
+    fetch_wikipedia_sections("quantum computing", client=client, cache=cache)
+    fetch_wikipedia_sections("QUANTUM COMPUTING", client=client, cache=cache)
+    assert client.requests["extracts"] == 1
+    cache.close()
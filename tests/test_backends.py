@@ -0,0 +1,36 @@
+import os
+import sys
+import types
+
+import summarizer
+
+
+class FakeORTModel:
+    """Records ORTModelForSeq2SeqLM.from_pretrained calls; saves a placeholder file."""
+    loads = []
+
+    @classmethod
+    def from_pretrained(cls, name, export=False):
+        cls.loads.append((name, export))
+        return cls()
+
+    def save_pretrained(self, path):
+        with open(os.path.join(path, "encoder_model.onnx"), "w") as f:
+            f.write("onnx")
+
+
+def test_onnx_model_is_exported_once_and_then_loaded_from_disk(monkeypatch, tmp_path):
+    onnxruntime = types.ModuleType("optimum.onnxruntime")
+    onnxruntime.ORTModelForSeq2SeqLM = FakeORTModel
+    monkeypatch.setitem(sys.modules, "optimum", types.ModuleType("optimum"))
+    monkeypatch.setitem(sys.modules, "optimum.onnxruntime", onnxruntime)
+    monkeypatch.setattr(summarizer, "ONNX_MODEL_DIR", str(tmp_path))
+    monkeypatch.setattr(FakeORTModel, "loads", [])
+
+    summarizer._load_onnx("google/t5-base")
+    summarizer._load_onnx("google/t5-base")
+
+    saved = os.path.join(str(tmp_path), "google--t5-base")
+    assert FakeORTModel.loads == [("google/t5-base", True), (saved, False), (saved, False)]
+    assert os.listdir(str(tmp_path)) == ["google--t5-base"]  # No export left half-done
+    assert os.listdir(saved) == ["encoder_model.onnx"]
@@ -0,0 +1,30 @@
+import io
+import json
+
+import batch
+from benchmarks.fakes import FakeMediaWikiServer
+from wiki_pool import ClientPool
+
+
+def fake_summaries(texts, **kwargs):
+    return [f"Summary of {len(text)} sections." for text in texts]
+
+
+def test_run_batch_fetches_through_the_pool_without_a_client(monkeypatch):
+    monkeypatch.setattr(batch, "summarize_articles", fake_summaries)
+    with FakeMediaWikiServer() as server:
+        titles = sorted(server.articles)[:3]
+        topics = [titles[0].lower(), titles[1].replace(" ", "_"), titles[2], "No such page anywhere"]
+        pool = ClientPool(api_url=server.api_url, rate=None)
+        output = io.StringIO()
+
+        stats = batch.run_batch(topics, output, concurrency=2, pool=pool)
+        pool.close()
+
+        records = {record["topic"]: record for record in map(json.loads, output.getvalue().splitlines())}
+        assert stats["succeeded"] == 3 and stats["failed"] == 1
+        assert all("summary" in records[topic] for topic in topics[:3])
+        assert "not found" in records["No such page anywhere"]["error"]
+        # One bulk request for all four topics, plus the title-case retry of the missing one
+        assert server.requests["resolve"] == 2
+        assert server.requests["extracts"] == 3
@@ -0,0 +1,91 @@
+"""CPU work stops promptly once a CancellationToken is cancelled."""
+import pytest
+
+import summarizer
+from cancellation import CancellationToken, OperationCancelled
+
+ARTICLE = "The first sentence is here. " * 200
+
+
+@pytest.fixture
+def no_model(monkeypatch):
+    """Fail loudly (and record it) if anything loads the tokenizer or model."""
+    loads = []
+
+    def load(model_name=summarizer.DEFAULT_MODEL, *args, **kwargs):
+        loads.append(model_name)
+        raise AssertionError("the model was used after cancel")
+
+    monkeypatch.setattr(summarizer, "get_tokenizer", load)
+    monkeypatch.setattr(summarizer, "get_model", load)
+    return loads
+
+
+def cancelled_token():
+    token = CancellationToken()
+    token.cancel()
+    return token
+
+
+def test_split_sections_ids_stops_before_tokenizing(no_model):
+    with pytest.raises(OperationCancelled):
+        summarizer.split_sections_ids([ARTICLE, ARTICLE], cancel_token=cancelled_token())
+    assert no_model == []
+
+
+@pytest.mark.parametrize("cache", [True, False])
+def test_summarize_batch_stops_before_generating(no_model, cache):
+    if not cache:
+        summarizer.set_summary_cache(None)
+    with pytest.raises(OperationCancelled):
+        summarizer.summarize_batch(["One chunk.", "Another chunk."], cancel_token=cancelled_token())
+    assert no_model == []
+
+
+def test_summarize_hierarchical_stops_before_chunking(no_model):
+    with pytest.raises(OperationCancelled):
+        summarizer.summarize_hierarchical(ARTICLE, cancel_token=cancelled_token())
+    assert no_model == []
+
+
+def test_generation_stops_within_one_step_of_cancel(monkeypatch):
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+
+    class StubTokenizer:
+        pad_token_id = 0
+
+        def __call__(self, texts, **kwargs):
+            ids = torch.ones((len(texts), 4), dtype=torch.long)
+            return {"input_ids": ids, "attention_mask": torch.ones_like(ids)}
+
+        def batch_decode(self, ids, skip_special_tokens=True):
+            return ["Unused." for _ in ids]
+
+    class SteppingModel:
+        """Decodes one token per step, polling stopping_criteria like model.generate."""
+
+        def __init__(self, token, cancel_at):
+            self.token = token
+            self.cancel_at = cancel_at
+            self.steps = 0
+
+        def generate(self, input_ids, attention_mask=None, max_length=20, min_length=0,
+                     stopping_criteria=None, **settings):
+            sequences = torch.zeros((input_ids.shape[0], 1), dtype=torch.long)
+            for step in range(1, max_length + 1):
+                self.steps = step
+                if step == self.cancel_at:
+                    self.token.cancel()  # e.g. the user pressed Cancel during this step
+                sequences = torch.cat([sequences, torch.full((input_ids.shape[0], 1), 5)], dim=1)
+                if stopping_criteria is not None and bool(stopping_criteria(sequences, None).all()):
+                    break
+            return sequences
+
+    token = CancellationToken()
+    model = SteppingModel(token, cancel_at=3)
+    monkeypatch.setattr(summarizer, "get_model", lambda model_name, backend=None: (StubTokenizer(), model))
+    with pytest.raises(OperationCancelled):
+        summarizer._generate_batch(["A chunk.", "Another chunk."], max_length=100, min_length=1,
+                                   model_name="stub", cancel_token=token)
+    assert model.steps <= model.cancel_at + 1
@@ -0,0 +1,70 @@
+"""split_text_ids picks the same chunk boundaries as the original per-sentence chunker."""
+import re
+
+import nltk
+import pytest
+
+import summarizer
+from benchmarks.corpus import build_article
+
+
+class StubTokenizer:
+    """Splits words and punctuation into tokens; ids are stable per token."""
+
+    def tokenize(self, text):
+        return re.findall(r"\w+|[^\w\s]", text)
+
+    def __call__(self, texts, add_special_tokens=True, **kwargs):
+        return {"input_ids": [[hash(token) % 32000 for token in self.tokenize(text)] for text in texts]}
+
+
+def split_sentences(text):
+    return [sentence for sentence in re.split(r"(?<=[.!?])\s+", text) if sentence]
+
+
+def per_sentence_chunks(text, max_tokens, tokenizer, sent_tokenize):
+    """The original split_text loop: tokenize and count each sentence on its own."""
+    chunks, current_chunk, current_length = [], [], 0
+    for sentence in sent_tokenize(text):
+        sentence_length = len(tokenizer.tokenize(sentence))
+        if current_length + sentence_length > max_tokens and current_chunk:
+            chunks.append(" ".join(current_chunk))
+            current_chunk, current_length = [], 0
+        current_chunk.append(sentence)
+        current_length += sentence_length
+    if current_chunk:
+        chunks.append(" ".join(current_chunk))
+    return chunks
+
+
+def original_t5_tokenizer():
+    """The sentencepiece T5Tokenizer the original chunker counted tokens with."""
+    transformers = pytest.importorskip("transformers")
+    pytest.importorskip("sentencepiece")
+    try:
+        nltk.data.find("tokenizers/punkt")
+        return transformers.T5Tokenizer.from_pretrained(summarizer.DEFAULT_MODEL, legacy=False)
+    except (LookupError, OSError) as e:
+        pytest.skip(f"t5-base tokenizer or punkt unavailable: {e}")
+
+
+@pytest.mark.parametrize("tokenizer_name", ["stub", "t5-base"])
+@pytest.mark.parametrize("chars,max_tokens", [(15000, 300), (40000, 500), (40000, 60)])
+def test_batched_chunking_matches_per_sentence(monkeypatch, tokenizer_name, chars, max_tokens):
+    if tokenizer_name == "stub":
+        reference = StubTokenizer()
+        monkeypatch.setattr(summarizer, "get_tokenizer", lambda model_name=summarizer.DEFAULT_MODEL: reference)
+        monkeypatch.setattr(nltk, "sent_tokenize", split_sentences)
+        sent_tokenize = split_sentences
+    else:
+        # split_text_ids uses the registry's T5TokenizerFast
+        reference = original_t5_tokenizer()
+        sent_tokenize = nltk.sent_tokenize
+
+    article = build_article("history", chars)
+    expected = per_sentence_chunks(article, max_tokens, reference, sent_tokenize)
+    chunks = summarizer.split_text_ids(article, max_tokens=max_tokens)
+
+    assert [chunk for chunk, _ in chunks] == expected
+    for chunk, ids in chunks:  # Only a single overlong sentence may exceed the budget
+        assert len(ids) <= max_tokens or len(sent_tokenize(chunk)) == 1
@@ -0,0 +1,48 @@
+"""clean_text and TextCleaner match the original three-regex clean_text."""
+import random
+
+import pytest
+
+from benchmarks.bench_clean_text import clean_text_regex
+from wikibot import TextCleaner, clean_text
+
+# Biased towards the tricky characters: control codes, Unicode whitespace,
+# punctuation and non-ASCII letters
+ALPHABET = (
+    "abcXYZ019 .,;:!?'\"()-|}{[]#&*_=+/\\@$%^~`<>"
+    "\t\n\r\x0b\x0c\x00\x1b\x1c\x1d\x1e\x1f\x7f\x80\x85\x9f"
+    "\xa0\u1680\u2000\u2009\u200a\u200b\u2028\u2029\u202f\u205f\u3000\ufeff"
+    "éßñ中文Ωπ—–“”‘’…©°"
+)
+CASES = 20000
+
+
+def random_text(rng, max_length=60):
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_length)))
+
+
+def random_split(rng, text):
+    cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 4)))
+    return [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_clean_text_matches_regex_version(seed):
+    rng = random.Random(seed)
+    for _ in range(CASES // 5):
+        text = random_text(rng)
+        assert clean_text(text) == clean_text_regex(text), text
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_streaming_cleaner_matches_regex_version(seed):
+    rng = random.Random(seed)
+    for _ in range(CASES // 5):
+        text = random_text(rng)
+        pieces = random_split(rng, text)
+        assert "".join(TextCleaner().clean(pieces)) == clean_text_regex(text), pieces
+
+
+@pytest.mark.parametrize("text", ["", " ", "\x00", "a\x00 \x00b", "  lead and trail \n", "\xa0x　y﻿"])
+def test_edge_cases(text):
+    assert clean_text(text) == clean_text_regex(text) == "".join(TextCleaner().clean([text]))
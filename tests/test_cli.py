@@ -0,0 +1,45 @@
+import inspect
+
+import pytest
+
+import wikibot
+
+
+@pytest.fixture
+def summary_calls(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)  # main() logs to wikibot.log in the working directory
+    calls = []
+    signature = inspect.signature(wikibot.generate_wikipedia_summary)
+
+    def generate_wikipedia_summary(topic, **kwargs):
+        signature.bind(topic, **kwargs)  # Only arguments the real function takes
+        calls.append(kwargs)
+        return {"error": "Error: not fetched in tests"}
+
+    monkeypatch.setattr(wikibot, "generate_wikipedia_summary", generate_wikipedia_summary)
+    return calls
+
+
+def no_prompt(prompt=""):
+    raise AssertionError(f"unexpected prompt: {prompt}")
+
+
+def test_hierarchical_mode_summarizes_the_whole_article_without_asking(monkeypatch, summary_calls):
+    monkeypatch.setattr("builtins.input", no_prompt)
+    wikibot.main(["World War II", "--mode", "hierarchical"])
+    assert summary_calls[0]["max_input_length"] is None
+    assert summary_calls[0]["mode"] == "hierarchical"
+
+
+@pytest.mark.parametrize("value,expected", [("0", None), ("none", None), ("12000", 12000)])
+def test_max_input_option(monkeypatch, summary_calls, value, expected):
+    monkeypatch.setattr("builtins.input", no_prompt)
+    wikibot.main(["World War II", "--max-input", value])
+    assert summary_calls[0]["max_input_length"] == expected
+
+
+@pytest.mark.parametrize("answer,expected", [("0", None), ("8000", 8000), ("lots", 10000)])
+def test_max_input_is_prompted_for_in_other_modes(monkeypatch, summary_calls, answer, expected):
+    monkeypatch.setattr("builtins.input", lambda prompt="": answer)
+    wikibot.main(["World War II"])
+    assert summary_calls[0]["max_input_length"] == expected
@@ -0,0 +1,40 @@
+"""Wikipedia requests and model calls per GUI flow: search, then summarize."""
+import wikibot
+from benchmarks.fakes import FakeMediaWikiServer
+from wiki_pool import ClientPool
+
+TOPIC = "Large Hadron Collider"
+ARTICLE = [("", "The Large Hadron Collider is the world's largest and highest-energy particle collider."),
+           ("History", "It was built by CERN between 1998 and 2008 with thousands of scientists and engineers."),
+           ("References", "Cited sources.")]
+
+
+def counting_summarizer(calls):
+    def iter_summarize_wikipedia(content, max_summary_length=500, **kwargs):
+        calls.append((content, max_summary_length))
+        yield "A particle collider."
+        return "A particle collider near Geneva."
+    return iter_summarize_wikipedia
+
+
+def test_search_fetches_once_and_summarizing_does_not_refetch(monkeypatch):
+    calls = []
+    monkeypatch.setattr(wikibot, "iter_summarize_wikipedia", counting_summarizer(calls))
+    with FakeMediaWikiServer({TOPIC: ARTICLE}) as server:
+        wikibot.set_client_pool(ClientPool(api_url=server.api_url, rate=None))
+
+        result = wikibot.fetch_article(TOPIC)  # "Search"
+        assert "error" not in result
+        assert server.requests["extracts"] == 1
+
+        content = wikibot.summary_input(result["article"], 15000)
+        for length in (150, 300):  # "Summarize", then another size
+            events = list(wikibot.stream_summary(content, max_input_length=15000, summary_length=length))
+            assert events[-1] == ("summary", "A particle collider near Geneva.")
+
+        assert server.requests["extracts"] == 1
+        assert server.requests["resolve"] == 1
+        assert [length for _, length in calls] == [150, 300]
+        # The sections were prepared once, at fetch time, without References
+        assert calls[0][0] == calls[1][0] and "Cited sources." not in " ".join(calls[0][0])
+        wikibot.get_client_pool().close()
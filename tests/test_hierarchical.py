@@ -0,0 +1,48 @@
+"""Hierarchical summarization covers every chunk of a long article."""
+import pytest
+
+import summarizer
+
+CHUNKS = 122  # About a 200,000-character article at the default chunk size
+
+
+@pytest.fixture
+def summarized(monkeypatch):
+    """Whitespace "tokens" and a model that writes max_length / 1.3 words per chunk."""
+    calls = []
+
+    def split_text_ids(text, max_tokens=500, model_name=summarizer.DEFAULT_MODEL, cancel_token=None):
+        words = text.split()
+        return [(" ".join(words[i:i + max_tokens]), list(range(len(words[i:i + max_tokens]))))
+                for i in range(0, len(words), max_tokens)]
+
+    def summarize_batch(texts, max_length=150, min_length=50, **kwargs):
+        calls.append(list(texts))
+        return [" ".join([text.split()[0]] + ["word"] * int(max_length / 1.3 - 1)) for text in texts]
+
+    monkeypatch.setattr(summarizer, "split_text_ids", split_text_ids)
+    monkeypatch.setattr(summarizer, "summarize_batch", summarize_batch)
+    return calls
+
+
+def article(chunk_size):
+    return " ".join(f"chunk{i} " + "filler " * (chunk_size - 1) for i in range(CHUNKS))
+
+
+@pytest.mark.parametrize("length", [150, 300, 500])
+def test_every_chunk_is_summarized(summarized, length):
+    chunk_size = summarizer._generation_plan(length, summarizer.DEFAULT_PROFILE)[0]
+    summary = summarizer.summarize_hierarchical(article(chunk_size), max_summary_length=length)
+
+    mapped = [text.split()[0] for batch in summarized for text in batch][:CHUNKS]
+    assert mapped == [f"chunk{i}" for i in range(CHUNKS)]
+    assert 0.8 * length <= len(summary.split()) <= length
+
+
+def test_top_k_summarizes_only_the_salient_chunks(summarized, monkeypatch):
+    monkeypatch.setattr(summarizer, "_keep_salient", lambda chunks, limit: chunks[:limit])
+    chunk_size = summarizer._generation_plan(300, summarizer.DEFAULT_PROFILE)[0]
+    summarizer.summarize_hierarchical(article(chunk_size), max_summary_length=300, top_k=8)
+    mapped = [text.split()[0] for batch in summarized for text in batch]
+    assert mapped[:8] == [f"chunk{i}" for i in range(8)]
+    assert "chunk8" not in mapped
@@ -0,0 +1,31 @@
+"""The default hybrid pre-filter keeps enough text for a full-length summary."""
+import pytest
+
+import summarizer
+
+
+@pytest.fixture
+def shortest_summaries(monkeypatch):
+    """Whitespace "tokens" and a model that stops at min_length, about 1.3 tokens per word."""
+    def extract_salient_text(text, max_tokens, **kwargs):
+        return " ".join(text.split()[:max_tokens])
+
+    def split_text_ids(text, max_tokens=500, model_name=summarizer.DEFAULT_MODEL, cancel_token=None):
+        words = text.split()
+        return [(" ".join(words[i:i + max_tokens]), list(range(len(words[i:i + max_tokens]))))
+                for i in range(0, len(words), max_tokens)]
+
+    def summarize_batch(texts, max_length=150, min_length=50, **kwargs):
+        return [" ".join(["word"] * int(min_length / 1.3)) for _ in texts]
+
+    monkeypatch.setattr(summarizer, "extract_salient_text", extract_salient_text)
+    monkeypatch.setattr(summarizer, "split_text_ids", split_text_ids)
+    monkeypatch.setattr(summarizer, "summarize_batch", summarize_batch)
+
+
+@pytest.mark.parametrize("profile", sorted(summarizer.GENERATION_PROFILES))
+@pytest.mark.parametrize("length", [150, 300, 500, 2000])
+def test_default_budget_reaches_the_length_floor(shortest_summaries, profile, length):
+    article = "word " * 100000
+    summary = summarizer.summarize_hybrid(article, max_summary_length=length, profile=profile)
+    assert len(summary.split()) >= 0.8 * length
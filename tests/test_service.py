@@ -0,0 +1,34 @@
+import threading
+import time
+
+from service import SummaryService
+
+
+def test_topics_differing_in_case_are_not_coalesced():
+    release = threading.Event()
+    fetched = []
+
+    def fetcher(topic):
+        fetched.append(topic)
+        release.wait(5)
+        return f"Article about {topic}."
+
+    def summarize_fn(texts, **kwargs):
+        return [f"Summary of {text}" for text in texts]
+
+    service = SummaryService(fetcher=fetcher, summarize_fn=summarize_fn, batch_wait=0)
+    results = {}
+    threads = [threading.Thread(target=lambda t=topic: results.__setitem__(t, service.summarize(t)))
+               for topic in ("RAM", "Ram", "Ram")]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while service.requests < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(fetched) == ["RAM", "Ram"]
+    assert service.coalesced == 1
+    assert "RAM" in results["RAM"]["summary"] and "Ram" in results["Ram"]["summary"]
@@ -0,0 +1,45 @@
+import wikibot
+from benchmarks.fakes import FakeMediaWikiServer
+from title_index import TitleIndex
+from wiki_pool import ClientPool
+
+EINSTEIN = "Albert Einstein was a German-born theoretical physicist who developed the theory of relativity."
+EINSTEIN_RING = "An Einstein ring is the deformation of light from a source into a ring by gravitational lensing."
+NEW_PAGE = "This article was created after the title index was built, so the index does not know it yet."
+
+
+def fetch_with_index(topic, server):
+    index = TitleIndex.build(["Albert_Einstein", "Einstein_ring", "Albert_Einstein_Medal"])
+    wikibot.set_title_index(index)
+    pool = ClientPool(api_url=server.api_url, rate=None)
+    try:
+        return wikibot.fetch_wikipedia_sections(topic, pool=pool)
+    finally:
+        pool.close()
+
+
+def test_exact_match_is_resolved_locally():
+    with FakeMediaWikiServer({"Albert Einstein": EINSTEIN}) as server:
+        article = fetch_with_index("albert EINSTEIN", server)
+        assert "relativity" in article.content
+        assert server.requests["resolve"] == 0
+
+
+def test_typo_is_suggested_not_substituted():
+    with FakeMediaWikiServer({"Albert Einstein": EINSTEIN, "Einstein Ring": EINSTEIN_RING}) as server:
+        error = fetch_with_index("albert einstien", server)
+        assert isinstance(error, str) and error.startswith("Error")
+        assert "Did you mean: Albert Einstein" in error
+        assert server.requests["extracts"] == 0
+
+
+def test_unindexed_title_is_fetched_as_typed():
+    with FakeMediaWikiServer({"Albert Einstein": EINSTEIN, "Albert Einsteins Legacy": NEW_PAGE}) as server:
+        article = fetch_with_index("Albert Einsteins Legacy", server)
+        assert "index does not know it" in article.content
+
+
+def test_did_you_mean_ranks_closest_titles_first():
+    index = TitleIndex.build(["Albert_Einstein", "Einstein_ring", "Quantum_computing"])
+    assert index.did_you_mean("albert einstien")[0] == "Albert Einstein"
+    assert index.did_you_mean("zzzz qqqq") == []
@@ -0,0 +1,41 @@
+from benchmarks.fakes import FakeMediaWikiServer
+from wiki_pool import ClientPool
+
+ARTICLES = {"Mercury (planet)": "The smallest planet of the Solar System. " * 5,
+            "Mercury (element)": "A chemical element with the symbol Hg. " * 5}
+
+
+def test_titles_that_name_a_page_are_remembered():
+    with FakeMediaWikiServer(ARTICLES) as server:
+        pool = ClientPool(api_url=server.api_url, rate=None)
+        assert pool.resolve_titles(["mercury (planet)"]) == {"mercury (planet)": "Mercury (planet)"}
+        assert pool.resolve_titles(["mercury (planet)"]) == {"mercury (planet)": "Mercury (planet)"}
+        pool.close()
+        assert server.requests["resolve"] == 1
+
+
+def test_missing_titles_are_remembered_briefly():
+    with FakeMediaWikiServer(ARTICLES) as server:
+        pool = ClientPool(api_url=server.api_url, rate=None)
+        assert pool.resolve_titles(["Venus"]) == {"Venus": None}
+        assert pool.resolve_titles(["Venus"]) == {"Venus": None}
+        pool.close()
+        assert server.requests["resolve"] == 1
+
+
+def test_missing_titles_are_asked_about_again_once_expired():
+    with FakeMediaWikiServer(ARTICLES) as server:
+        pool = ClientPool(api_url=server.api_url, rate=None, missing_ttl=0)
+        assert pool.resolve_titles(["Mercury"]) == {"Mercury": None}
+        server.articles["Mercury"] = "Mercury may refer to a planet, an element or a god. " * 5
+        assert pool.resolve_titles(["Mercury"]) == {"Mercury": "Mercury"}
+        pool.close()
+
+
+def test_remembered_titles_expire():
+    with FakeMediaWikiServer(ARTICLES, redirects={"Mercury": "Mercury (planet)"}) as server:
+        pool = ClientPool(api_url=server.api_url, rate=None, resolved_ttl=0)
+        assert pool.resolve_titles(["Mercury"]) == {"Mercury": "Mercury (planet)"}
+        server.redirects["Mercury"] = "Mercury (element)"  # The redirect is retargeted
+        assert pool.resolve_titles(["Mercury"]) == {"Mercury": "Mercury (element)"}
+        pool.close()
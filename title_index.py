@@ -0,0 +1,278 @@
+"""
+Local index of Wikipedia page titles for instant topic resolution and
+autocomplete.
+
+The index is built once from a titles dump (one title per line, such as
+enwiki-latest-all-titles-in-ns0.gz) and saved as a single file that is
+memory-mapped when opened:
+
+    python title_index.py build enwiki-latest-all-titles-in-ns0.gz -o titles.idx
+    python title_index.py lookup titles.idx "dna" "iphone" "albert einstien"
+
+Titles are stored as one UTF-8 blob sorted by their case-folded form, so
+exact and prefix lookups are a binary search. Only exact lookups stand in
+for a typed topic; fuzzy matches are suggestions. Fuzzy matching uses a CSR
+trigram index (sorted trigram codes, row pointers and title ids, as in
+scipy.sparse): candidates come from the query's rarest trigrams and are
+ranked by trigram Jaccard similarity.
+"""
+import gzip
+import mmap
+import struct
+import sys
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+MAGIC = b"WBTITLE1"
+_HEADER = struct.Struct("<8sQQQQ")  # magic, titles, title bytes, trigrams, postings
+# Fuzzy candidates come from the rarest query trigrams, up to this many postings
+CANDIDATE_POSTINGS = 200_000
+RERANK = 64  # Candidates whose similarity is computed exactly
+BUILD_CHUNK = 500_000  # Titles whose trigrams are extracted at once
+
+
+def normalize(title: str) -> str:
+    """Title as MediaWiki stores it in dumps and shows it: spaces, single-spaced."""
+    return " ".join(title.replace("_", " ").split())
+
+
+def _key(title: str) -> str:
+    return normalize(title).casefold()
+
+
+def _trigrams(key: str) -> Set[int]:
+    """Distinct byte trigrams of a key padded like pg_trgm ("  key "), as codes."""
+    padded = b"  " + key.encode("utf-8") + b" "
+    return {padded[i] << 16 | padded[i + 1] << 8 | padded[i + 2] for i in range(len(padded) - 2)}
+
+
+def read_titles(path: str) -> Iterator[str]:
+    """Titles of a dump file (optionally gzipped), skipping its page_title header."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            title = line.rstrip("\n")
+            if title and title != "page_title":
+                yield title
+
+
+def _align(f) -> None:
+    f.write(b"\0" * (-f.tell() % 8))
+
+
+class TitleIndex:
+    """Sorted titles plus a trigram index; see build() and open()."""
+
+    def __init__(self, offsets: np.ndarray, blob: np.ndarray, trigram_counts: np.ndarray,
+                 codes: np.ndarray, indptr: np.ndarray, postings: np.ndarray):
+        self.offsets = offsets  # int64[n + 1]: title i is blob[offsets[i]:offsets[i + 1]]
+        self.blob = blob  # uint8: UTF-8 titles sorted by case-folded key
+        self.trigram_counts = trigram_counts  # uint16[n]: distinct trigrams per title
+        self.codes = codes  # int32[t]: sorted trigram codes
+        self.indptr = indptr  # int64[t + 1]: postings of codes[j] are postings[indptr[j]:indptr[j + 1]]
+        self.postings = postings  # int32: title ids, ascending within each trigram
+        self._blob_view = memoryview(blob)  # Slicing this is much cheaper than slicing the array
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def title(self, i: int) -> str:
+        start, end = self.offsets[i:i + 2].tolist()
+        return str(self._blob_view[start:end], "utf-8")
+
+    @classmethod
+    def build(cls, titles: Iterable[str]) -> "TitleIndex":
+        """Index titles (duplicates and underscores are fine)."""
+        ordered = sorted({normalize(title) for title in titles} - {""}, key=lambda t: (t.casefold(), t))
+        encoded = [title.encode("utf-8") for title in ordered]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(title) for title in encoded], out=offsets[1:])
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        del encoded
+
+        chunk_codes, chunk_owners = [], []
+        for start in range(0, len(ordered), BUILD_CHUNK):
+            codes, owners = cls._chunk_trigrams(ordered[start:start + BUILD_CHUNK], start)
+            chunk_codes.append(codes)
+            chunk_owners.append(owners)
+        codes = np.concatenate(chunk_codes) if chunk_codes else np.zeros(0, dtype=np.int32)
+        owners = np.concatenate(chunk_owners) if chunk_owners else np.zeros(0, dtype=np.int32)
+        del chunk_codes, chunk_owners
+
+        # Stable, so title ids stay ascending within each trigram
+        order = np.argsort(codes, kind="stable")
+        codes, postings = codes[order], owners[order]
+        del order, owners
+        unique_codes, first = np.unique(codes, return_index=True)
+        indptr = np.append(first, len(codes)).astype(np.int64)
+        trigram_counts = np.minimum(np.bincount(postings, minlength=len(ordered)), 65535).astype(np.uint16)
+        return cls(offsets, blob, trigram_counts, unique_codes.astype(np.int32), indptr, postings)
+
+    @staticmethod
+    def _chunk_trigrams(titles: List[str], first_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Distinct (trigram, title id) pairs of a run of titles, vectorized
+        # over one blob of padded keys
+        keys = [b"  " + title.casefold().encode("utf-8") + b" " for title in titles]
+        lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+        padded = np.frombuffer(b"".join(keys), dtype=np.uint8).astype(np.int32)
+        owners = np.repeat(np.arange(first_id, first_id + len(keys), dtype=np.int32), lengths)
+        codes = padded[:-2] << 16 | padded[1:-1] << 8 | padded[2:]
+        # A trigram may not start in the last two bytes of a key
+        valid = np.ones(len(codes), dtype=bool)
+        ends = np.cumsum(lengths)
+        valid[ends[ends - 2 < len(codes)] - 2] = False
+        valid[ends[ends - 1 < len(codes)] - 1] = False
+        codes, owners = codes[valid], owners[:-2][valid]
+        pairs = np.unique(codes.astype(np.int64) << 32 | owners)
+        return (pairs >> 32).astype(np.int32), (pairs & 0xFFFFFFFF).astype(np.int32)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(self), len(self.blob), len(self.codes), len(self.postings)))
+            for array in (self.offsets, self.blob, self.trigram_counts, self.codes, self.indptr, self.postings):
+                _align(f)
+                f.write(np.ascontiguousarray(array).tobytes())
+
+    @classmethod
+    def open(cls, path: str) -> "TitleIndex":
+        """Memory-map a saved index; pages are read on demand."""
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, blob_bytes, n_codes, n_postings = _HEADER.unpack(data[:_HEADER.size])
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a title index")
+        # Plain arrays over the mapping: indexing np.memmap objects is several times slower
+        arrays, position = [], _HEADER.size
+        for dtype, count in ((np.int64, n + 1), (np.uint8, blob_bytes), (np.uint16, n),
+                             (np.int32, n_codes), (np.int64, n_codes + 1), (np.int32, n_postings)):
+            position += -position % 8
+            arrays.append(np.frombuffer(data, dtype=dtype, count=count, offset=position))
+            position += np.dtype(dtype).itemsize * count
+        return cls(*arrays)
+
+    def _lower_bound(self, key: str) -> int:
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.title(middle).casefold() < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def prefix(self, text: str, limit: int = 10) -> List[str]:
+        """Up to limit titles starting with text (case-insensitively), in sorted order."""
+        key = _key(text)
+        if not key:
+            return []
+        matches = []
+        for i in range(self._lower_bound(key), len(self)):
+            title = self.title(i)
+            if not title.casefold().startswith(key) or len(matches) >= limit:
+                break
+            matches.append(title)
+        return matches
+
+    def exact(self, text: str) -> Optional[str]:
+        """
+        The title text names, ignoring case and underscores: the exact
+        spelling if indexed, else MediaWiki's first-letter capitalization,
+        else the first title with the same case-folded form.
+        """
+        query = normalize(text)
+        key = query.casefold()
+        if not key:
+            return None
+        candidates = []
+        for i in range(self._lower_bound(key), len(self)):
+            title = self.title(i)
+            if title.casefold() != key:
+                break
+            candidates.append(title)
+        for preferred in (query, query[:1].upper() + query[1:]):
+            if preferred in candidates:
+                return preferred
+        return candidates[0] if candidates else None
+
+    def fuzzy(self, text: str, limit: int = 5, min_similarity: float = 0.3) -> List[Tuple[str, float]]:
+        """(title, similarity) of the titles most similar to text, best first."""
+        query_set = _trigrams(_key(text))
+        query = np.array(sorted(query_set), dtype=np.int32)
+        if not len(self.codes) or not _key(text):
+            return []
+        rows = np.searchsorted(self.codes, query)
+        rows = rows[rows < len(self.codes)]
+        rows = rows[np.isin(self.codes[rows], query)]
+        if not len(rows):
+            return []
+        sizes = self.indptr[rows + 1] - self.indptr[rows]
+        # Rarest trigrams first: their postings are short and most telling
+        rows, sizes = rows[np.argsort(sizes, kind="stable")], np.sort(sizes)
+        used = max(1, int(np.searchsorted(np.cumsum(sizes), CANDIDATE_POSTINGS, side="right")))
+        candidates, shared = np.unique(
+            np.concatenate([self.postings[self.indptr[row]:self.indptr[row + 1]] for row in rows[:used]]),
+            return_counts=True)
+        estimate = shared / (len(query) + self.trigram_counts[candidates].astype(np.int64) - shared)
+        if len(candidates) > RERANK:
+            best = np.argpartition(-estimate, RERANK)[:RERANK]
+            candidates = candidates[best]
+
+        scored = []
+        for i in candidates.tolist():
+            title = self.title(i)
+            trigrams = _trigrams(title.casefold())
+            similarity = len(query_set & trigrams) / len(query_set | trigrams)
+            if similarity >= min_similarity:
+                scored.append((similarity, -len(title), title))
+        scored.sort(reverse=True)
+        return [(title, similarity) for similarity, _, title in scored[:limit]]
+
+    def did_you_mean(self, text: str, limit: int = 3, min_similarity: float = 0.5) -> List[str]:
+        """
+        Titles to offer for a topic that names no page, best first. They are
+        only suggestions: a typo or an unindexed title must not silently
+        become a different article.
+        """
+        return [title for title, _ in self.fuzzy(text, limit=limit, min_similarity=min_similarity)]
+
+    def suggest(self, text: str, limit: int = 8) -> List[str]:
+        """Autocomplete: titles starting with text, topped up with fuzzy matches."""
+        suggestions = self.prefix(text, limit)
+        if len(suggestions) < limit and len(_key(text)) >= 3:
+            for title, _ in self.fuzzy(text, limit=limit):
+                if title not in suggestions:
+                    suggestions.append(title)
+                if len(suggestions) >= limit:
+                    break
+        return suggestions
+
+
+def main(argv=None) -> None:
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build or query a local Wikipedia title index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="index a titles dump (one title per line, .gz ok)")
+    build.add_argument("dump")
+    build.add_argument("-o", "--output", required=True)
+    lookup = commands.add_parser("lookup", help="look topics up and show suggestions")
+    lookup.add_argument("index")
+    lookup.add_argument("topics", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        start = time.perf_counter()
+        index = TitleIndex.build(read_titles(args.dump))
+        index.save(args.output)
+        print(f"Indexed {len(index)} titles in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    else:
+        index = TitleIndex.open(args.index)
+        for topic in args.topics:
+            print(f"{topic!r} -> {index.exact(topic)!r}  did you mean: {index.did_you_mean(topic)}  "
+                  f"suggestions: {index.suggest(topic)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Pooled, rate-limited access to the MediaWiki API.
+
+A ClientPool keeps reusable wikipediaapi clients per language. Each client
+owns a requests session whose connections are kept alive between calls, so
+TCP and TLS setup is paid once per connection rather than once per topic.
+Every request made through the pool, in any language, takes a token from
+one TokenBucket. The pool also resolves many titles per API request,
+following MediaWiki's own title normalization and redirects.
+
+    pool = ClientPool(api_url="https://{language}.wikipedia.org/w/api.php", rate=10)
+    titles = pool.resolve_titles(["quantum computing", "Large_Hadron_Collider"])
+    with pool.client("en") as wiki:
+        page = wiki.page(titles["quantum computing"])
+"""
+import contextlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import wikipediaapi
+from requests.adapters import HTTPAdapter
+
+from cancellation import CancellationToken, check
+import profiling
+
+DEFAULT_API_URL = "https://{language}.wikipedia.org/w/api.php"
+USER_AGENT = "WikiBot/1.0"
+MAX_TITLES_PER_REQUEST = 50  # MediaWiki's limit for clients without apihighlimits
+# Characters MediaWiki never allows in a title ("|" would also split the query)
+_INVALID_TITLE_CHARS = frozenset("|<>[]{}")
+
+
+class TokenBucket:
+    """Allows rate requests per second on average, in bursts of up to capacity."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel_token: Optional[CancellationToken] = None) -> float:
+        """Take one token, sleeping until one is available. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            check(cancel_token)
+            time.sleep(delay)
+            waited += delay
+
+
+class PooledWikipedia(wikipediaapi.Wikipedia):
+    """
+    wikipediaapi client that sends its requests to api_url through a rate
+    limit, over a session keeping up to `connections` connections alive.
+    """
+
+    def __init__(self, language: str, api_url: str = DEFAULT_API_URL,
+                 limiter: Optional[TokenBucket] = None, timeout: float = 10,
+                 connections: int = 1, user_agent: str = USER_AGENT):
+        super().__init__(user_agent=user_agent, language=language,
+                         extract_format=wikipediaapi.ExtractFormat.WIKI, timeout=timeout)
+        self.api_url = api_url.format(language=self.language)
+        self.limiter = limiter
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=connections)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def _query(self, page, params: Dict[str, Any]):
+        # The request wikipediaapi makes, sent to api_url instead of the
+        # hard-coded https://<language>.wikipedia.org
+        params["format"] = "json"
+        params["redirects"] = 1
+        return self.api_get(params)
+
+    def api_get(self, params: Dict[str, Any],
+                cancel_token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """One rate-limited GET of the API, returning the decoded JSON."""
+        if self.limiter is not None:
+            waited = self.limiter.acquire(cancel_token)
+            if waited:
+                profiling.count("rate_limited_seconds", waited)
+        profiling.count("api_requests")
+        response = self._session.get(self.api_url, params=params, **self._request_kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def close(self) -> None:
+        self._session.close()
+
+
+def _chunks(items: List[str], size: int) -> Iterator[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class ClientPool:
+    """
+    Reusable API clients, per language, created on demand up to
+    clients_per_language. A client is used by one thread at a time (see
+    client()); threads wait for one to be returned when all are in use.
+    """
+
+    def __init__(self, api_url: str = DEFAULT_API_URL, rate: Optional[float] = 10.0,
+                 burst: Optional[float] = None, clients_per_language: int = 4,
+                 timeout: float = 10, user_agent: str = USER_AGENT,
+                 max_resolved: int = 4096, resolved_ttl: float = 3600.0,
+                 missing_ttl: float = 60.0):
+        self.api_url = api_url
+        self.limiter = TokenBucket(rate, burst) if rate else None
+        self.clients_per_language = clients_per_language
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.max_resolved = max_resolved
+        self.resolved_ttl = resolved_ttl
+        self.missing_ttl = missing_ttl
+        self._idle: Dict[str, List[PooledWikipedia]] = {}
+        self._created: Dict[str, int] = {}
+        self._available = threading.Condition()
+        # (language, title as typed) -> (canonical title, or None if there is
+        # no such page; monotonic time the answer expires)
+        self._resolved: "OrderedDict[Tuple[str, str], Tuple[Optional[str], float]]" = OrderedDict()
+        self._resolved_lock = threading.Lock()
+
+    def _borrow(self, language: str) -> PooledWikipedia:
+        with self._available:
+            while True:
+                idle = self._idle.setdefault(language, [])
+                if idle:
+                    return idle.pop()  # Most recently used: its connection is likeliest to be open
+                if self._created.get(language, 0) < self.clients_per_language:
+                    self._created[language] = self._created.get(language, 0) + 1
+                    break
+                self._available.wait()
+        try:
+            return PooledWikipedia(language, self.api_url, self.limiter, self.timeout,
+                                   user_agent=self.user_agent)
+        except Exception:
+            with self._available:
+                self._created[language] -= 1
+                self._available.notify()
+            raise
+
+    def _return(self, client: PooledWikipedia) -> None:
+        with self._available:
+            self._idle[client.language].append(client)
+            self._available.notify()
+
+    @contextlib.contextmanager
+    def client(self, language: str = "en", timeout: Optional[float] = None) -> Iterator[PooledWikipedia]:
+        """Borrow a client for language; timeout overrides the HTTP timeout while it is borrowed."""
+        client = self._borrow(language.strip().lower())
+        client._request_kwargs["timeout"] = timeout if timeout is not None else self.timeout
+        try:
+            yield client
+        finally:
+            self._return(client)
+
+    def resolve_titles(self, titles: Iterable[str], language: str = "en",
+                       cancel_token: Optional[CancellationToken] = None) -> Dict[str, Optional[str]]:
+        """
+        Map each title to the canonical title of the page it names, or None
+        if there is no such page, asking the API about up to
+        MAX_TITLES_PER_REQUEST titles at a time. MediaWiki normalizes the
+        titles (underscores, first-letter case...) and follows redirects.
+        Titles it does not find are retried in title case ("albert
+        einstein" -> "Albert Einstein"). Answers are remembered for
+        resolved_ttl seconds, or missing_ttl for titles with no page, since
+        pages can be moved, redirects retargeted and missing pages created.
+        """
+        language = language.strip().lower()
+        results: Dict[str, Optional[str]] = {}
+        queries: Dict[str, List[str]] = {}  # query -> the titles it answers
+        for title in titles:
+            query = " ".join(title.replace("_", " ").split("#", 1)[0].split())
+            if not query or _INVALID_TITLE_CHARS.intersection(query):
+                results[title] = None
+                continue
+            with self._resolved_lock:
+                remembered = self._resolved.get((language, query))
+                if remembered is not None and remembered[1] > time.monotonic():
+                    self._resolved.move_to_end((language, query))
+                    results[title] = remembered[0]
+                    continue
+            queries.setdefault(query, []).append(title)
+
+        found = self._lookup(list(queries), language, cancel_token)
+        retry = {query.title(): query for query in queries
+                 if found[query] is None and query.title() != query}
+        if retry:
+            for cased, resolved in self._lookup(list(retry), language, cancel_token).items():
+                found[retry[cased]] = resolved
+
+        now = time.monotonic()
+        with self._resolved_lock:
+            for query, resolved in found.items():
+                ttl = self.resolved_ttl if resolved is not None else self.missing_ttl
+                self._resolved[(language, query)] = (resolved, now + ttl)
+                self._resolved.move_to_end((language, query))
+                for title in queries[query]:
+                    results[title] = resolved
+            while len(self._resolved) > self.max_resolved:
+                self._resolved.popitem(last=False)
+        return results
+
+    def _lookup(self, queries: List[str], language: str,
+                cancel_token: Optional[CancellationToken]) -> Dict[str, Optional[str]]:
+        found: Dict[str, Optional[str]] = {}
+        for batch in _chunks(queries, MAX_TITLES_PER_REQUEST):
+            check(cancel_token)
+            with self.client(language) as client:
+                raw = client.api_get({"action": "query", "titles": "|".join(batch), "redirects": 1,
+                                      "format": "json", "formatversion": 2}, cancel_token)
+            query = raw.get("query", {})
+            normalized = {entry["from"]: entry["to"] for entry in query.get("normalized", [])}
+            redirects = {entry["from"]: entry["to"] for entry in query.get("redirects", [])}
+            existing = {page["title"] for page in query.get("pages", [])
+                        if not page.get("missing") and not page.get("invalid")}
+            for title in batch:
+                resolved = normalized.get(title, title)
+                seen = set()
+                while resolved in redirects and resolved not in seen:  # Redirects can chain
+                    seen.add(resolved)
+                    resolved = redirects[resolved]
+                found[title] = resolved if resolved in existing else None
+        return found
+
+    def close(self) -> None:
+        """Close the sessions of all idle clients."""
+        with self._available:
+            for language, clients in self._idle.items():
+                for client in clients:
+                    client.close()
+                self._created[language] -= len(clients)
+                clients.clear()
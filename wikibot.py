@@ -1,8 +1,67 @@
-import string
-import wikipediaapi
-from summarizer import summarize_wikipedia as summarize
 import re
-from typing import Dict, Union
+import string
+import threading
+from summarizer import (summarize_wikipedia as summarize, iter_summarize_wikipedia, summarize_extractive,
+                        summarize_hierarchical, summarize_hybrid, extract_salient_text,
+                        hybrid_token_budget, GENERATION_PROFILES, DEFAULT_PROFILE)
+from article_cache import ArticleCache
+from sections import SectionedArticle, from_page as sections_from_page
+from cancellation import CancellationToken, check
+from wiki_pool import DEFAULT_API_URL, ClientPool
+from title_index import TitleIndex
+import profiling
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Optional persistent article cache used by fetch_wikipedia_content
+_article_cache: Optional[ArticleCache] = None
+
+# Summarization modes for summarize_content, from slowest to fastest
+SUMMARY_MODES = ("hierarchical", "abstractive", "hybrid", "extractive")
+
+# Local title indexes (see title_index.py), by language
+_title_indexes: Dict[str, TitleIndex] = {}
+
+# Keep-alive API clients shared by every fetch without an explicit client
+_client_pool: Optional[ClientPool] = None
+_client_pool_lock = threading.Lock()
+
+def set_article_cache(cache: Optional[ArticleCache]) -> None:
+    """Install (or remove, with None) the default article cache."""
+    global _article_cache
+    _article_cache = cache
+
+def set_title_index(index: Optional[TitleIndex], language: str = "en") -> None:
+    """Resolve topics in language with a local title index (None removes it)."""
+    if index is None:
+        _title_indexes.pop(language, None)
+    else:
+        _title_indexes[language] = index
+
+def set_client_pool(pool: Optional[ClientPool]) -> None:
+    """Install the default client pool (None: a default ClientPool on next use)."""
+    global _client_pool
+    _client_pool = pool
+
+def get_client_pool() -> ClientPool:
+    global _client_pool
+    with _client_pool_lock:
+        if _client_pool is None:
+            _client_pool = ClientPool()
+        return _client_pool
+
+# clean_text tables: control characters are deleted before whitespace is
+# collapsed, then everything but letters, digits, space and .,;:!?'"()- goes.
+# str.translate is only fast on ASCII input, so other text uses the regex.
+_CONTROL_CHARS = dict.fromkeys([*range(0x20), *range(0x7F, 0xA0)])
+_CONTROL_RE = re.compile(r'[\x00-\x1F\x7F-\x9F]')
+_ALLOWED_CHARS = string.ascii_letters + string.digits + " .,;:!?'\"()-"
+_DISALLOWED_ASCII = dict.fromkeys(c for c in range(128) if chr(c) not in _ALLOWED_CHARS)
+
+def _strip_control(text: str) -> str:
+    return text.translate(_CONTROL_CHARS) if text.isascii() else _CONTROL_RE.sub('', text)
+
+def _strip_disallowed(text: str) -> str:
+    return text.encode("ascii", "ignore").decode("ascii").translate(_DISALLOWED_ASCII)
 
 def clean_text(text: str) -> str:
     """
@@ -12,53 +71,145 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove control characters and weird unicode
-    text = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', text)
-    
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Remove random character sequences (like "0 | } A J k")
-    text = re.sub(r'[^a-zA-Z0-9\s.,;:!?\'"()-]', '', text)
-    
-    return text
+    # Remove control characters, then normalize whitespace (split() uses the
+    # same whitespace definition as \s), then drop anything not allowed
+    text = " ".join(_strip_control(text).split())
+    return _strip_disallowed(text)
 
-def fetch_wikipedia_content(topic: str) -> Union[str, Dict[str, str]]:
+class TextCleaner:
     """
-    Fetch and clean Wikipedia content with robust error handling.
-    Returns: Cleaned content or error message
+    Incremental clean_text for text that arrives in pieces (e.g. page
+    sections). Concatenating the results of feed() gives exactly
+    clean_text() of the concatenated input.
+    """
+
+    def __init__(self):
+        self._started = False  # Some non-space text has been emitted
+        self._pending_space = False  # Whitespace seen since the last emitted text
+
+    def feed(self, text: str) -> str:
+        text = _strip_control(text)
+        words = text.split()
+        if not words:
+            self._pending_space = self._pending_space or bool(text)
+            return ""
+        cleaned = " ".join(words)
+        if self._started and (self._pending_space or text[0].isspace()):
+            cleaned = " " + cleaned
+        self._started = True
+        self._pending_space = text[-1].isspace()
+        return _strip_disallowed(cleaned)
+
+    def clean(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Clean each piece in turn."""
+        for piece in pieces:
+            yield self.feed(piece)
+
+def fetch_wikipedia_sections(topic: str, client=None, cache: Optional[ArticleCache] = None,
+                             cancel_token: Optional[CancellationToken] = None,
+                             language: str = "en", pool: Optional[ClientPool] = None) -> Union[SectionedArticle, str]:
+    """
+    Fetch and clean a Wikipedia article, keeping its section structure.
+    With a title index for language (set_title_index), a topic naming an
+    indexed title (ignoring case) is resolved locally, without a request;
+    close but inexact matches are only offered as "Did you mean" in the
+    not-found error. Otherwise, without an explicit client, the API resolves it to its
+    canonical title (normalization and redirects), unless the article cache
+    remembers the title the same topic resolved to before. The page is
+    fetched with a keep-alive client from pool (the default client pool if
+    None) and cached under its language and exact canonical title. An
+    explicit client gets the topic with punctuation stripped and
+    title-cased instead, cached under its case-folded form.
+    Uses the given (or default) article cache when one is configured.
+    A cancel_token stops the fetch between requests, and its deadline
+    also caps the HTTP timeout.
+    Returns: SectionedArticle or error message
     """
     try:
-        # Clean the topic name
-        clean_topic = topic.translate(str.maketrans('', '', string.punctuation)).strip().title()
-        if not clean_topic:
+        check(cancel_token)
+        timeout = None
+        if cancel_token is not None and cancel_token.remaining() is not None:
+            timeout = max(0.1, min(10, cancel_token.remaining()))
+        index = _title_indexes.get(language)
+        indexed = index.exact(topic) if index is not None else None
+        if client is not None:
+            # Clean the topic name
+            clean_topic = indexed or topic.translate(str.maketrans('', '', string.punctuation)).strip().title()
+            if not clean_topic:
+                return "Error: Empty topic after cleaning"
+            article = _fetch_sections(client, clean_topic, None, cache, cancel_token)
+            return article if article is not None else _not_found(clean_topic, topic, index)
+
+        if not topic.strip():
             return "Error: Empty topic after cleaning"
-        
-        # Initialize Wikipedia API with timeout
-        wiki_wiki = wikipediaapi.Wikipedia(
-            language='en',
-            user_agent='WikiBot/1.0',
-            extract_format=wikipediaapi.ExtractFormat.WIKI,  # Simplified format
-            timeout=10  # 10 second timeout
-        )
-        
-        page = wiki_wiki.page(clean_topic)
-        if not page.exists():
-            return f"Error: Wikipedia page for '{clean_topic}' not found"
-        
-        # Get and clean content
-        content = page.text
-        content = clean_text(content)
-        
-        # Ensure we have valid content
-        if not content or len(content.split()) < 10:
-            return "Error: Retrieved content is too short or invalid"
-            
-        return content
+        pool = pool if pool is not None else get_client_pool()
+        cache = cache if cache is not None else _article_cache
+        title = indexed or (cache.canonical_title(topic, language) if cache is not None else None)
+        if title is None:
+            title = pool.resolve_titles([topic], language, cancel_token=cancel_token)[topic]
+        if title is None:
+            return _not_found(topic.strip(), topic, index)
+        # Borrowing a client makes no request: a fresh cache hit stays offline
+        with pool.client(language, timeout=timeout) as wiki_wiki:
+            article = _fetch_sections(wiki_wiki, title, language, cache, cancel_token)
+        if article is None:
+            return _not_found(title, topic, index)
+        if cache is not None and not isinstance(article, str):
+            cache.remember_title(topic, language, title)
+        return article
     
     except Exception as e:
         return f"Error fetching content: {str(e)}"
 
+def _not_found(title: str, topic: str, index: Optional[TitleIndex]) -> str:
+    message = f"Error: Wikipedia page for '{title}' not found"
+    suggestions = index.did_you_mean(topic) if index is not None else []
+    return message + (f". Did you mean: {', '.join(suggestions)}?" if suggestions else "")
+
+def _fetch_sections(wiki_wiki, title: str, language: Optional[str], cache: Optional[ArticleCache],
+                    cancel_token: Optional[CancellationToken]) -> Optional[Union[SectionedArticle, str]]:
+    # None if there is no such page. language is None for titles that are
+    # not canonical (see ArticleCache.get)
+    cache = cache if cache is not None else _article_cache
+    if cache is not None:
+        # A stale entry is reused if the page's revision id is unchanged
+        cached = cache.get(title, current_revision=lambda: wiki_wiki.page(title).lastrevid,
+                           language=language)
+        if cached is not None:
+            return SectionedArticle.from_json(cached.content, cached.sections)
+    
+    with profiling.span("fetch", topic=title):
+        page = wiki_wiki.page(title)
+        if not page.exists():
+            return None
+        check(cancel_token)
+        page.summary  # Downloads the text of every section
+    
+    # Get and clean content section by section (same text as clean_text(page.text))
+    with profiling.span("clean"):
+        article = sections_from_page(page, TextCleaner())
+    profiling.count("fetched_chars", len(article.content))
+    check(cancel_token)
+    
+    # Ensure we have valid content
+    if not article.content or len(article.content.split()) < 10:
+        return "Error: Retrieved content is too short or invalid"
+    
+    if cache is not None:
+        cache.put(title, article.content, page.lastrevid if cache.check_revision else None,
+                  sections=article.sections_json(), language=language)
+        
+    return article
+
+def fetch_wikipedia_content(topic: str, client=None, cache: Optional[ArticleCache] = None,
+                            cancel_token: Optional[CancellationToken] = None) -> str:
+    """
+    Fetch and clean Wikipedia content with robust error handling.
+    Returns: Cleaned content or error message
+    """
+    article = fetch_wikipedia_sections(topic, client=client, cache=cache, cancel_token=cancel_token)
+    return article if isinstance(article, str) else article.content
+
 def truncate_content(content: str, max_length: int) -> str:
     """Safely truncate content at sentence boundary"""
     if len(content) <= max_length:
@@ -68,42 +219,196 @@ def truncate_content(content: str, max_length: int) -> str:
     last_period = truncated.rfind('.')
     return truncated[:last_period + 1] if last_period > 0 else truncated
 
-def generate_wikipedia_summary(topic: str, max_input_length: int = 15000, summary_length: int = 300) -> Dict[str, Union[str, int]]:
-    """Generate cleaned Wikipedia content and summary."""
-    content = fetch_wikipedia_content(topic)
-    
-    if isinstance(content, str) and content.startswith("Error"):
-        return {"error": content}
+def prepare_display(content: str, display_length: int = 25000) -> Dict[str, Union[str, int]]:
+    """Truncate cleaned content for display and describe its size."""
+    display_content = truncate_content(content, display_length)
+    return {
+        "original_content": display_content,
+        "content_length": len(display_content),
+        "word_count": len(display_content.split())
+    }
+
+def fetch_article(topic: str, display_length: int = 25000,
+                  cancel_token: Optional[CancellationToken] = None,
+                  language: str = "en") -> Dict[str, Union[str, int, SectionedArticle]]:
+    """
+    Fetch and clean a Wikipedia article for display, without summarizing it.
+    The SectionedArticle is included as "article" for summary_input().
+    """
+    article = fetch_wikipedia_sections(topic, cancel_token=cancel_token, language=language)
     
-    # Clean and truncate original content for display
-    display_content = truncate_content(content, 25000)
+    if isinstance(article, str) and article.startswith("Error"):
+        return {"error": article}
     
+    result = prepare_display(article.content, display_length)
+    result["article"] = article
+    return result
+
+def summary_input(content: Union[str, SectionedArticle, List[str]],
+                  max_input_length: Optional[int] = 15000) -> Union[str, List[str]]:
+    """
+    What to summarize, at most max_input_length characters (None for all):
+    plain text is truncated, a SectionedArticle gives the text of its
+    substantive sections (skipping References, See also, ...), and a list
+    of section texts is taken as already prepared.
+    """
+    with profiling.span("truncate"):
+        if isinstance(content, SectionedArticle):
+            return content.section_texts(max_input_length)
+        if isinstance(content, list) or max_input_length is None:
+            return content
+        return truncate_content(content, max_input_length)
+
+def _joined(content: Union[str, List[str]]) -> str:
+    return content if isinstance(content, str) else " ".join(content)
+
+def summarize_content(content: Union[str, SectionedArticle, List[str]], max_input_length: Optional[int] = 15000, summary_length: int = 300,
+                      cancel_token: Optional[CancellationToken] = None,
+                      mode: str = "abstractive", top_k: Optional[int] = None,
+                      profile: str = DEFAULT_PROFILE) -> str:
+    """
+    Summarize already-fetched content (see summary_input). Returns the summary
+    or an error message. max_input_length=None summarizes the whole article. mode is one of
+    SUMMARY_MODES: "hierarchical" is map-reduce summarization, optionally over
+    only the top_k most salient chunks; "hybrid" sends only the top-ranked
+    sentences to the model; "extractive" copies them without using the model.
+    profile names the decoding settings (see summarizer.GENERATION_PROFILES).
+    """
     # Prepare content for summarization (respect max_input_length)
-    summary_content = truncate_content(content, max_input_length)
+    summary_content = summary_input(content, max_input_length)
     
     # Generate summary with specified length
     try:
-        summary = summarize(summary_content, max_summary_length=summary_length)
-        summary = clean_text(summary)
+        with profiling.span("summarize", mode=mode):
+            if mode == "hierarchical":
+                summary = summarize_hierarchical(_joined(summary_content), max_summary_length=summary_length,
+                                                 top_k=top_k, cancel_token=cancel_token, profile=profile)
+            elif mode == "hybrid":
+                summary = summarize_hybrid(_joined(summary_content), max_summary_length=summary_length,
+                                           cancel_token=cancel_token, profile=profile)
+            elif mode == "extractive":
+                summary = summarize_extractive(_joined(summary_content), max_summary_length=summary_length)
+            elif mode == "abstractive":
+                summary = summarize(summary_content, max_summary_length=summary_length,
+                                    cancel_token=cancel_token, profile=profile)
+            else:
+                return f"Error generating summary: unknown mode {mode!r}"
+        return clean_text(summary)
     except Exception as e:
-        summary = f"Error generating summary: {str(e)}"
-    
-    return {
-        "original_content": display_content,
-        "summary": summary,
-        "content_length": len(display_content),
-        "word_count": len(display_content.split())
-    }
+        return f"Error generating summary: {str(e)}"
 
-if __name__ == "__main__":
-    # Command-line interface for testing
-    topic = input("Enter the topic to search: ")
+def stream_summary(content: Union[str, SectionedArticle, List[str]], max_input_length: int = 15000, summary_length: int = 300,
+                   cancel_token: Optional[CancellationToken] = None,
+                   mode: str = "abstractive",
+                   profile: str = DEFAULT_PROFILE) -> Iterator[Tuple[str, str]]:
+    """
+    Summarize already-fetched content (see summary_input) progressively. Yields ("chunk", text)
+    for each chunk summary as it is ready, then ("summary", final_summary),
+    where the final summary may be an error message like summarize_content.
+    mode is "abstractive", "hybrid" or "extractive" (which yields only the summary).
+    profile names the decoding settings, as in summarize_content.
+    """
+    summary_content = summary_input(content, max_input_length)
     try:
-        max_input = int(input("Enter max content size for summarization (characters): "))
-    except ValueError:
-        max_input = 10000
+        if mode == "extractive":
+            yield "summary", clean_text(summarize_extractive(_joined(summary_content),
+                                                             max_summary_length=summary_length))
+            return
+        if mode == "hybrid":
+            summary_content = extract_salient_text(_joined(summary_content),
+                                                   hybrid_token_budget(summary_length, profile),
+                                                   cancel_token=cancel_token)
+        elif mode != "abstractive":
+            raise ValueError(f"unknown mode {mode!r}")
+        stream = iter_summarize_wikipedia(summary_content, max_summary_length=summary_length,
+                                          cancel_token=cancel_token, profile=profile)
+        while True:
+            try:
+                chunk = next(stream)
+            except StopIteration as stop:
+                summary = stop.value
+                break
+            yield "chunk", clean_text(chunk)
+        yield "summary", clean_text(summary)
+    except Exception as e:
+        yield "summary", f"Error generating summary: {str(e)}"
+
+def generate_wikipedia_summary(topic: str, max_input_length: Optional[int] = 15000, summary_length: int = 300,
+                               cancel_token: Optional[CancellationToken] = None,
+                               mode: str = "abstractive", top_k: Optional[int] = None,
+                               client=None, profile: str = DEFAULT_PROFILE,
+                               language: str = "en") -> Dict[str, Union[str, int]]:
+    """Generate cleaned Wikipedia content and summary."""
+    article = fetch_wikipedia_sections(topic, client=client, cancel_token=cancel_token, language=language)
     
-    result = generate_wikipedia_summary(topic, max_input_length=max_input)
+    if isinstance(article, str) and article.startswith("Error"):
+        return {"error": article}
+    
+    result = prepare_display(article.content)
+    result["summary"] = summarize_content(
+        article,
+        max_input_length=max_input_length,
+        summary_length=summary_length,
+        cancel_token=cancel_token,
+        mode=mode,
+        top_k=top_k,
+        profile=profile
+    )
+    return result
+
+def _max_input(value: str) -> int:
+    """--max-input value in characters; 0 (or "none") means the whole article."""
+    return 0 if value.strip().lower() == "none" else int(value)
+
+def main(argv=None) -> None:
+    """Command-line interface for testing."""
+    import argparse
+    import logging
+    import sys
+
+    parser = argparse.ArgumentParser(description="Fetch and summarize a Wikipedia article.")
+    parser.add_argument("topic", nargs="?", help="topic to search (prompted for if omitted)")
+    parser.add_argument("--max-input", type=_max_input,
+                        help="max content size for summarization (characters; 0 or none: the whole article, "
+                             "the default with --mode hierarchical)")
+    parser.add_argument("--length", type=int, default=300, help="summary length in words")
+    parser.add_argument("--mode", choices=SUMMARY_MODES, default="abstractive")
+    parser.add_argument("--language", default="en", help="Wikipedia language edition")
+    parser.add_argument("--api-url", default=DEFAULT_API_URL,
+                        help="MediaWiki API endpoint; {language} is replaced by --language")
+    parser.add_argument("--title-index", metavar="FILE",
+                        help="resolve the topic with this title index, suggesting titles if it names no page")
+    parser.add_argument("--generation-profile", choices=sorted(GENERATION_PROFILES), default=DEFAULT_PROFILE,
+                        help="decoding settings: fast (greedy), balanced or quality (wider beams)")
+    parser.add_argument("--profile", nargs="?", const="", metavar="FILE",
+                        help="print time per pipeline stage; also export to FILE "
+                             "(.prom for Prometheus text, otherwise JSON lines)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(filename="wikibot.log", level=logging.DEBUG,
+                        format="%(asctime)s - %(levelname)s - %(message)s")
+
+    if args.api_url != DEFAULT_API_URL:
+        set_client_pool(ClientPool(api_url=args.api_url))
+    if args.title_index:
+        set_title_index(TitleIndex.open(args.title_index), args.language)
+    topic = args.topic or input("Enter the topic to search: ")
+    max_input = args.max_input
+    if max_input is None:
+        if args.mode == "hierarchical":
+            max_input = 0  # Hierarchical summarization exists to cover the whole article
+        else:
+            try:
+                max_input = _max_input(input("Enter max content size for summarization (characters, 0 for all): "))
+            except ValueError:
+                max_input = 10000
+
+    profiler = None
+    if args.profile is not None:
+        profiler = profiling.enable([profiling.sink_for_path(args.profile)] if args.profile else [])
+
+    result = generate_wikipedia_summary(topic, max_input_length=max_input or None, summary_length=args.length,
+                                        mode=args.mode, profile=args.generation_profile,
+                                        language=args.language)
     
     if "error" in result:
         print(result["error"])
@@ -114,3 +419,11 @@ if __name__ == "__main__":
         print(result["original_content"][:500] + "...")
         print("\nSummary:")
         print(result["summary"])
+
+    if profiler is not None:
+        profiler.close()
+        print("\nProfile:", file=sys.stderr)
+        print(profiler.report(), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Multi-process chunk summarization.
+
+A SummarizerPool starts N worker processes, each with torch intra-op
+threads pinned to its share of the cores. Installed with
+summarizer.set_worker_pool(), it takes over the model calls made by
+summarize_batch, so summarize_wikipedia and summarize_articles fan each
+batch of chunks out across the workers and get the summaries back in order.
+"""
+import logging
+import os
+from typing import List, Optional, Sequence, Tuple
+
+import summarizer
+from cancellation import CancellationToken, check
+
+# Per-process state of a pool worker
+_worker_model_name: Optional[str] = None
+
+
+def _init_worker(model_name: str, backend: str, threads: int, shared_model) -> None:
+    global _worker_model_name
+    import torch
+    torch.set_num_threads(threads)
+    summarizer.set_summary_cache(None)  # caching happens in the parent
+    summarizer.set_backend(backend)
+    if shared_model is not None:
+        # Weights live in shared memory owned by the parent; just register them
+        summarizer._models[f"{backend}:{model_name}"] = shared_model
+    summarizer.get_model(model_name)
+    _worker_model_name = model_name
+    logging.info(f"Pool worker {os.getpid()} ready ({threads} threads)")
+
+
+def _run_batch(task: Tuple[List[str], Optional[List[List[int]]], int, int, Optional[dict]]) -> List[str]:
+    texts, input_ids, max_length, min_length, settings = task
+    return summarizer._generate_batch(texts, max_length, min_length, _worker_model_name, input_ids,
+                                      settings=settings)
+
+
+class SummarizerPool:
+    """
+    Pool of model worker processes.
+
+    With share_weights=True the parent loads the model once and moves its
+    weights to shared memory, so workers map the same pages instead of each
+    holding a full copy; otherwise every worker loads its own copy.
+    Quantized backends cannot be shared and always load per worker.
+    """
+
+    def __init__(self, workers: Optional[int] = None, threads_per_worker: Optional[int] = None,
+                 model_name: str = summarizer.DEFAULT_MODEL, share_weights: bool = True):
+        import torch.multiprocessing as mp
+
+        cpus = os.cpu_count() or 1
+        self.workers = workers or cpus
+        self.threads_per_worker = threads_per_worker or max(1, cpus // self.workers)
+        self.model_name = model_name
+        self.backend = summarizer.current_backend()
+
+        shared_model = None
+        if share_weights and self.backend == "torch":
+            _, shared_model = summarizer.get_model(model_name)
+            shared_model.share_memory()
+
+        self._pool = mp.get_context("spawn").Pool(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(model_name, self.backend, self.threads_per_worker, shared_model),
+        )
+
+    def generate_batch(self, texts: List[str], max_length: int, min_length: int,
+                       model_name: str, input_ids: Optional[List[List[int]]] = None,
+                       cancel_token: Optional[CancellationToken] = None,
+                       settings: Optional[dict] = None) -> List[str]:
+        """Split one batch evenly across the workers and return summaries in order."""
+        if model_name != self.model_name:
+            raise ValueError(f"Pool was started for {self.model_name}, not {model_name}")
+        check(cancel_token)
+        size = -(-len(texts) // self.workers)  # ceil
+        tasks = [
+            (texts[i:i + size], input_ids[i:i + size] if input_ids is not None else None,
+             max_length, min_length, settings)
+            for i in range(0, len(texts), size)
+        ]
+        # Batches already running in workers finish; the cancel applies after them
+        results = self._pool.map(_run_batch, tasks, chunksize=1)
+        check(cancel_token)
+        return [summary for batch in results for summary in batch]
+
+    def pids(self) -> Sequence[int]:
+        return [process.pid for process in self._pool._pool]
+
+    def close(self) -> None:
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> "SummarizerPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()